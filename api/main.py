@@ -179,7 +179,7 @@ async def recommend_labs(profile: StudentProfileRequest):
         # 후보군 리스트 생성
         candidates = []
         for lab_id, lab_info in result.items():
-            lab = next((l for l in generator.labs if l.id == lab_id), None)
+            lab = generator.get_lab(lab_id)
             if lab:
                 candidates.append(lab)
         
@@ -7,6 +7,7 @@
     3. 속도 제어 (서버 부담 최소화)
     4. 재시도 로직 (일시적 오류 대응)
     5. Headless 모드 (브라우저 창 안 띄움)
+    6. robots.txt 준수 (TTL 캐시 + 공유 requests.Session)
 
 사용법:
     manager = CrawlManager(delay=1.0)  # 1초 딜레이
@@ -15,15 +16,36 @@
 """
 
 import time
+import atexit
+import threading
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from typing import Optional, Dict
+from urllib.robotparser import RobotFileParser
+from typing import Optional, Dict, Tuple, List
 from dataclasses import dataclass
 import json
 import os
 from datetime import datetime, timedelta
+import requests
 from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
 
 
+@lru_cache(maxsize=8192)
+def _parse_host(url: str) -> Tuple[str, str]:
+    """
+    URL → (netloc, base_url) 변환 (LRU 캐시)
+    
+    robots.txt 확인과 속도 제한이 매 요청마다 같은 URL을 파싱하므로
+    urlparse 결과를 캐시해서 반복 비용을 없앱니다.
+    
+    예시:
+        _parse_host("https://lab.inha.ac.kr/research")
+        # → ("lab.inha.ac.kr", "https://lab.inha.ac.kr")
+    """
+    parsed = urlparse(url)
+    return parsed.netloc, f"{parsed.scheme}://{parsed.netloc}"
+
+
 @dataclass
 class CrawlResult:
     """
@@ -117,6 +139,12 @@ class CrawlManager:
         "INHA-LabSearch-Bot/2.0 (Educational Research)"
     )
     
+    # robots.txt 캐시 유효 시간 (초) - 장시간 크롤링 중에도 변경 사항 반영
+    ROBOTS_CACHE_TTL = 3600
+    
+    # 디스크 저장 주기 (초) - 캐시 크기와 무관하게 시간 기준으로 저장
+    PERSIST_INTERVAL = 30
+    
     def __init__(
         self,
         delay: float = 1.0,              # 요청 간 대기 시간 (초)
@@ -125,7 +153,10 @@ class CrawlManager:
         user_agent: Optional[str] = None,  # 커스텀 User-Agent
         cache_dir: str = './crawl_cache',  # 캐시 저장 디렉토리
         headless: bool = True,           # Headless 모드 (브라우저 창 안 띄움)
-        wait_for_network_idle: bool = True  # 네트워크 완료까지 대기
+        wait_for_network_idle: bool = True,  # 네트워크 완료까지 대기
+        respect_robots: bool = True,     # robots.txt 준수 여부
+        host_delays: Optional[Dict[str, float]] = None,  # 호스트별 대기 시간
+        use_bloom_filter: bool = False   # 캐시 미스 빠른 판정 (대용량 캐시용)
     ):
         """
         Playwright 기반 크롤링 매니저 초기화
@@ -157,6 +188,18 @@ class CrawlManager:
             wait_for_network_idle (bool): 네트워크 완료 대기
                 - True = AJAX 등 모든 요청 완료까지 기다림 (권장)
                 - False = 페이지만 로드되면 바로 진행 (빠르지만 불완전할 수 있음)
+            
+            respect_robots (bool): robots.txt 준수 여부
+                - True = 금지된 경로는 요청하지 않음 (권장)
+                - False = robots.txt 무시 (테스트용)
+            
+            host_delays (dict): 호스트별 대기 시간 (초)
+                - 예: {'slow.example.com': 5.0}
+                - 지정하지 않은 호스트는 delay 사용
+            
+            use_bloom_filter (bool): 캐시된 URL 블룸 필터 사용 여부
+                - True = 캐시에 없는 URL을 큰 dict 조회 없이 바로 판정
+                - 캐시가 수십만 개 이상일 때 유리 (pybloom-live 필요)
         
         초기화 과정:
             1. 설정 저장
@@ -173,13 +216,30 @@ class CrawlManager:
         self.cache_dir = cache_dir
         self.headless = headless
         self.wait_for_network_idle = wait_for_network_idle
+        self.respect_robots = respect_robots
+        self.host_delays = host_delays or {}
+        
+        # ===== HTTP 세션 (robots.txt 등 부가 요청용, keep-alive 재사용) =====
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': self.user_agent})
+        
+        # ===== robots.txt 캐시 =====
+        # base_url -> (파서, 가져온 시각)
+        self.robots_parsers: Dict[str, Tuple[RobotFileParser, float]] = {}
         
         # ===== 상태 추적 =====
-        self.last_request_time = 0.0  # 마지막 요청 시간 (속도 제한용)
+        # 호스트 -> (남은 토큰, 마지막 보충 시각) (속도 제한용)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
         self.stats = CrawlStats()      # 통계 객체
         
         # ===== 캐시 관리 =====
         self.http_cache: Dict[str, dict] = {}  # URL -> {html, timestamp} 매핑
+        self._cache_lock = threading.Lock()    # 캐시 조회/저장 보호 (한 번에 배치 단위)
+        self._persist_lock = threading.Lock()  # 캐시 파일 쓰기 직렬화
+        self._dirty_count = 0                  # 마지막 디스크 저장 이후 새 항목 수
+        self._last_flush = time.time()         # 마지막 디스크 저장 시각
+        self.use_bloom_filter = use_bloom_filter
+        self._url_bloom = None                 # 캐시된 URL 블룸 필터 (_load_cache에서 생성)
         
         # 캐시 디렉토리 생성 (없으면)
         if not os.path.exists(cache_dir):
@@ -187,6 +247,9 @@ class CrawlManager:
         
         # 기존 캐시 로드 (이전에 크롤링한 데이터 재사용)
         self._load_cache()
+        
+        # 종료 시 저장되지 않은 캐시 디스크에 저장
+        atexit.register(self.flush_cache)
     
     def fetch_url(
         self, 
@@ -213,7 +276,7 @@ class CrawlManager:
         동작 순서:
             1. 통계 업데이트 (total_requests += 1)
             2. 캐시 확인 (있고 force_refresh=False면 바로 반환)
-            3. 속도 제한 적용 (너무 빠르면 대기)
+            3. 속도 제한 적용 (같은 호스트에 너무 빠르면 대기)
             4. Playwright로 HTML 가져오기 (재시도 포함)
             5. 성공 시 캐시 저장
             6. 결과 반환
@@ -237,55 +300,201 @@ class CrawlManager:
                 self.stats.cached += 1
                 return cached_result
         
-        # ===== 3단계: 속도 제한 적용 =====
-        # (마지막 요청 후 delay초 만큼 대기)
-        self._apply_rate_limit()
+        # ===== 3~4단계: 새로 가져오기 =====
+        result = self._fetch_fresh(url)
+        
+        # ===== 5단계: 성공 시 캐시 저장 =====
+        if result.success:
+            self._save_to_cache(url, result)
+        
+        return result
+    
+    def fetch_urls(
+        self,
+        urls: List[str],
+        force_refresh: bool = False
+    ) -> Dict[str, CrawlResult]:
+        """
+        여러 URL을 한 번에 가져오기 (캐시 배치 확인 + 배치 저장)
         
-        # ===== 4단계: Playwright로 크롤링 (재시도 포함) =====
+        매개변수:
+            urls (List[str]): 크롤링할 URL 목록
+            force_refresh (bool): 캐시 무시 여부
+        
+        반환값:
+            Dict[str, CrawlResult]: URL → 크롤링 결과
+        
+        fetch_url()과의 차이:
+            - 캐시 확인을 잠금 한 번으로 모두 처리
+            - 새로 가져온 결과를 잠금 한 번으로 모두 저장
+            - 디스크 저장도 배치당 최대 한 번
+        
+        예시:
+            results = manager.fetch_urls([
+                "https://example.com/research",
+                "https://example.com/people"
+            ])
+            for url, result in results.items():
+                print(url, result.success)
+        """
+        self.stats.total_requests += len(urls)
+        
+        # ===== 캐시 배치 확인 =====
+        results: Dict[str, CrawlResult] = {}
+        if not force_refresh:
+            results = self._check_cache_batch(urls)
+            self.stats.cached += len(results)
+        
+        # ===== 캐시에 없는 URL만 새로 가져오기 =====
+        fetched: List[Tuple[str, CrawlResult]] = []
+        for url in urls:
+            if url in results:
+                continue
+            result = self._fetch_fresh(url)
+            results[url] = result
+            if result.success:
+                fetched.append((url, result))
+        
+        # ===== 캐시 배치 저장 =====
+        self._save_to_cache_batch(fetched)
+        
+        return results
+    
+    def _fetch_fresh(self, url: str) -> CrawlResult:
+        """
+        캐시 없이 URL 가져오기 (robots.txt → 속도 제한 → Playwright)
+        
+        통계(성공/실패/JS 렌더링)는 여기서 갱신하고,
+        캐시 저장은 호출하는 쪽에서 처리합니다.
+        """
+        # ===== robots.txt 확인 =====
+        if self.respect_robots and not self._can_fetch(url):
+            self.stats.failed += 1
+            return CrawlResult(
+                success=False,
+                status_code=403,
+                error="robots.txt에 의해 차단됨"
+            )
+        
+        # ===== 속도 제한 적용 =====
+        # (같은 호스트에 마지막 요청 후 delay초 만큼 대기)
+        self._apply_rate_limit(url)
+        
+        # ===== Playwright로 크롤링 (재시도 포함) =====
         result = self._fetch_with_playwright(url)
         
-        # ===== 5단계: 결과 처리 =====
+        # ===== 결과 통계 =====
         if result.success:
-            # 성공: 캐시 저장 + 성공 통계 증가
-            self._save_to_cache(url, result)
             self.stats.successful += 1
             self.stats.js_rendered += 1  # JavaScript 렌더링 횟수
         else:
-            # 실패: 실패 통계 증가
             self.stats.failed += 1
         
         return result
     
-    def _apply_rate_limit(self):
+    def _can_fetch(self, url: str) -> bool:
+        """
+        robots.txt 확인 - 이 URL을 크롤링해도 되는가?
+        
+        매개변수:
+            url (str): 확인할 URL
+        
+        반환값:
+            bool: 크롤링 허용 여부
+        
+        캐시 정책:
+            - 도메인(base_url)별로 파서를 캐시
+            - ROBOTS_CACHE_TTL(1시간)이 지나면 다시 가져옴
+              (장시간 크롤링 중 robots.txt 변경 반영)
+        
+        가져오기 실패 시 정책:
+            - 4xx (robots.txt 없음 등): 모두 허용
+            - 5xx / 네트워크 오류: 모두 차단 (서버 상태가 불안정)
+        
+        왜 requests.Session인가?:
+            - urllib 기반 parser.read()는 keep-alive, 타임아웃, User-Agent 없음
+            - 세션을 재사용하면 같은 호스트의 TCP 연결을 재활용
+        """
+        _, base_url = _parse_host(url)
+        now = time.time()
+        
+        # ===== 캐시 확인 (TTL 이내면 재사용) =====
+        cached = self.robots_parsers.get(base_url)
+        if cached is not None and now - cached[1] < self.ROBOTS_CACHE_TTL:
+            return cached[0].can_fetch(self.user_agent, url)
+        
+        # ===== robots.txt 새로 가져오기 =====
+        parser = RobotFileParser()
+        robots_url = urljoin(base_url, '/robots.txt')
+        parser.set_url(robots_url)
+        
+        try:
+            response = self.session.get(
+                robots_url,
+                timeout=self.timeout / 1000,  # 밀리초 → 초
+                headers={'User-Agent': self.user_agent}
+            )
+            if response.status_code >= 500:
+                parser.disallow_all = True   # 서버 오류: 모두 차단
+            elif response.status_code >= 400:
+                parser.allow_all = True      # robots.txt 없음: 모두 허용
+            else:
+                parser.parse(response.text.splitlines())
+        except requests.exceptions.RequestException:
+            # 연결 실패 등: 서버 상태를 알 수 없으므로 차단
+            parser.disallow_all = True
+        
+        self.robots_parsers[base_url] = (parser, now)
+        return parser.can_fetch(self.user_agent, url)
+    
+    def _apply_rate_limit(self, url: str):
         """
-        속도 제한 적용 - 서버에 부담 주지 않기
+        속도 제한 적용 - 서버에 부담 주지 않기 (호스트별 토큰 버킷)
+        
+        매개변수:
+            url (str): 요청할 URL (호스트 단위로 속도 제한)
         
         동작 원리:
-            - 마지막 요청 시간을 기록
-            - 현재 시간과 비교
-            - delay초가 안 지났으면 대기
+            - 호스트(netloc)마다 토큰 버킷을 하나씩 유지 (최대 토큰 1개)
+            - 초당 1/delay개 토큰이 다시 채워짐
+            - 토큰이 있으면 즉시 실행, 없으면 채워질 때까지 대기
+            - 서로 다른 호스트는 서로를 기다리지 않음
         
         예시:
             delay = 1.0초 설정 시
-            - 0초: 첫 요청 (즉시 실행)
-            - 0.5초: 두 번째 요청 시도 → 0.5초 대기 후 실행
-            - 2초: 세 번째 요청 (1초 지났으므로 즉시 실행)
+            - 0초: a.com 요청 (즉시 실행)
+            - 0초: b.com 요청 (다른 호스트 → 즉시 실행)
+            - 0.5초: a.com 요청 → 0.5초 대기 후 실행
+        
+        느린 서버:
+            host_delays={'slow.example.com': 5.0} 처럼 호스트별 간격 지정 가능
         
         왜 필요한가?:
             - 서버 과부하 방지
             - IP 차단 방지
             - 예의 바른 크롤링
         """
-        current_time = time.time()  # 현재 시간 (초 단위)
-        time_since_last = current_time - self.last_request_time  # 마지막 요청 후 경과 시간
-        
-        # delay초가 안 지났으면 대기
-        if time_since_last < self.delay:
-            sleep_time = self.delay - time_since_last  # 남은 대기 시간
-            time.sleep(sleep_time)  # 실제 대기
+        host, _ = _parse_host(url)
+        delay = self.host_delays.get(host, self.delay)
+        if delay <= 0:
+            return
+        rate = 1.0 / delay  # 초당 채워지는 토큰 수
+        
+        now = time.time()
+        tokens, last_refill = self._buckets.get(host, (1.0, now))
+        
+        # 경과 시간만큼 토큰 보충 (최대 1개)
+        tokens = min(1.0, tokens + (now - last_refill) * rate)
+        
+        if tokens < 1.0:
+            # 토큰이 1개가 될 때까지 대기 후 사용
+            time.sleep((1.0 - tokens) / rate)
+            tokens = 0.0
+            now = time.time()
+        else:
+            tokens -= 1.0
         
-        # 현재 시간을 마지막 요청 시간으로 업데이트
-        self.last_request_time = time.time()
+        self._buckets[host] = (tokens, now)
     
     def _fetch_with_playwright(self, url: str) -> CrawlResult:
         """
@@ -414,11 +623,41 @@ class CrawlManager:
             # 재방문: 캐시 있음
             result = manager.fetch_url("https://example.com")  # 0.001초 소요!
         """
-        # URL이 캐시에 없으면 None 반환
-        if url not in self.http_cache:
+        # 블룸 필터에 없으면 확실히 캐시 미스 (큰 dict 조회 생략)
+        if self._url_bloom is not None and url not in self._url_bloom:
             return None
         
-        cache_data = self.http_cache[url]
+        with self._cache_lock:
+            cache_data = self.http_cache.get(url)
+        
+        return self._entry_to_result(cache_data)
+    
+    def _check_cache_batch(self, urls: List[str]) -> Dict[str, CrawlResult]:
+        """
+        여러 URL의 캐시를 한 번에 확인 (잠금 1회)
+        
+        반환값:
+            Dict[str, CrawlResult]: 유효한 캐시가 있는 URL만 포함
+        """
+        if self._url_bloom is not None:
+            urls = [url for url in urls if url in self._url_bloom]
+        
+        with self._cache_lock:
+            entries = [(url, self.http_cache.get(url)) for url in urls]
+        
+        results = {}
+        for url, cache_data in entries:
+            result = self._entry_to_result(cache_data)
+            if result is not None:
+                results[url] = result
+        return results
+    
+    @staticmethod
+    def _entry_to_result(cache_data: Optional[dict]) -> Optional[CrawlResult]:
+        """캐시 항목 → CrawlResult (없거나 만료되었으면 None)"""
+        # URL이 캐시에 없으면 None 반환
+        if cache_data is None:
+            return None
         
         # ===== 캐시 유효 기간 확인 =====
         # timestamp: 캐시 저장 시간 (ISO 형식 문자열)
@@ -450,7 +689,8 @@ class CrawlManager:
             - timestamp: 저장 시간 (유효 기간 계산용)
         
         디스크 저장:
-            - 10개마다 자동 저장 (메모리 손실 방지)
+            - 30초마다 자동 저장 (메모리 손실 방지)
+            - 프로그램 종료 시 남은 항목 저장 (atexit)
             - JSON 파일로 저장 (./crawl_cache/http_cache.json)
         
         예시:
@@ -465,15 +705,35 @@ class CrawlManager:
               }
             }
         """
+        self._save_to_cache_batch([(url, result)])
+    
+    def _save_to_cache_batch(self, items: List[Tuple[str, CrawlResult]]):
+        """
+        여러 결과를 한 번에 캐시에 저장 (잠금 1회, 디스크 저장 최대 1회)
+        
+        매개변수:
+            items: (URL, CrawlResult) 목록
+        """
+        if not items:
+            return
+        
+        timestamp = datetime.now().isoformat()  # 현재 시간 (ISO 형식)
+        
         # ===== 메모리 캐시에 저장 =====
-        self.http_cache[url] = {
-            'html': result.html,            # HTML 콘텐츠
-            'timestamp': datetime.now().isoformat()  # 현재 시간 (ISO 형식)
-        }
+        with self._cache_lock:
+            for url, result in items:
+                self.http_cache[url] = {
+                    'html': result.html,    # HTML 콘텐츠
+                    'timestamp': timestamp
+                }
+                if self._url_bloom is not None:
+                    self._url_bloom.add(url)
+            self._dirty_count += len(items)
+            should_persist = time.time() - self._last_flush > self.PERSIST_INTERVAL
         
         # ===== 주기적으로 디스크에 저장 =====
-        # 10개마다 저장 (너무 자주 저장하면 느려짐)
-        if len(self.http_cache) % 10 == 0:
+        # 30초마다 저장 (전체 파일을 다시 쓰므로 캐시 크기가 아닌 시간 기준)
+        if should_persist:
             self._persist_cache()
     
     def _load_cache(self):
@@ -508,6 +768,29 @@ class CrawlManager:
         else:
             # 파일 없으면 빈 캐시
             self.http_cache = {}
+        
+        # 블룸 필터 재구성 (로드된 캐시 URL 전체)
+        if self.use_bloom_filter:
+            self._url_bloom = self._create_bloom_filter()
+            for url in self.http_cache:
+                self._url_bloom.add(url)
+    
+    @staticmethod
+    def _create_bloom_filter():
+        """
+        캐시된 URL용 블룸 필터 생성
+        
+        - 오탐률 0.1% (있다고 잘못 판정 → dict 조회로 확인하므로 안전)
+        - 미탐 없음 (없다고 하면 확실히 없음)
+        - 크기는 URL 수에 따라 자동 확장
+        """
+        try:
+            from pybloom_live import ScalableBloomFilter
+        except ImportError:
+            raise ImportError(
+                "pybloom-live가 설치되지 않았습니다: pip install pybloom-live"
+            )
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
     
     def _persist_cache(self):
         """
@@ -519,28 +802,41 @@ class CrawlManager:
             3. 실패해도 프로그램 계속 (치명적 아님)
         
         저장 시점:
-            - 10개마다 자동 (_save_to_cache에서 호출)
+            - 30초마다 자동 (_save_to_cache_batch에서 호출)
+            - 프로그램 종료 시 (flush_cache, atexit)
             - 수동으로도 호출 가능
         
         파일 형식:
-            - JSON (사람이 읽기 쉬움)
+            - JSON (들여쓰기 없음 - 기계가 읽는 파일, 크기/쓰기 시간 절약)
             - UTF-8 인코딩 (한글 지원)
-            - 들여쓰기 2칸 (가독성)
         """
         cache_file = os.path.join(self.cache_dir, 'http_cache.json')
         
+        # 잠금은 스냅샷을 뜨는 동안만 (파일 쓰기 중에도 조회/저장 가능)
+        with self._cache_lock:
+            snapshot = dict(self.http_cache)
+            self._dirty_count = 0
+            self._last_flush = time.time()
+        
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
+            with self._persist_lock, open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(
-                    self.http_cache, 
+                    snapshot, 
                     f, 
-                    ensure_ascii=False,  # 한글 그대로 저장
-                    indent=2             # 들여쓰기 (예쁘게)
+                    ensure_ascii=False   # 한글 그대로 저장
                 )
         except Exception as e:
             # 저장 실패해도 계속 진행 (메모리에는 있음)
             print(f"⚠️  캐시 저장 실패: {e}")
     
+    def flush_cache(self):
+        """
+        저장되지 않은 캐시 항목이 있으면 디스크에 저장
+        
+        크롤링을 마친 뒤 또는 프로그램 종료 시(atexit) 호출됩니다.
+        """
+        if self._dirty_count > 0:
+            self._persist_cache()
     
     def get_stats(self) -> CrawlStats:
         """
@@ -27,10 +27,13 @@
 """
 
 import numpy as np
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Tuple
 from dataclasses import dataclass
 import hashlib
 import json
+from collections import OrderedDict
+
+from processing.chunking import Chunk
 
 
 @dataclass
@@ -101,6 +104,13 @@ class EmbeddingConfig:
     DEFAULT_MODEL = 'multilingual-e5-large'
     DEFAULT_BATCH_SIZE = 32
     NORMALIZE = True  # L2 정규화 (코사인 유사도용)
+    
+    # 추론 정밀도 / 백엔드
+    # 'auto': CUDA면 fp16, CPU면 fp32
+    SUPPORTED_PRECISIONS = ('auto', 'fp32', 'fp16', 'bf16')
+    SUPPORTED_BACKENDS = ('torch', 'onnx', 'openvino')
+    DEFAULT_PRECISION = 'auto'
+    DEFAULT_BACKEND = 'torch'
 
 
 class EmbeddingModel:
@@ -111,7 +121,10 @@ class EmbeddingModel:
         model_name: str = 'multilingual-e5-large',
         device: str = 'cpu',
         normalize: bool = True,
-        version: int = 1
+        version: int = 1,
+        precision: str = EmbeddingConfig.DEFAULT_PRECISION,
+        backend: str = EmbeddingConfig.DEFAULT_BACKEND,
+        compile_model: bool = False
     ):
         """
         Args:
@@ -119,14 +132,26 @@ class EmbeddingModel:
             device: 'cpu' or 'cuda'
             normalize: L2 정규화 여부
             version: 임베딩 버전 (모델 변경 시 증가)
+            precision: 추론 정밀도 ('auto', 'fp32', 'fp16', 'bf16')
+                'auto'는 CUDA에서 fp16, CPU에서 fp32 사용
+            backend: 추론 백엔드 ('torch', 'onnx', 'openvino')
+                onnx/openvino는 sentence-transformers>=3.2 필요
+            compile_model: torch.compile 적용 여부 (torch 백엔드 전용)
         """
         self.model_name = model_name
         self.device = device
         self.normalize = normalize
         self.version = version
+        self.precision = precision
+        self.backend = backend
+        self.compile_model = compile_model
         
         if model_name not in EmbeddingConfig.SUPPORTED_MODELS:
             raise ValueError(f"지원하지 않는 모델: {model_name}")
+        if precision not in EmbeddingConfig.SUPPORTED_PRECISIONS:
+            raise ValueError(f"지원하지 않는 정밀도: {precision}")
+        if backend not in EmbeddingConfig.SUPPORTED_BACKENDS:
+            raise ValueError(f"지원하지 않는 백엔드: {backend}")
         
         self.config = EmbeddingConfig.SUPPORTED_MODELS[model_name]
         self.model = None
@@ -138,10 +163,19 @@ class EmbeddingModel:
             from sentence_transformers import SentenceTransformer
             
             print(f"임베딩 모델 로딩: {self.config['full_name']}")
+            kwargs = {}
+            if self.backend != 'torch':
+                # ONNX Runtime / OpenVINO (그래프 최적화된 추론)
+                kwargs['backend'] = self.backend
             self.model = SentenceTransformer(
                 self.config['full_name'],
-                device=self.device
+                device=self.device,
+                **kwargs
             )
+            
+            if self.backend == 'torch':
+                self._optimize_torch_model()
+            
             print(f"✅ 모델 로드 완료 (차원: {self.config['dimension']})")
             
         except ImportError:
@@ -150,19 +184,54 @@ class EmbeddingModel:
                 "설치: pip install sentence-transformers --break-system-packages"
             )
     
+    def _optimize_torch_model(self):
+        """
+        PyTorch 모델 추론 최적화
+        
+        - 정밀도 변환: fp16 (GPU 텐서 코어) / bf16 (최신 CPU)
+        - eval 모드 고정
+        - torch.compile (선택, 실패 시 eager 모드 유지)
+        """
+        import torch
+        
+        precision = self.precision
+        if precision == 'auto':
+            precision = 'fp16' if self.device.startswith('cuda') else 'fp32'
+        
+        if precision == 'fp16':
+            self.model = self.model.half()
+        elif precision == 'bf16':
+            self.model = self.model.to(torch.bfloat16)
+        
+        self.model.eval()
+        
+        if self.compile_model and hasattr(torch, 'compile'):
+            try:
+                # encode()를 유지하기 위해 내부 트랜스포머 모듈만 컴파일
+                first_module = self.model[0]
+                first_module.auto_model = torch.compile(
+                    first_module.auto_model,
+                    dynamic=True
+                )
+            except Exception as e:
+                print(f"⚠️  torch.compile 실패, eager 모드 사용: {e}")
+    
     def embed_single(self, text: str) -> EmbeddingResult:
         """단일 텍스트 임베딩"""
         embeddings = self.embed_batch([text])
         return embeddings[0]
     
-    def embed_batch(
-        self, 
+    def embed_batch_matrix(
+        self,
         texts: List[str],
         batch_size: int = EmbeddingConfig.DEFAULT_BATCH_SIZE,
         show_progress: bool = False
-    ) -> List[EmbeddingResult]:
+    ) -> np.ndarray:
         """
-        배치 임베딩
+        배치 임베딩 (행렬 반환)
+        
+        EmbeddingResult 객체를 만들지 않고 (N, dim) float32 행렬을 그대로 반환합니다.
+        유사도 계산/DB 저장처럼 원본 행렬만 필요한 곳에서 사용합니다.
         
         Args:
             texts: 텍스트 리스트
@@ -170,7 +239,7 @@ class EmbeddingModel:
             show_progress: 진행률 표시
         """
         if not texts:
-            return []
+            return np.empty((0, self.config['dimension']), dtype=np.float32)
         
         # 빈 텍스트 필터링
         valid_texts = [text if text else " " for text in texts]
@@ -183,19 +252,36 @@ class EmbeddingModel:
             convert_to_numpy=True,
             normalize_embeddings=self.normalize
         )
+        # fp16/bf16 추론 결과도 float32로 통일 (저장/검색 호환)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    def embed_batch(
+        self, 
+        texts: List[str],
+        batch_size: int = EmbeddingConfig.DEFAULT_BATCH_SIZE,
+        show_progress: bool = False
+    ) -> List[EmbeddingResult]:
+        """
+        배치 임베딩
         
-        # EmbeddingResult 객체로 변환
-        results = []
-        for emb in embeddings:
-            results.append(EmbeddingResult(
+        Args:
+            texts: 텍스트 리스트
+            batch_size: 배치 크기
+            show_progress: 진행률 표시
+        """
+        embeddings = self.embed_batch_matrix(texts, batch_size, show_progress)
+        
+        # EmbeddingResult 객체로 변환 (각 행은 행렬의 view)
+        return [
+            EmbeddingResult(
                 embedding=emb,
                 model_name=self.model_name,
                 model_version=self.version,
                 dimension=self.config['dimension'],
                 normalized=self.normalize
-            ))
-        
-        return results
+            )
+            for emb in embeddings
+        ]
     
     def get_model_info(self) -> Dict:
         """모델 정보 반환"""
@@ -207,35 +293,73 @@ class EmbeddingModel:
             'max_seq_length': self.config['max_seq_length'],
             'normalized': self.normalize,
             'device': self.device,
+            'precision': self.precision,
+            'backend': self.backend,
             'description': self.config['description']
         }
 
 
 class EmbeddingCache:
-    """임베딩 캐시 (중복 계산 방지)"""
+    """임베딩 캐시 (중복 계산 방지, LRU)"""
     
     def __init__(self, max_size: int = 10000):
-        self.cache = {}
+        self.cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         self.max_size = max_size
     
-    def _get_key(self, text: str, model_name: str, version: int) -> str:
-        """캐시 키 생성"""
+    def _get_key(
+        self,
+        text: str,
+        model_name: str,
+        version: int,
+        key: Optional[str] = None
+    ) -> str:
+        """
+        캐시 키 생성
+        
+        key(예: 청크 ID)가 주어지면 텍스트 해시 없이 그대로 사용합니다.
+        'id:' 접두사로 텍스트 해시 키(hex)와 충돌하지 않습니다.
+        """
+        if key is not None:
+            return f"{model_name}_{version}_id:{key}"
         content = f"{model_name}_{version}_{text}"
         return hashlib.md5(content.encode('utf-8')).hexdigest()
     
-    def get(self, text: str, model_name: str, version: int) -> Optional[np.ndarray]:
+    def get(
+        self,
+        text: str,
+        model_name: str,
+        version: int,
+        key: Optional[str] = None
+    ) -> Optional[np.ndarray]:
         """캐시에서 임베딩 가져오기"""
-        key = self._get_key(text, model_name, version)
-        return self.cache.get(key)
+        return self.get_by_key(self._get_key(text, model_name, version, key))
     
-    def put(self, text: str, model_name: str, version: int, embedding: np.ndarray):
+    def put(
+        self,
+        text: str,
+        model_name: str,
+        version: int,
+        embedding: np.ndarray,
+        key: Optional[str] = None
+    ):
         """캐시에 임베딩 저장"""
-        if len(self.cache) >= self.max_size:
-            # LRU 방식으로 제거 (간단한 구현)
-            first_key = next(iter(self.cache))
-            del self.cache[first_key]
+        self.put_by_key(self._get_key(text, model_name, version, key), embedding)
+    
+    def get_by_key(self, key: str) -> Optional[np.ndarray]:
+        """미리 계산한 키로 임베딩 가져오기 (해시 재계산 없음)"""
+        embedding = self.cache.get(key)
+        if embedding is not None:
+            self.cache.move_to_end(key)  # 최근 사용으로 갱신
+        return embedding
+    
+    def put_by_key(self, key: str, embedding: np.ndarray):
+        """미리 계산한 키로 임베딩 저장"""
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # 가장 오래 사용하지 않은 항목 제거
+            self.cache.popitem(last=False)
         
-        key = self._get_key(text, model_name, version)
         self.cache[key] = embedding
     
     def clear(self):
@@ -255,13 +379,19 @@ class EmbeddingPipeline:
         model_name: str = 'multilingual-mpnet',
         device: str = 'cpu',
         use_cache: bool = True,
-        version: int = 1
+        version: int = 1,
+        precision: str = EmbeddingConfig.DEFAULT_PRECISION,
+        backend: str = EmbeddingConfig.DEFAULT_BACKEND,
+        compile_model: bool = False
     ):
         self.model = EmbeddingModel(
             model_name=model_name,
             device=device,
             normalize=True,
-            version=version
+            version=version,
+            precision=precision,
+            backend=backend,
+            compile_model=compile_model
         )
         
         self.cache = EmbeddingCache() if use_cache else None
@@ -310,52 +440,160 @@ class EmbeddingPipeline:
             return result
         
         # 배치 처리
-        results = []
-        uncached_texts = []
-        uncached_indices = []
+        keys = None
+        if use_cache and self.cache:
+            # 텍스트당 해시 1회
+            keys = [
+                self.cache._get_key(text, self.model.model_name, self.model.version)
+                for text in texts
+            ]
+        return self._embed_keyed(texts, keys, batch_size)
+    
+    def embed_chunks(
+        self,
+        chunks: List[Chunk],
+        texts: Optional[List[str]] = None,
+        batch_size: int = 32,
+        use_cache: bool = True
+    ) -> List[EmbeddingResult]:
+        """
+        청크 임베딩 (청크 ID를 캐시 키로 사용 → 텍스트 해시 생략)
         
-        for i, text in enumerate(texts):
-            if use_cache and self.cache:
-                cached = self.cache.get(
-                    text,
-                    self.model.model_name,
-                    self.model.version
+        Args:
+            chunks: 청크 리스트 (chunk.md5를 안정적인 ID로 사용)
+            texts: 실제 임베딩할 텍스트 (기본값: chunk.text)
+                chunk.text에서 결정적으로 만들어진 텍스트여야 함
+                (예: 정규화된 텍스트)
+            batch_size: 배치 크기
+            use_cache: 캐시 사용 여부
+        """
+        texts, keys = self._chunk_keys(chunks, texts, use_cache)
+        return self._embed_keyed(texts, keys, batch_size)
+    
+    def embed_chunks_matrix(
+        self,
+        chunks: List[Chunk],
+        texts: Optional[List[str]] = None,
+        batch_size: int = 32,
+        use_cache: bool = True
+    ) -> np.ndarray:
+        """
+        청크 임베딩 ((N, dim) float32 행렬 반환, 인자는 embed_chunks()와 동일)
+        """
+        texts, keys = self._chunk_keys(chunks, texts, use_cache)
+        return self._embed_keyed_matrix(texts, keys, batch_size)
+    
+    def _chunk_keys(
+        self,
+        chunks: List[Chunk],
+        texts: Optional[List[str]],
+        use_cache: bool
+    ) -> Tuple[List[str], Optional[List[str]]]:
+        """청크별 임베딩 텍스트와 캐시 키 (chunk.md5 기반)"""
+        if texts is None:
+            texts = [chunk.text for chunk in chunks]
+        
+        keys = None
+        if use_cache and self.cache:
+            keys = [
+                self.cache._get_key(
+                    text, self.model.model_name, self.model.version, key=chunk.md5
                 )
+                for chunk, text in zip(chunks, texts)
+            ]
+        return texts, keys
+    
+    def embed_matrix(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        use_cache: bool = True
+    ) -> np.ndarray:
+        """
+        배치 임베딩 (캐시 지원, (N, dim) float32 행렬 반환)
+        
+        EmbeddingResult 래퍼가 필요 없는 곳(유사도 계산, DB 저장)에서 사용합니다.
+        """
+        keys = None
+        if use_cache and self.cache:
+            keys = [
+                self.cache._get_key(text, self.model.model_name, self.model.version)
+                for text in texts
+            ]
+        return self._embed_keyed_matrix(texts, keys, batch_size)
+    
+    def _embed_keyed(
+        self,
+        texts: List[str],
+        keys: Optional[List[str]],
+        batch_size: int
+    ) -> List[EmbeddingResult]:
+        """
+        미리 계산한 캐시 키로 배치 임베딩 (EmbeddingResult 리스트)
+        
+        Args:
+            texts: 텍스트 리스트
+            keys: texts와 같은 길이의 캐시 키 (None이면 캐시 미사용)
+            batch_size: 배치 크기
+        """
+        out = self._embed_keyed_matrix(texts, keys, batch_size)
+        dim = self.model.config['dimension']
+        
+        # 결과 행렬의 각 행을 감싸서 반환 (복사 없음)
+        return [
+            EmbeddingResult(
+                embedding=out[i],
+                model_name=self.model.model_name,
+                model_version=self.model.version,
+                dimension=dim,
+                normalized=self.model.normalize
+            )
+            for i in range(len(texts))
+        ]
+    
+    def _embed_keyed_matrix(
+        self,
+        texts: List[str],
+        keys: Optional[List[str]],
+        batch_size: int
+    ) -> np.ndarray:
+        """
+        미리 계산한 캐시 키로 배치 임베딩 (행렬)
+        (캐시 조회와 결과 조립을 한 번의 순회로)
+        """
+        n = len(texts)
+        dim = self.model.config['dimension']
+        out = np.empty((n, dim), dtype=np.float32)  # 결과 행렬 (N, dim)
+        
+        cache = self.cache if keys is not None else None
+        missing: Dict[str, List[int]] = {}          # 미캐시 텍스트 → 위치들
+        
+        for i, text in enumerate(texts):
+            if cache is not None:
+                cached = cache.get_by_key(keys[i])
                 if cached is not None:
-                    results.append(EmbeddingResult(
-                        embedding=cached,
-                        model_name=self.model.model_name,
-                        model_version=self.model.version,
-                        dimension=self.model.config['dimension'],
-                        normalized=self.model.normalize
-                    ))
+                    out[i] = cached
                     continue
-            
-            uncached_texts.append(text)
-            uncached_indices.append(i)
-            results.append(None)  # placeholder
+            missing.setdefault(text, []).append(i)
         
-        # 캐시되지 않은 텍스트 임베딩
-        if uncached_texts:
-            new_embeddings = self.model.embed_batch(
-                uncached_texts,
+        # 캐시되지 않은 텍스트 임베딩 (중복 텍스트는 한 번만)
+        if missing:
+            unique_texts = list(missing)
+            new_embeddings = self.model.embed_batch_matrix(
+                unique_texts,
                 batch_size=batch_size
             )
             
-            # 결과 채우기
-            for idx, embedding_result in zip(uncached_indices, new_embeddings):
-                results[idx] = embedding_result
+            for text, embedding in zip(unique_texts, new_embeddings):
+                indices = missing[text]
+                out[indices] = embedding
                 
-                # 캐시에 저장
-                if use_cache and self.cache:
-                    self.cache.put(
-                        texts[idx],
-                        self.model.model_name,
-                        self.model.version,
-                        embedding_result.embedding
-                    )
+                # 캐시에 저장 (같은 텍스트라도 키가 다를 수 있음)
+                if cache is not None:
+                    for idx in indices:
+                        cache.put_by_key(keys[idx], out[idx])
         
-        return results
+        return out
     
     def get_info(self) -> Dict:
         """파이프라인 정보"""
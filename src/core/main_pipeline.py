@@ -5,7 +5,7 @@
 이 파일은 전체 시스템을 통합하여 실행합니다.
 
 전체 흐름:
-    1. 웹페이지 크롤링 (requests + BeautifulSoup)
+    1. 웹페이지 크롤링 (aiohttp 동시 요청 + lxml)
        ↓
     2. HTML에서 본문 추출 (chunking.py)
        ↓
@@ -30,19 +30,35 @@
     - USE_LOCAL = False → PostgreSQL 저장
 """
 
+import asyncio
+import logging
+import re
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+import numpy as np
 import pandas as pd
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator
 from datetime import datetime
+from urllib.parse import urljoin, urlparse, urlunparse, urlencode, parse_qsl
+from urllib.robotparser import RobotFileParser
 import traceback
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 
 # 로컬 모듈 임포트
 from processing.chunking import DocumentProcessor, Chunk
-from processing.text_normalization import TextNormalizer
+from processing.text_normalization import TextNormalizer, NormalizedText
 from core.embedding import EmbeddingPipeline
 
+# 크롤링 진행/경고 메시지 (동시 크롤링 중 stdout 경합 없이, 포맷은 출력할 때만)
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # 데이터베이스 선택 설정
 # USE_LOCAL = True  → 로컬 JSON 파일 저장 (PostgreSQL 불필요)
@@ -60,6 +76,84 @@ else:
     print("✅ PostgreSQL 데이터베이스 모드")
 
 
+def _canonicalize_url(url: str) -> str:
+    """
+    URL 정규화 (중복 방문 판별용)
+    
+    - fragment(#...) 제거
+    - 쿼리 파라미터 정렬
+    - 호스트 소문자화, 끝 슬래시 제거
+    
+    예) http://Lab.ac.kr/research/?b=2&a=1#top → http://lab.ac.kr/research?a=1&b=2
+    """
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme, parsed.netloc.lower(), path, '', query, ''))
+
+
+def _dedup_path(path: str, repeatable: frozenset = frozenset(('view', 'page'))) -> str:
+    """
+    경로 중복 제거 (간단한 휴리스틱)
+    
+    예) /view/vcl-lab/view/vcl-lab → /view/vcl-lab/view
+        ('view', 'page'는 중복 허용)
+    """
+    seen = set()
+    unique_parts = []
+    for part in path.split('/'):
+        if not part:
+            continue
+        if part in repeatable or part not in seen:
+            unique_parts.append(part)
+            seen.add(part)
+    return '/' + '/'.join(unique_parts)
+
+
+def _joined_text(element) -> str:
+    """요소 안의 텍스트 조각을 각각 strip해서 이어 붙임 (BeautifulSoup get_text(strip=True)와 동일)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _create_http_session(user_agent: str) -> requests.Session:
+    """
+    연결 풀을 재사용하는 HTTP 세션 생성
+    
+    - Keep-Alive로 TCP/TLS 핸드셰이크를 요청마다 반복하지 않음
+    - 5xx 응답은 짧은 백오프로 최대 2회 재시도
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            status_forcelist=[500, 502, 503, 504],
+            backoff_factor=0.3
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': user_agent})
+    return session
+
+
+@dataclass
+class _PageResult:
+    """
+    단일 페이지 크롤링 결과
+    
+    etag/last_modified는 바로 기록하지 않고 청크와 함께 넘겨서,
+    이 페이지의 문서가 실제로 저장된 뒤에만 기록합니다.
+    not_modified는 304 응답 (빈 페이지/실패와 구분, 이전에 저장한 문서가 그대로 유효)
+    """
+    chunks: List[Chunk] = field(default_factory=list)
+    canonical_url: str = ''
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
 class CrawlConfig:
     """
     크롤링 설정 클래스
@@ -70,8 +164,19 @@ class CrawlConfig:
         MAX_PAGES (int): 연구실당 최대 크롤링 페이지 수
             예) 5 → 메인 페이지 + 링크된 페이지 4개
         TIMEOUT (int): HTTP 요청 타임아웃 (초)
-        DELAY (int): 페이지 간 딜레이 (초)
-            → 서버 부담을 줄이기 위한 대기 시간
+        DELAY (int): 같은 호스트에 보내는 요청 사이의 최소 간격 (초)
+            → 서버 부담을 줄이기 위한 대기 시간 (다른 호스트끼리는 기다리지 않음)
+        RESPECT_ROBOTS (bool): robots.txt에서 금지한 페이지는 크롤링하지 않음
+        MAX_CONCURRENCY (int): 연구실당 동시 페이지 요청 수
+        MAX_PER_HOST (int): 같은 호스트에 대한 최대 동시 연결 수
+            → 동시 요청 중에도 한 서버에 몰리지 않도록 제한
+        EMBED_BATCH_SIZE (int): 임베딩 모델에 한 번에 넣는 청크 수
+        MAX_PARALLEL_LABS (int): 동시에 크롤링하는 연구실 수
+            → 한 연구실이 네트워크를 기다리는 동안 다른 연구실 처리
+        MAX_VISITED_URLS (int): 중복 방문 확인용으로 기억하는 URL 수
+            → 초과하면 가장 오래된 URL부터 잊음 (메모리 제한)
+        MAX_PAGE_BYTES (int): 페이지당 최대 다운로드 크기 (바이트)
+            → 초과분은 읽지 않고 버림 (메모리/파싱 시간 제한)
         USER_AGENT (str): 브라우저 식별 문자열
             → 일부 사이트는 User-Agent 확인
         MIN_TEXT_LENGTH (int): 최소 텍스트 길이 (문자)
@@ -85,7 +190,14 @@ class CrawlConfig:
     """
     MAX_PAGES = 5  # 연구실당 최대 5페이지
     TIMEOUT = 10   # 10초 타임아웃
-    DELAY = 1      # 페이지 간 1초 대기
+    DELAY = 1      # 같은 호스트에 1초에 1번
+    RESPECT_ROBOTS = True
+    MAX_CONCURRENCY = 8  # 연구실당 동시 요청 8개
+    MAX_PER_HOST = 2     # 호스트당 동시 연결 2개
+    EMBED_BATCH_SIZE = 32  # 임베딩 배치 크기
+    MAX_PARALLEL_LABS = 4  # 연구실 4개 동시 크롤링
+    MAX_VISITED_URLS = 50_000  # 방문 URL 최대 5만 개 기억
+    MAX_PAGE_BYTES = 2_000_000  # 페이지당 최대 2MB
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     
     # 품질 기준
@@ -110,10 +222,11 @@ class LabCrawler:
         8. DB 저장
     
     주요 메서드:
-        crawl_lab()       - 전체 프로세스 실행
-        _discover_pages() - 관련 페이지 찾기
-        _crawl_page()     - 단일 페이지 크롤링
-        _process_chunk()  - 청크 처리 (정규화 + 임베딩)
+        crawl_lab()         - 전체 프로세스 실행
+        _discover_pages()   - 관련 페이지 찾기
+        _fetch_all()        - 페이지 동시 크롤링 (aiohttp + asyncio.gather)
+        _crawl_page_async() - 단일 페이지 크롤링
+        _pipeline()         - 정규화 + 품질 점수 + 배치 임베딩 → 문서 데이터
     
     사용 예:
         crawler = LabCrawler(db, embedding_pipeline)
@@ -121,11 +234,18 @@ class LabCrawler:
         print(f"저장된 청크: {result['chunks_saved']}개")
     """
     
+    # 관련 페이지 링크 키워드 (href 또는 링크 텍스트에 포함되면 크롤링 대상)
+    # 하나의 정규식으로 묶어서 링크당 한 번만 스캔
+    # IGNORECASE 대신 입력을 소문자로 바꿔 검색 (대소문자 구분 매칭이 훨씬 빠름)
+    _KEYWORD_RE = re.compile(
+        r'research|publication|people|member|about|project|lab|연구|논문|구성원|소개'
+    )
+    
     def __init__(
         self,
         db: VectorDatabase,
         embedding_pipeline: EmbeddingPipeline,
-        config: CrawlConfig = CrawlConfig()
+        config: Optional[CrawlConfig] = None
     ):
         """
         초기화
@@ -133,17 +253,69 @@ class LabCrawler:
         Args:
             db: 데이터베이스 객체 (로컬 또는 PostgreSQL)
             embedding_pipeline: 임베딩 파이프라인
-            config: 크롤링 설정
+            config: 크롤링 설정 (None이면 기본 설정)
         """
         self.db = db
         self.embedding_pipeline = embedding_pipeline
-        self.config = config
+        self.config = config or CrawlConfig()
         
         # 하위 모듈 초기화
         self.doc_processor = DocumentProcessor()      # HTML → 청크
         self.text_normalizer = TextNormalizer()       # 텍스트 정규화
         
-        self.visited_urls = set()  # 중복 방문 방지
+        # 중복 방문 방지 (정규화된 URL, 오래된 것부터 버리는 크기 제한 집합)
+        # 여러 연구실 스레드가 같은 페이지를 동시에 가져가지 않도록 확인+기록은 잠금 안에서
+        self.visited_urls: "OrderedDict[str, None]" = OrderedDict()
+        self._visited_lock = threading.Lock()
+        
+        # 동기 요청(페이지 발견)용 세션 - 연결 재사용
+        self.session = _create_http_session(self.config.USER_AGENT)
+        
+        # DB 저장 전용 스레드 (저장하는 동안 다음 연구실 크롤링 진행)
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._pending_writes: List[Tuple[Dict, Future]] = []
+        
+        # 여러 연구실을 동시에 크롤링할 때 임베딩 모델/캐시는 한 번에 하나씩 사용
+        self._embed_lock = threading.Lock()
+        
+        # 호스트별 요청 간격 제한 (호스트 → 다음 요청 가능 시각)
+        # 연구실마다 이벤트 루프(스레드)가 다르므로 asyncio.Lock 대신 threading.Lock
+        self._next_request_at: Dict[str, float] = {}
+        self._rate_lock = threading.Lock()
+        
+        # robots.txt 파서 캐시 (scheme://host → 파서)
+        self._robots: Dict[str, RobotFileParser] = {}
+        self._robots_lock = threading.Lock()
+    
+    def wait_for_writes(self) -> List[Dict]:
+        """
+        백그라운드 저장 완료 대기
+        
+        crawl_lab()이 반환한 결과의 chunks_saved는 저장 전 추정치이므로
+        여기서 실제 저장된 개수로 보정합니다.
+        
+        Returns:
+            보정된 크롤링 결과 리스트
+        """
+        results = []
+        for result, future in self._pending_writes:
+            try:
+                result['chunks_saved'] = len(future.result())
+            except Exception as e:
+                logger.warning("⚠️  문서 저장 실패 (Lab ID %s): %s", result['lab_id'], e)
+                result['chunks_saved'] = 0
+                result['success'] = False
+                result['error'] = str(e)
+            results.append(result)
+        
+        self._pending_writes.clear()
+        return results
+    
+    def close(self):
+        """남은 저장 작업 완료 후 스레드/HTTP 세션 종료"""
+        self.wait_for_writes()
+        self._writer.shutdown()
+        self.session.close()
     
     def crawl_lab(self, lab_data: Dict) -> Dict:
         """
@@ -161,8 +333,10 @@ class LabCrawler:
             'lab_id': None,
             'success': False,
             'pages_visited': 0,
+            'pages_not_modified': 0,
             'chunks_created': 0,
             'chunks_saved': 0,
+            'status': None,
             'error': None
         }
         
@@ -197,49 +371,63 @@ class LabCrawler:
             all_chunks = []
             pages = self._discover_pages(homepage)
             
-            for i, page_url in enumerate(pages[:self.config.MAX_PAGES]):
-                if page_url in self.visited_urls:
+            # robots.txt가 허용하고 아직 아무 연구실도 가져가지 않은 페이지만 (crawl_depth = 발견 순서)
+            # 요청 전에 방문 기록을 선점해서 다른 연구실 스레드가 같은 페이지를 다시 받지 않음
+            targets = [
+                (i, page_url)
+                for i, page_url in enumerate(pages[:self.config.MAX_PAGES])
+                if self._robots_allowed(page_url)
+                and self._claim_url(_canonicalize_url(page_url))
+            ]
+            
+            # 모든 페이지를 동시에 요청 (하나의 세션 공유)
+            page_results = asyncio.run(self._fetch_all(targets, lab_id))
+            
+            # 페이지별 캐시 헤더 (문서 저장이 끝난 뒤에 기록)
+            http_meta = []
+            
+            for (i, page_url), page in zip(targets, page_results):
+                if isinstance(page, Exception):
+                    logger.warning("⚠️  페이지 크롤링 실패: %s - %s", page_url, page)
                     continue
-                
-                try:
-                    chunks = self._crawl_page(page_url, lab_id, crawl_depth=i)
-                    all_chunks.extend(chunks)
-                    result['pages_visited'] += 1
-                    
-                    time.sleep(self.config.DELAY)
-                except Exception as e:
-                    print(f"    ⚠️  페이지 크롤링 실패: {page_url} - {e}")
+                all_chunks.extend(page.chunks)
+                result['pages_visited'] += 1
+                if page.not_modified:
+                    result['pages_not_modified'] += 1
+                if page.etag or page.last_modified:
+                    http_meta.append((page.canonical_url, page.etag, page.last_modified))
             
             result['chunks_created'] = len(all_chunks)
             
-            # 4. 텍스트 정규화 & 임베딩
-            documents = []
-            for chunk in all_chunks:
-                try:
-                    doc_data = self._process_chunk(chunk, lab_id)
-                    if doc_data:
-                        documents.append(doc_data)
-                except Exception as e:
-                    print(f"    ⚠️  청크 처리 실패: {e}")
+            # 4. 텍스트 정규화 → 품질 점수 → 임베딩 (한 번에 배치)
+            documents = list(self._pipeline(all_chunks, lab_id))
             
             # 5. DB 저장
             if USE_LOCAL:
-                # 로컬 저장소용
-                saved_ids = self.db.insert_documents_batch(lab_id, documents)
+                # 로컬 저장소용 - 백그라운드 스레드에서 저장
+                # (실제 저장 개수는 wait_for_writes()에서 보정)
+                future = self._writer.submit(self._write_documents, lab_id, documents, http_meta)
+                self._pending_writes.append((result, future))
+                saved_count = len(documents)
             else:
                 # PostgreSQL용 (주석처리 - 나중에 복원 가능)
                 # saved_ids = self.db.insert_documents_batch(documents)
-                saved_ids = []
+                saved_count = 0
             
-            result['chunks_saved'] = len(saved_ids)
+            result['chunks_saved'] = saved_count
             
             # 6. 크롤링 상태 업데이트
-            status = 'SUCCESS' if result['chunks_saved'] > 0 else 'NO_CONTENT'
-            self.db.update_lab_crawl_status(
-                lab_id=lab_id,
-                status=status,
-                quality_score=self._calculate_quality_score(result)
-            )
+            if not all_chunks and result['pages_not_modified'] > 0:
+                # 바뀐 페이지가 없음 - 이전에 저장한 문서/상태/품질 점수를 그대로 유지
+                status = 'NOT_MODIFIED'
+            else:
+                status = 'SUCCESS' if result['chunks_saved'] > 0 else 'NO_CONTENT'
+                self.db.update_lab_crawl_status(
+                    lab_id=lab_id,
+                    status=status,
+                    quality_score=self._calculate_quality_score(result)
+                )
+            result['status'] = status
             
             # 7. 로그 기록
             self.db.log_crawl(
@@ -268,15 +456,42 @@ class LabCrawler:
         
         return result
     
+    def _write_documents(
+        self,
+        lab_id: int,
+        documents: List[Dict],
+        http_meta: List[Tuple[str, Optional[str], Optional[str]]]
+    ) -> List[int]:
+        """
+        문서 저장 후 페이지별 ETag/Last-Modified 기록 (저장 스레드에서 실행)
+        
+        헤더를 먼저 기록하면 임베딩/저장이 실패해도 다음 크롤링에서 304를 받아
+        그 페이지를 다시 처리하지 않으므로, 저장이 끝난 뒤에만 기록하고
+        파일은 연구실 단위로 한 번만 씁니다.
+        """
+        doc_ids = self.db.insert_documents_batch(lab_id, documents)
+        
+        if http_meta:
+            for url, etag, last_modified in http_meta:
+                self.db.set_http_meta(url, etag, last_modified)
+            self.db.save_http_meta()
+        
+        return doc_ids
+    
     def _discover_pages(self, base_url: str) -> List[str]:
         """관련 페이지 발견"""
         pages = [base_url]
+        seen_urls = {_canonicalize_url(base_url)}  # 정규화된 URL 집합 (O(1) 중복 확인)
+        
+        if not self._robots_allowed(base_url):
+            logger.warning("⚠️  robots.txt에 의해 차단됨: %s", base_url)
+            return pages
         
         try:
-            response = requests.get(
+            time.sleep(self._reserve_request_slot(base_url))
+            response = self.session.get(
                 base_url,
                 timeout=self.config.TIMEOUT,
-                headers={'User-Agent': self.config.USER_AGENT},
                 allow_redirects=True  # 리다이렉트 허용
             )
             response.raise_for_status()
@@ -284,126 +499,316 @@ class LabCrawler:
             # 실제 URL (리다이렉트 후)
             actual_url = response.url
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # 링크만 필요하므로 BeautifulSoup 대신 lxml 트리를 직접 사용 (C 파서)
+            tree = lxml.html.fromstring(response.content)
             
-            # 관련 링크 찾기
-            relevant_keywords = [
-                'research', 'publication', 'people', 'member', 'about',
-                'project', 'lab', '연구', '논문', '구성원', '소개'
-            ]
+            actual_netloc = urlparse(actual_url).netloc
+            
+            keyword_search = self._KEYWORD_RE.search
             
-            for a_tag in soup.find_all('a', href=True):
+            # 관련 링크 찾기
+            for a_tag in tree.iterfind('.//a[@href]'):
                 href = a_tag.get('href', '')
-                text = a_tag.get_text(strip=True).lower()
                 
-                if any(kw in href.lower() or kw in text for kw in relevant_keywords):
+                if keyword_search(href.lower()) or keyword_search(a_tag.text_content().lower()):
                     # 절대 URL 변환
-                    from urllib.parse import urljoin, urlparse
                     full_url = urljoin(actual_url, href)  # 리다이렉트된 URL 사용
                     
                     # 같은 도메인만
-                    if urlparse(full_url).netloc == urlparse(actual_url).netloc:
-                        # 중복 경로 확인 (예: /view/vcl-lab/view/vcl-lab)
-                        parsed = urlparse(full_url)
-                        path = parsed.path
-                        
-                        # 경로 중복 제거 (간단한 휴리스틱)
-                        path_parts = [p for p in path.split('/') if p]
-                        seen = set()
-                        unique_parts = []
-                        for part in path_parts:
-                            if part not in seen or part in ['view', 'page']:  # 'view', 'page'는 중복 허용
-                                unique_parts.append(part)
-                                seen.add(part)
-                        
-                        cleaned_path = '/' + '/'.join(unique_parts)
-                        cleaned_url = f"{parsed.scheme}://{parsed.netloc}{cleaned_path}"
+                    parsed = urlparse(full_url)
+                    if parsed.netloc == actual_netloc:
+                        # 중복 경로 제거 (예: /view/vcl-lab/view/vcl-lab)
+                        cleaned_url = f"{parsed.scheme}://{parsed.netloc}{_dedup_path(parsed.path)}"
                         
-                        if cleaned_url not in pages and cleaned_url != base_url:
+                        # 이미 발견했거나 다른 연구실에서 방문한 페이지는 제외
+                        canonical = _canonicalize_url(cleaned_url)
+                        if canonical not in seen_urls and canonical not in self.visited_urls:
+                            seen_urls.add(canonical)
                             pages.append(cleaned_url)
         
         except Exception as e:
-            print(f"    ⚠️  페이지 발견 실패: {e}")
+            logger.warning("⚠️  페이지 발견 실패: %s - %s", base_url, e)
         
         return pages
     
-    def _crawl_page(self, url: str, lab_id: int, crawl_depth: int) -> List[Chunk]:
-        """단일 페이지 크롤링"""
-        self.visited_urls.add(url)
+    async def _fetch_all(self, targets: List[Tuple[int, str]], lab_id: int) -> List:
+        """
+        여러 페이지 동시 크롤링
+        
+        Args:
+            targets: (crawl_depth, url) 리스트
+            lab_id: 연구실 ID
+        
+        Returns:
+            페이지별 _PageResult 리스트 (실패한 페이지는 예외 객체)
+        
+        동작:
+            - 하나의 aiohttp 세션(연결 풀)을 모든 페이지가 공유
+            - 세마포어로 전체 동시 요청 수 제한 (MAX_CONCURRENCY)
+            - 커넥터로 호스트당 동시 연결 수 제한 (MAX_PER_HOST, 서버 부담 방지)
+        """
+        sem = asyncio.Semaphore(self.config.MAX_CONCURRENCY)
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=self.config.MAX_PER_HOST,
+            ttl_dns_cache=300
+        )
+        
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.TIMEOUT),
+            headers={'User-Agent': self.config.USER_AGENT}
+        ) as session:
+            return await asyncio.gather(
+                *[
+                    self._bounded(sem, session, url, lab_id, depth)
+                    for depth, url in targets
+                ],
+                return_exceptions=True
+            )
+    
+    async def _bounded(
+        self,
+        sem: asyncio.Semaphore,
+        session: aiohttp.ClientSession,
+        url: str,
+        lab_id: int,
+        crawl_depth: int
+    ) -> _PageResult:
+        """세마포어 안에서 단일 페이지 크롤링"""
+        async with sem:
+            return await self._crawl_page_async(session, url, lab_id, crawl_depth)
+    
+    async def _crawl_page_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        lab_id: int,
+        crawl_depth: int
+    ) -> _PageResult:
+        """단일 페이지 크롤링 (방문 기록은 crawl_lab()에서 _claim_url()로 선점)"""
+        canonical = _canonicalize_url(url)
+        
+        # 이전 크롤링의 ETag/Last-Modified로 조건부 요청 (변경 없으면 304, 본문 없음)
+        headers = {}
+        if USE_LOCAL:
+            meta = self.db.get_http_meta(canonical)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         
         try:
+            # 같은 호스트 요청 간격 유지 (다른 호스트 요청은 그대로 진행)
+            delay = self._reserve_request_slot(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
             # HTML 가져오기
-            response = requests.get(
-                url,
-                timeout=self.config.TIMEOUT,
-                headers={'User-Agent': self.config.USER_AGENT},
-                allow_redirects=True
-            )
-            response.raise_for_status()
+            async with session.get(url, allow_redirects=True, headers=headers) as response:
+                if response.status == 304:
+                    # 이미 저장된 페이지 - 청킹/임베딩 생략
+                    logger.info("✅ 변경 없음 (304): %s", url)
+                    return _PageResult(canonical_url=canonical, not_modified=True)
+                
+                response.raise_for_status()
+                
+                # HTML이 아닌 응답(PDF, 이미지 등)은 본문을 받지 않음
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type.lower():
+                    logger.warning("⚠️  HTML 아님 (%s): %s", content_type, url)
+                    return _PageResult()
+                
+                # 응답 내용 확인 (bytes 그대로 - 인코딩 추정/디코딩 생략)
+                # 최대 크기까지만 스트리밍으로 읽음
+                buffer = bytearray()
+                async for block in response.content.iter_chunked(65536):
+                    buffer.extend(block)
+                    if len(buffer) >= self.config.MAX_PAGE_BYTES:
+                        break
+                body = bytes(buffer[:self.config.MAX_PAGE_BYTES])
+                
+                # Content-Type 헤더의 charset (없으면 None → <meta charset>/추정)
+                charset = response.charset
+                
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
             
-            # 응답 내용 확인
-            if not response.text or len(response.text) < 100:
-                print(f"    ⚠️  빈 응답: {url}")
-                return []
+            if not body or len(body) < 100:
+                logger.warning("⚠️  빈 응답: %s", url)
+                return _PageResult()
             
-            # 청킹
+            # 청킹 (BeautifulSoup이 bytes를 직접 디코딩, 헤더 charset 우선)
             chunks = self.doc_processor.process_html(
-                html=response.text,
+                html=body,
                 url=url,
-                crawl_depth=crawl_depth
+                crawl_depth=crawl_depth,
+                encoding=charset
             )
             
-            return chunks
+            return _PageResult(chunks, canonical, etag, last_modified)
             
-        except requests.exceptions.HTTPError as e:
+        except aiohttp.ClientResponseError as e:
             # HTTP 에러 (404, 403 등)는 조용히 처리
-            if e.response.status_code in [404, 403, 410]:
-                print(f"    ⚠️  페이지 없음 ({e.response.status_code}): {url}")
+            if e.status in [404, 403, 410]:
+                logger.warning("⚠️  페이지 없음 (%s): %s", e.status, url)
             else:
-                print(f"    ⚠️  HTTP 에러 ({e.response.status_code}): {url}")
-            return []
+                logger.warning("⚠️  HTTP 에러 (%s): %s", e.status, url)
+            return _PageResult()
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             # 네트워크 에러 (타임아웃, 연결 실패 등)
-            print(f"    ⚠️  네트워크 에러: {url} - {str(e)}")
-            return []
+            logger.warning("⚠️  네트워크 에러: %s - %s", url, e)
+            return _PageResult()
             
         except Exception as e:
             # 기타 에러 (파싱 에러 등)
-            print(f"    ⚠️  처리 에러: {url} - {type(e).__name__}: {str(e)}")
-            return []
-    
-    def _process_chunk(self, chunk: Chunk, lab_id: int) -> Optional[Dict]:
-        """청크 처리 (정규화 + 임베딩)"""
-        # 1. 텍스트 정규화
-        normalized = self.text_normalizer.normalize(chunk.text)
-        
-        # 텍스트가 너무 짧으면 스킵
-        if len(normalized.cleaned_text) < self.config.MIN_TEXT_LENGTH:
-            return None
-        
-        # 2. 임베딩 생성
-        emb_result = self.embedding_pipeline.embed(normalized.cleaned_text)
-        
-        # 3. 문서 데이터 생성 (Dict 형태)
-        doc_data = {
-            'section': chunk.section,
-            'title': chunk.title,
-            'text': normalized.cleaned_text,
-            'lang': normalized.language,
-            'tokens': normalized.tokens,
-            'source_url': chunk.source_url,
-            'parent_url': chunk.source_url,
-            'crawl_depth': chunk.crawl_depth,
-            'source_type': 'html',
-            'md5': chunk.md5,
-            'embedding': emb_result.embedding.tolist() if USE_LOCAL else emb_result.embedding,
-            'emb_model': emb_result.model_name,
-            'emb_ver': emb_result.model_version,
-            'quality_score': self._calculate_chunk_quality(chunk, normalized)
-        }
+            logger.warning("⚠️  처리 에러: %s - %s: %s", url, type(e).__name__, e)
+            return _PageResult()
+    
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        호스트별 요청 시각 예약
+        
+        같은 호스트에는 DELAY초에 한 번만 요청하도록 다음 빈 시각을 예약하고,
+        그때까지 기다려야 하는 시간(초)을 반환합니다.
+        (전체 요청마다 sleep하지 않고, 서버가 이미 느렸다면 기다리지 않음)
+        """
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = slot + self.config.DELAY
+        return slot - now
+    
+    def _robots_allowed(self, url: str) -> bool:
+        """
+        robots.txt 확인 (호스트별 1회 가져와서 캐시)
+        
+        가져오기 실패 시 정책 (CrawlManager._can_fetch와 동일):
+            - 4xx (robots.txt 없음 등): 모두 허용
+            - 5xx / 네트워크 오류: 모두 차단
+        """
+        if not self.config.RESPECT_ROBOTS:
+            return True
+        
+        parsed = urlparse(url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        
+        with self._robots_lock:
+            parser = self._robots.get(base_url)
+            if parser is None:
+                parser = RobotFileParser()
+                try:
+                    response = self.session.get(
+                        urljoin(base_url, '/robots.txt'),
+                        timeout=self.config.TIMEOUT
+                    )
+                    if response.status_code >= 500:
+                        parser.disallow_all = True   # 서버 오류: 모두 차단
+                    elif response.status_code >= 400:
+                        parser.allow_all = True      # robots.txt 없음: 모두 허용
+                    else:
+                        parser.parse(response.text.splitlines())
+                except requests.exceptions.RequestException:
+                    parser.disallow_all = True       # 연결 실패: 차단
+                self._robots[base_url] = parser
+        
+        return parser.can_fetch(self.config.USER_AGENT, url)
+    
+    def _claim_url(self, canonical_url: str) -> bool:
+        """
+        방문 기록 선점 (확인과 기록을 한 번에)
+        
+        Returns:
+            처음 보는 URL이라 이 호출이 기록했으면 True, 이미 방문(선점)됐으면 False
+        """
+        with self._visited_lock:
+            if canonical_url in self.visited_urls:
+                return False
+            self._mark_visited(canonical_url)
+            return True
+    
+    def _mark_visited(self, canonical_url: str):
+        """방문 URL 기록 (MAX_VISITED_URLS 초과 시 가장 오래된 URL부터 제거, _visited_lock 안에서 호출)"""
+        self.visited_urls[canonical_url] = None
+        while len(self.visited_urls) > self.config.MAX_VISITED_URLS:
+            self.visited_urls.popitem(last=False)
+    
+    def _pipeline(self, chunks: List[Chunk], lab_id: int) -> Iterator[Dict]:
+        """
+        청크 → 정규화 → 품질 점수 → 배치 임베딩 → 문서 데이터 (한 번에 처리)
+        
+        단계마다 리스트를 새로 만들며 청크를 여러 번 순회하지 않고,
+        정규화/필터링을 한 번의 순회로 끝낸 뒤 임베딩 행렬의 행을 바로 문서로 만듭니다.
+        청크마다 모델을 호출하면 배치 크기 1로 매번 고정 비용(토크나이저,
+        torch 디스패치)을 내므로, 임베딩은 연구실 단위로 모아서 배치 처리합니다.
+        
+        Yields:
+            문서 데이터 (Dict)
+        """
+        # 1. 중복 제거 + 정규화 + 길이 필터 (한 번의 순회)
+        #    페이지마다 반복되는 내비게이션/푸터 등 같은 MD5 청크는 한 번만 처리
+        #    (다른 연구실에서 이미 계산한 임베딩은 파이프라인 캐시가 MD5로 재사용)
+        seen_md5 = set()
+        prepared: List[Tuple[Chunk, NormalizedText]] = []
+        for chunk in chunks:
+            if chunk.md5 in seen_md5:
+                continue
+            seen_md5.add(chunk.md5)
+            
+            try:
+                normalized = self.text_normalizer.normalize(chunk.text)
+            except Exception as e:
+                logger.warning("⚠️  청크 처리 실패: %s", e)
+                continue
+            
+            # 텍스트가 너무 짧으면 스킵
+            if len(normalized.cleaned_text) >= self.config.MIN_TEXT_LENGTH:
+                prepared.append((chunk, normalized))
+        
+        if not prepared:
+            return
+        
+        # 2. 품질 점수 (전체 청크 한 번에 계산)
+        quality_scores = self._calculate_chunk_qualities(prepared).tolist()
+        
+        # 3. 배치 임베딩 (청크 ID를 캐시 키로 사용)
+        try:
+            with self._embed_lock:
+                embeddings = self.embedding_pipeline.embed_chunks_matrix(
+                    [chunk for chunk, _ in prepared],
+                    texts=[normalized.cleaned_text for _, normalized in prepared],
+                    batch_size=self.config.EMBED_BATCH_SIZE
+                )
+        except Exception as e:
+            logger.warning("⚠️  임베딩 실패 (Lab ID %s): %s", lab_id, e)
+            return
+        
+        if USE_LOCAL:
+            embeddings = embeddings.astype(np.float16)  # 로컬 저장소는 float16 보관
+        
+        emb_model = self.embedding_pipeline.model.model_name
+        emb_ver = self.embedding_pipeline.model.version
         
-        return doc_data
+        # 4. 문서 데이터 생성 (Dict 형태)
+        for (chunk, normalized), embedding, quality_score in zip(prepared, embeddings, quality_scores):
+            yield {
+                'section': chunk.section,
+                'title': chunk.title,
+                'text': normalized.cleaned_text,
+                'lang': normalized.language,
+                'tokens': normalized.tokens,
+                'source_url': chunk.source_url,
+                'parent_url': chunk.source_url,
+                'crawl_depth': chunk.crawl_depth,
+                'source_type': 'html',
+                'md5': chunk.md5,
+                'embedding': embedding,
+                'emb_model': emb_model,
+                'emb_ver': emb_ver,
+                'quality_score': quality_score
+            }
     
     # ========================================================================
     # PostgreSQL용 기존 코드 (주석처리 - 나중에 복원 가능)
@@ -465,6 +870,40 @@ class LabCrawler:
         
         return min(score, 100)
     
+    def _calculate_chunk_qualities(
+        self,
+        prepared: List[Tuple[Chunk, NormalizedText]]
+    ) -> np.ndarray:
+        """
+        청크 품질 점수 일괄 계산 (0-100)
+        
+        _calculate_chunk_quality()와 같은 기준을 청크별 속성 배열에 한 번에 적용합니다.
+        """
+        lengths = np.fromiter(
+            (len(normalized.cleaned_text) for _, normalized in prepared),
+            dtype=np.int32, count=len(prepared)
+        )
+        tokens = np.fromiter(
+            (normalized.tokens for _, normalized in prepared),
+            dtype=np.int32, count=len(prepared)
+        )
+        clear_lang = np.fromiter(
+            (normalized.language in ('ko', 'en') for _, normalized in prepared),
+            dtype=bool, count=len(prepared)
+        )
+        has_title = np.fromiter(
+            (bool(chunk.title) for chunk, _ in prepared),
+            dtype=bool, count=len(prepared)
+        )
+        
+        scores = np.full(len(prepared), 50, dtype=np.int32)   # 기본 점수
+        scores += np.where(lengths > 500, 20, np.where(lengths > 300, 10, 0))  # 텍스트 길이
+        scores += 15 * clear_lang    # 언어 명확성
+        scores += 10 * (tokens > 100)  # 토큰 수
+        scores += 5 * has_title      # 제목 존재
+        
+        return np.minimum(scores, 100)
+    
     def _calculate_quality_score(self, result: Dict) -> int:
         """전체 품질 점수"""
         score = 0
@@ -486,6 +925,19 @@ class LabCrawler:
 class CrawlOrchestrator:
     """크롤링 오케스트레이터"""
     
+    # 연구실 목록 항목 이름 → 컬럼 (위에서부터 순서대로 비교, '연구실'은 '연구실위치'로)
+    _LAB_FIELDS = (
+        ('지도교수', '지도교수'),
+        ('연구내용', '연구내용'),
+        ('연구실', '연구실위치'),
+        ('연락처', '연락처'),
+        ('이메일', '이메일'),
+        ('웹사이트', '웹사이트'),
+    )
+    
+    # 연구실 목록 페이지는 UTF-8 고정
+    _UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+    
     def __init__(
         self,
         db_config=None,  # None이면 로컬 저장소 사용
@@ -513,6 +965,9 @@ class CrawlOrchestrator:
             use_cache=True
         )
         print(f"✅ 모델 로드 완료: {embedding_model}\n")
+        
+        # 연구실 목록 페이지 요청용 세션
+        self.session = _create_http_session(CrawlConfig.USER_AGENT)
     
     def crawl_from_url(self, url: str) -> pd.DataFrame:
         """
@@ -526,18 +981,16 @@ class CrawlOrchestrator:
         print("="*80)
         
         # 연구실 목록 가져오기
-        response = requests.get(url)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
-        all_labs = soup.find_all('div', class_='labs')
+        # (bytes를 그대로 넘겨 lxml이 한 번만 디코딩 - requests의 인코딩 추정 생략)
+        response = self.session.get(url)
+        tree = lxml.html.document_fromstring(response.content, parser=self._UTF8_PARSER)
         
         labs_data = []
         
-        for lab_div in all_labs:
-            dl = lab_div.find('dl')
-            if not dl:
-                continue
-            
+        # 연구실 블록 (<div class="labs">) 한 번에 선택
+        for dl in tree.xpath(
+            "//div[contains(concat(' ', normalize-space(@class), ' '), ' labs ')]/descendant::dl[1]"
+        ):
             lab_info = {
                 '연구실명(한글)': '',
                 '연구실명(영문)': '',
@@ -549,42 +1002,37 @@ class CrawlOrchestrator:
                 '웹사이트': ''
             }
             
-            dt = dl.find('dt')
-            if dt:
-                dt_text = dt.get_text(strip=True)
-                small = dt.find('small')
+            dt = dl.find('.//dt')
+            if dt is not None:
+                dt_text = _joined_text(dt)
+                small = dt.find('.//small')
                 
-                if small:
-                    lab_info['연구실명(영문)'] = small.get_text(strip=True)
+                if small is not None:
+                    lab_info['연구실명(영문)'] = _joined_text(small)
                     lab_info['연구실명(한글)'] = dt_text.replace(
                         lab_info['연구실명(영문)'], ''
                     ).strip()
                 else:
                     lab_info['연구실명(한글)'] = dt_text
             
-            dds = dl.find_all('dd')
-            for dd in dds:
-                span = dd.find('span')
-                if span:
-                    field_name = span.get_text(strip=True)
-                    value_text = dd.get_text(strip=True).replace(field_name, '', 1).strip()
-                    
-                    a_tag = dd.find('a')
-                    if a_tag and a_tag.get('href'):
-                        value_text = a_tag.get('href')
-                    
-                    if '지도교수' in field_name:
-                        lab_info['지도교수'] = value_text
-                    elif '연구내용' in field_name:
-                        lab_info['연구내용'] = value_text
-                    elif '연구실' in field_name:
-                        lab_info['연구실위치'] = value_text
-                    elif '연락처' in field_name:
-                        lab_info['연락처'] = value_text
-                    elif '이메일' in field_name:
-                        lab_info['이메일'] = value_text
-                    elif '웹사이트' in field_name:
-                        lab_info['웹사이트'] = value_text
+            for dd in dl.iterfind('.//dd'):
+                span = dd.find('.//span')
+                if span is None:
+                    continue
+                
+                field_name = _joined_text(span)
+                column = next(
+                    (col for keyword, col in self._LAB_FIELDS if keyword in field_name),
+                    None
+                )
+                if column is None:
+                    continue
+                
+                a_tag = dd.find('.//a')
+                if a_tag is not None and a_tag.get('href'):
+                    lab_info[column] = a_tag.get('href')
+                else:
+                    lab_info[column] = _joined_text(dd).replace(field_name, '', 1).strip()
             
             labs_data.append(lab_info)
         
@@ -602,48 +1050,45 @@ class CrawlOrchestrator:
         print("2단계: 각 연구실 상세 크롤링 & 임베딩")
         print("="*80)
         
-        # 결과 컬럼 추가
-        labs_df['lab_id'] = None
-        labs_df['pages_visited'] = 0
-        labs_df['chunks_created'] = 0
-        labs_df['chunks_saved'] = 0
-        labs_df['crawl_status'] = ''
-        labs_df['quality_score'] = 0
-        labs_df['crawl_timestamp'] = ''
-        labs_df['error'] = ''
+        # 연구실별 결과 (행 인덱스 → 결과), 루프가 끝난 뒤 한 번에 컬럼으로 추가
+        results_by_idx = {}
+        timestamps = {}
         
         if USE_LOCAL:
             # 로컬 저장소 사용 (with 문 불필요)
             crawler = LabCrawler(self.db, self.embedding_pipeline)
             
-            for idx, row in labs_df.iterrows():
-                print(f"\n{'='*80}")
-                print(f"[{idx+1}/{len(labs_df)}] {row['연구실명(한글)']}")
-                print(f"{'='*80}")
+            # 연구실끼리는 독립적이므로 여러 연구실을 동시에 크롤링
+            # (한 연구실이 네트워크를 기다리는 동안 다른 연구실의 파싱/임베딩 진행)
+            with ThreadPoolExecutor(max_workers=crawler.config.MAX_PARALLEL_LABS) as pool:
+                futures = {
+                    pool.submit(crawler.crawl_lab, row.to_dict()): idx
+                    for idx, row in labs_df.iterrows()
+                }
                 
-                result = crawler.crawl_lab(row.to_dict())
-                
-                # 결과 기록
-                labs_df.at[idx, 'lab_id'] = result['lab_id']
-                labs_df.at[idx, 'pages_visited'] = result['pages_visited']
-                labs_df.at[idx, 'chunks_created'] = result['chunks_created']
-                labs_df.at[idx, 'chunks_saved'] = result['chunks_saved']
-                labs_df.at[idx, 'crawl_status'] = 'SUCCESS' if result['success'] else 'FAILED'
-                labs_df.at[idx, 'crawl_timestamp'] = datetime.now().isoformat()
-                
-                if result['error']:
-                    labs_df.at[idx, 'error'] = result['error']
-                
-                # 출력
-                print(f"  결과:")
-                print(f"    - Lab ID: {result['lab_id']}")
-                print(f"    - 방문 페이지: {result['pages_visited']}")
-                print(f"    - 생성 청크: {result['chunks_created']}")
-                print(f"    - 저장 청크: {result['chunks_saved']}")
-                print(f"    - 상태: {labs_df.at[idx, 'crawl_status']}")
-                
-                if result['error']:
-                    print(f"    - 오류: {result['error']}")
+                for done, future in enumerate(as_completed(futures), start=1):
+                    idx = futures[future]
+                    result = future.result()
+                    results_by_idx[idx] = result
+                    timestamps[idx] = datetime.now().isoformat()
+                    
+                    # 진행 상황 (연구실당 한 줄)
+                    # 이 시점의 chunks_saved는 저장 스레드에 넘긴 문서 수 (실제 저장 수는
+                    # 중복 제외/저장 실패를 반영해 wait_for_writes()에서 보정 → 결과 요약에 표시)
+                    logger.info(
+                        "[%d/%d] %s - Lab ID: %s, 방문 페이지: %d, 생성 청크: %d, 저장 대기 문서: %d, 상태: %s",
+                        done, len(labs_df), labs_df.at[idx, '연구실명(한글)'],
+                        result['lab_id'], result['pages_visited'],
+                        result['chunks_created'], result['chunks_saved'],
+                        self._crawl_status(result)
+                    )
+                    if result['error']:
+                        logger.warning(
+                            "⚠️  %s 오류: %s", labs_df.at[idx, '연구실명(한글)'], result['error']
+                        )
+            
+            # 백그라운드 저장 완료 대기 (results_by_idx의 chunks_saved가 실제 값으로 보정됨)
+            crawler.close()
         
         else:
             # PostgreSQL 사용 (주석처리 - 나중에 복원 가능)
@@ -654,7 +1099,42 @@ class CrawlOrchestrator:
             #         ... (기존 코드와 동일)
             pass
         
-        return labs_df
+        # 결과 컬럼 추가 (행마다 .at 대입 대신 한 번에)
+        results = pd.DataFrame.from_dict(
+            {
+                idx: {
+                    'lab_id': result['lab_id'],
+                    'pages_visited': result['pages_visited'],
+                    'chunks_created': result['chunks_created'],
+                    'chunks_saved': result['chunks_saved'],
+                    'crawl_status': self._crawl_status(result),
+                    'crawl_timestamp': timestamps[idx],
+                    'error': result['error'] or ''
+                }
+                for idx, result in results_by_idx.items()
+            },
+            orient='index',
+            columns=['lab_id', 'pages_visited', 'chunks_created', 'chunks_saved',
+                     'crawl_status', 'crawl_timestamp', 'error']
+        ).reindex(labs_df.index)
+        
+        return labs_df.assign(
+            lab_id=results['lab_id'].astype('Int64'),
+            pages_visited=results['pages_visited'].fillna(0).astype('int32'),
+            chunks_created=results['chunks_created'].fillna(0).astype('int32'),
+            chunks_saved=results['chunks_saved'].fillna(0).astype('int32'),
+            crawl_status=results['crawl_status'].fillna(''),
+            quality_score=0,
+            crawl_timestamp=results['crawl_timestamp'].fillna(''),
+            error=results['error'].fillna('')
+        )
+    
+    @staticmethod
+    def _crawl_status(result: Dict) -> str:
+        """결과 표의 크롤링 상태 (SUCCESS / NOT_MODIFIED / FAILED)"""
+        if not result['success']:
+            return 'FAILED'
+        return 'NOT_MODIFIED' if result['status'] == 'NOT_MODIFIED' else 'SUCCESS'
     
     def print_summary(self, df: pd.DataFrame):
         """결과 요약 출력"""
@@ -665,6 +1145,7 @@ class CrawlOrchestrator:
         print(f"\n📊 전체 통계:")
         print(f"  총 연구실: {len(df)}")
         print(f"  성공: {(df['crawl_status'] == 'SUCCESS').sum()}")
+        print(f"  변경 없음: {(df['crawl_status'] == 'NOT_MODIFIED').sum()}")
         print(f"  실패: {(df['crawl_status'] == 'FAILED').sum()}")
         print(f"  웹사이트 없음: {(df['error'] == 'NO_WEBSITE').sum()}")
         
@@ -707,6 +1188,11 @@ class CrawlOrchestrator:
 
 def main():
     """메인 함수"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s %(message)s'
+    )
+    
     print("🚀 인하대 전기컴퓨터공학과 연구실 크롤러 v2.0")
     print("   - 청킹 & 본문 추출")
     print("   - 텍스트 정규화")
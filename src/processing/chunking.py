@@ -19,12 +19,22 @@
 
 import re
 import hashlib
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 from bs4 import BeautifulSoup, Tag, NavigableString
 import unicodedata
 
 
+# 자주 쓰는 정규식 (호출마다 re 모듈 캐시를 거치지 않도록 미리 컴파일)
+_HANGUL_RE = re.compile(r'[가-힣]')
+_ASCII_ALPHA_RE = re.compile(r'[a-zA-Z]')
+_ASCII_ALPHA_OR_SPACE_RE = re.compile(r'[a-zA-Z\s]')
+_ENGLISH_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n{2,}')
+_NUMBERED_HEADING_RE = re.compile(r'^\d+\.?\s')
+
+
 @dataclass
 class Chunk:
     """
@@ -191,12 +201,25 @@ class ContentExtractor:
         return soup
     
     @staticmethod
-    def extract_main_content(html: str) -> Tuple[BeautifulSoup, str]:
+    def extract_main_content(
+        html: Union[str, bytes],
+        encoding: Optional[str] = None
+    ) -> Tuple[BeautifulSoup, str]:
         """
         메인 콘텐츠 추출
+        
+        Args:
+            html: HTML 문자열 또는 응답 원본 bytes
+                bytes면 BeautifulSoup이 <meta charset>으로 직접 디코딩
+            encoding: HTTP Content-Type 헤더의 charset (bytes일 때만 사용)
+                헤더에만 charset을 적는 EUC-KR/CP949 페이지용
+        
         Returns: (cleaned_soup, main_text)
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        if encoding and isinstance(html, bytes):
+            soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        else:
+            soup = BeautifulSoup(html, 'lxml')
         
         # 1. 노이즈 제거
         soup = ContentExtractor.clean_html(soup)
@@ -247,13 +270,13 @@ class ContentExtractor:
             text = tag.get_text(separator=' ', strip=True)
             if text and len(text) > 10:  # 10자 이상만
                 # 연속 공백 제거
-                text = re.sub(r'\s+', ' ', text)
+                text = _WHITESPACE_RE.sub(' ', text)
                 text_parts.append(text)
         
         # 텍스트가 없으면 전체 텍스트 시도
         if not text_parts:
             text = element.get_text(separator=' ', strip=True)
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RE.sub(' ', text)
             return text
         
         # 중복 제거 (같은 텍스트가 중첩되어 나오는 경우)
@@ -434,8 +457,8 @@ class QualityScorer:
         text = chunk.text
         
         # 한글/영문 비율 계산
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
+        korean_chars = len(_HANGUL_RE.findall(text))
+        english_chars = len(_ASCII_ALPHA_RE.findall(text))
         total_alpha = korean_chars + english_chars
         
         if total_alpha == 0:
@@ -480,11 +503,11 @@ class TextChunker:
         - 영문: 0.25 토큰/단어
         """
         # 한글 문자 수
-        korean_chars = len(re.findall(r'[가-힣]', text))
+        korean_chars = len(_HANGUL_RE.findall(text))
         # 영문 단어 수
-        english_words = len(re.findall(r'\b[a-zA-Z]+\b', text))
+        english_words = len(_ENGLISH_WORD_RE.findall(text))
         # 기타 문자
-        other_chars = len(text) - korean_chars - len(re.findall(r'[a-zA-Z\s]', text))
+        other_chars = len(text) - korean_chars - len(_ASCII_ALPHA_OR_SPACE_RE.findall(text))
         
         # 토큰 수 계산
         tokens = int(korean_chars * 1.5 + english_words * 0.25 + other_chars * 0.5)
@@ -494,7 +517,7 @@ class TextChunker:
     def split_by_paragraphs(text: str) -> List[str]:
         """텍스트를 문단으로 분리"""
         # 줄바꿈 2개 이상 = 문단 구분
-        paragraphs = re.split(r'\n{2,}', text)
+        paragraphs = _PARAGRAPH_BREAK_RE.split(text)
         # 빈 문단 제거
         return [p.strip() for p in paragraphs if p.strip()]
     
@@ -503,7 +526,7 @@ class TextChunker:
         """헤딩인지 판별 (짧고 ':' 또는 숫자로 시작)"""
         return len(text) < 100 and (
             text.endswith(':') or 
-            re.match(r'^\d+\.?\s', text) or
+            _NUMBERED_HEADING_RE.match(text) or
             text.isupper()
         )
     
@@ -511,7 +534,7 @@ class TextChunker:
     def _clean_text(text: str) -> str:
         """텍스트 정리"""
         # 공백 정규화
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     @staticmethod
@@ -593,18 +616,21 @@ class DocumentProcessor:
     
     def process_html(
         self, 
-        html: str, 
+        html: Union[str, bytes], 
         url: str = '', 
-        crawl_depth: int = 0
+        crawl_depth: int = 0,
+        encoding: Optional[str] = None
     ) -> List[Chunk]:
         """
         HTML 문서 처리 파이프라인
+        (html은 문자열 또는 HTTP 응답 원본 bytes 모두 가능,
+         encoding은 bytes일 때 HTTP 헤더의 charset)
         1. 본문 추출
         2. 섹션 식별
         3. 청킹
         """
         # 1. 본문 추출
-        soup, main_text = ContentExtractor.extract_main_content(html)
+        soup, main_text = ContentExtractor.extract_main_content(html, encoding)
         
         if not main_text or len(main_text) < 100:
             return []
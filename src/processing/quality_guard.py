@@ -14,10 +14,58 @@
 """
 
 import re
-from typing import List, Dict, Tuple
+import threading
+import numpy as np
+from collections import Counter
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from processing.chunking import Chunk
 
+try:
+    import ahocorasick  # 선택: pip install pyahocorasick (PII 키워드 한 번에 검색)
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # 선택: pip install hyperscan (URL 패턴 전체를 한 번에 검사)
+except ImportError:
+    hyperscan = None
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """키워드 목록으로 Aho-Corasick 오토마톤 생성 (pyahocorasick 없으면 None)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_pattern_database(patterns: List[str]):
+    """정규식 목록으로 Hyperscan 데이터베이스 생성 (hyperscan 없으면 None, ID = 목록 순서)"""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[p.encode('utf-8') for p in patterns],
+        ids=list(range(len(patterns))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+    )
+    return database
+
+
+def _count_korean_english(text: str) -> Tuple[int, int]:
+    """한글 음절(가-힣)과 영문자(a-zA-Z) 개수를 한 번의 벡터 연산으로 계산"""
+    # surrogatepass: 짝 없는 서로게이트도 그대로 인코딩 (두 범위 밖이라 개수에 영향 없음)
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    korean = np.count_nonzero((codes >= 0xAC00) & (codes <= 0xD7A3))
+    # 0x20 비트를 켜면 대문자가 소문자로 겹침 (ASCII 밖의 문자는 a-z 범위에 들어오지 않음)
+    folded = codes | 0x20
+    english = np.count_nonzero((folded >= 0x61) & (folded <= 0x7A))
+    return int(korean), int(english)
+
 
 @dataclass
 class QualityReport:
@@ -71,6 +119,21 @@ class GuardRail:
         'portal', 'intranet', '인트라넷', '사내망', 'vpn'
     ]
     
+    # 소문자로 정규화하고 중복을 제거한 키워드 (순서 유지, 결과도 이 형태로 반환)
+    _PII_KEYWORDS_LOWER = tuple(dict.fromkeys(kw.lower() for kw in PII_KEYWORDS))
+    
+    # PII 키워드 오토마톤 (텍스트를 한 번만 훑어서 모든 키워드 검색)
+    _PII_AUTOMATON = _build_keyword_automaton(_PII_KEYWORDS_LOWER)
+    
+    # PII 입력 필드 패턴 (그룹 이름 = 필드 타입, HTML을 한 번만 스캔)
+    _HTML_PII_RE = re.compile(
+        r'(?P<password>type=["\']password["\']|(?:name|id)=["\'][^"\']*password[^"\']*["\'])'
+        r'|(?P<email>type=["\']email["\']|name=["\'][^"\']*email[^"\']*["\'])'
+        r'|(?P<phone>type=["\']tel["\']|name=["\'][^"\']*phone[^"\']*["\'])',
+        re.IGNORECASE
+    )
+    _HTML_PII_FIELDS = ('password', 'email', 'phone')
+    
     # 제외할 URL 패턴 (정규식)
     EXCLUDED_URL_PATTERNS = [
         r'/login',
@@ -88,6 +151,22 @@ class GuardRail:
         r'/download/.*\.(exe|zip|rar)',  # 실행파일 다운로드
     ]
     
+    # 위 패턴이 매칭되려면 URL에 반드시 들어 있어야 하는 문자열
+    # (패턴을 추가하면 그 패턴의 고정 문자열도 여기에 추가)
+    _EXCLUDED_URL_SIGNALS = (
+        '/login', '/sign', '/register', '/admin', '/portal', '/mypage',
+        '/privacy', '/personal', '/auth', '/password', '?', '/download/',
+    )
+    
+    # 패턴별 컴파일 결과 (매칭 이유 확인용) + 전체를 묶은 단일 정규식 (빠른 판별용)
+    _EXCLUDED_URL_RES = [re.compile(p) for p in EXCLUDED_URL_PATTERNS]
+    _EXCLUDED_URL_ANY = re.compile('|'.join(f'(?:{p})' for p in EXCLUDED_URL_PATTERNS))
+    
+    # Hyperscan 사용 시: 한 번의 스캔으로 매칭된 모든 패턴 ID를 얻음
+    # (스크래치 공간은 스레드마다 따로 필요)
+    _EXCLUDED_URL_DB = _build_pattern_database(EXCLUDED_URL_PATTERNS)
+    _hs_local = threading.local()
+    
     # 제외할 콘텐츠 타입
     EXCLUDED_CONTENT_TYPES = [
         'application/octet-stream',
@@ -115,13 +194,45 @@ class GuardRail:
         """
         url_lower = url.lower()
         
-        # URL 패턴 매칭
-        for pattern in self.EXCLUDED_URL_PATTERNS:
-            if re.search(pattern, url_lower):
+        # 대부분의 URL은 어떤 패턴에도 걸리지 않으므로
+        # 고정 문자열 검사로 먼저 거르고, 후보만 정규식으로 판별
+        for signal in self._EXCLUDED_URL_SIGNALS:
+            if signal in url_lower:
+                break
+        else:
+            return False, ""
+        
+        if self._EXCLUDED_URL_DB is not None:
+            matched = self._scan_excluded_url(url_lower)
+            if not matched:
+                return False, ""
+            # 여러 패턴이 걸리면 목록에서 앞선 패턴을 이유로 사용
+            return True, f"URL 패턴 '{self.EXCLUDED_URL_PATTERNS[min(matched)]}' 매칭"
+        
+        if not self._EXCLUDED_URL_ANY.search(url_lower):
+            return False, ""
+        
+        # 걸린 경우에만 어떤 패턴인지 확인 (목록 순서대로)
+        for pattern, compiled in zip(self.EXCLUDED_URL_PATTERNS, self._EXCLUDED_URL_RES):
+            if compiled.search(url_lower):
                 return True, f"URL 패턴 '{pattern}' 매칭"
         
         return False, ""
     
+    def _scan_excluded_url(self, url_lower: str) -> List[int]:
+        """Hyperscan으로 URL을 한 번 스캔해서 매칭된 패턴 ID 목록 반환"""
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self._EXCLUDED_URL_DB)
+        
+        matched = []
+        self._EXCLUDED_URL_DB.scan(
+            url_lower.encode('utf-8'),
+            match_event_handler=lambda pattern_id, start, end, flags, context: matched.append(pattern_id),
+            scratch=scratch
+        )
+        return matched
+    
     def detect_pii_in_text(self, text: str) -> Tuple[bool, List[str]]:
         """
         텍스트에서 PII(개인정보) 관련 내용 감지
@@ -130,7 +241,7 @@ class GuardRail:
             text: 확인할 텍스트
             
         Returns:
-            (PII 발견 여부, 발견된 키워드 목록)
+            (PII 발견 여부, 발견된 키워드 목록 - 소문자, 중복 없음, PII_KEYWORDS 순서)
             
         예시:
             has_pii, keywords = guard.detect_pii_in_text(
@@ -139,12 +250,14 @@ class GuardRail:
             # (True, ['로그인', '개인정보'])
         """
         text_lower = text.lower()
-        found_keywords = []
         
-        # 키워드 매칭
-        for keyword in self.PII_KEYWORDS:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
+        if self._PII_AUTOMATON is not None:
+            # 한 번의 스캔으로 등장한 키워드 수집 (결과 순서는 PII_KEYWORDS 순서 유지)
+            hits = {keyword for _, keyword in self._PII_AUTOMATON.iter(text_lower)}
+            found_keywords = [kw for kw in self._PII_KEYWORDS_LOWER if kw in hits]
+        else:
+            # 키워드 매칭
+            found_keywords = [kw for kw in self._PII_KEYWORDS_LOWER if kw in text_lower]
         
         has_pii = len(found_keywords) > 0
         return has_pii, found_keywords
@@ -161,24 +274,15 @@ class GuardRail:
         Returns:
             (PII 발견 여부, 발견된 필드 타입 목록)
         """
-        html_lower = html.lower()
-        found_fields = []
-        
-        # 입력 필드 패턴
-        pii_patterns = [
-            (r'type=["\']password["\']', 'password'),
-            (r'type=["\']email["\']', 'email'),
-            (r'type=["\']tel["\']', 'phone'),
-            (r'name=["\'].*password.*["\']', 'password'),
-            (r'name=["\'].*email.*["\']', 'email'),
-            (r'name=["\'].*phone.*["\']', 'phone'),
-            (r'id=["\'].*password.*["\']', 'password'),
-        ]
+        # 대소문자는 IGNORECASE로 처리 (수 MB짜리 HTML의 소문자 사본을 만들지 않음)
+        found = set()
         
-        for pattern, field_type in pii_patterns:
-            if re.search(pattern, html_lower):
-                if field_type not in found_fields:
-                    found_fields.append(field_type)
+        for match in self._HTML_PII_RE.finditer(html):
+            found.add(match.lastgroup)
+            if len(found) == len(self._HTML_PII_FIELDS):
+                break
+        
+        found_fields = [field for field in self._HTML_PII_FIELDS if field in found]
         
         has_pii = len(found_fields) > 0
         return has_pii, found_fields
@@ -201,6 +305,9 @@ class QualityScorer:
         report = scorer.calculate_quality(chunk, all_chunks)
         if report.needs_review:
             print(f"검수 필요: {report.reason}")
+        
+        # 여러 청크를 한 번에 평가 (MD5 개수는 한 번만 집계)
+        reports = scorer.calculate_quality_batch(all_chunks)
     """
     
     # 각 섹션별 기대 키워드
@@ -233,10 +340,21 @@ class QualityScorer:
         ]
     }
     
+    # 섹션별 소문자 키워드 튜플과 오토마톤 (클래스 로드 시 한 번만 생성)
+    _SECTION_KEYWORDS_LOWER = {
+        section: tuple(kw.lower() for kw in keywords)
+        for section, keywords in SECTION_KEYWORDS.items()
+    }
+    _SECTION_AUTOMATA = {
+        section: _build_keyword_automaton(keywords)
+        for section, keywords in SECTION_KEYWORDS.items()
+    }
+    
     def calculate_quality(
         self, 
         chunk: Chunk, 
-        all_chunks: List[Chunk] = None
+        all_chunks: List[Chunk] = None,
+        md5_counts: Optional[Counter] = None
     ) -> QualityReport:
         """
         청크의 품질 점수 계산
@@ -244,6 +362,9 @@ class QualityScorer:
         Args:
             chunk: 평가할 청크
             all_chunks: 전체 청크 리스트 (중복 체크용, 선택)
+            md5_counts: MD5별 청크 개수 (미리 집계한 값, 선택 - 주면 all_chunks 대신 사용)
+                같은 all_chunks로 여러 청크를 평가할 때는 한 번 집계해서 넘기거나
+                calculate_quality_batch() 사용
         
         Returns:
             QualityReport 객체
@@ -263,8 +384,10 @@ class QualityScorer:
         language_score = self._language_consistency_score(chunk)
         
         # 4. 중복 여부 (20%)
-        if all_chunks:
-            duplicate_score = self._duplicate_score(chunk, all_chunks)
+        if md5_counts is None and all_chunks:
+            md5_counts = Counter(c.md5 for c in all_chunks)
+        if md5_counts is not None:
+            duplicate_score = self._duplicate_score(chunk, md5_counts)
         else:
             duplicate_score = 1.0
         
@@ -292,6 +415,69 @@ class QualityScorer:
             reason=reason if needs_review else ""
         )
     
+    def calculate_quality_batch(self, chunks: List[Chunk]) -> List[QualityReport]:
+        """
+        여러 청크의 품질 점수를 한 번에 계산 (chunks 전체를 중복 체크 대상으로 사용)
+        
+        Args:
+            chunks: 평가할 청크 리스트
+        
+        Returns:
+            청크 순서대로의 QualityReport 리스트
+        
+        길이/중복/전체 점수는 청크 배열 단위의 NumPy 연산으로 계산하며,
+        결과는 calculate_quality()를 청크마다 호출한 것과 같습니다.
+        """
+        n = len(chunks)
+        if n == 0:
+            return []
+        
+        # 텍스트 기반 점수 (청크별 스캔)
+        section_scores = np.fromiter(
+            (self._section_match_score(c) for c in chunks), dtype=np.float64, count=n
+        )
+        language_scores = np.fromiter(
+            (self._language_consistency_score(c) for c in chunks), dtype=np.float64, count=n
+        )
+        
+        # 길이 점수 (구간별 벡터 연산)
+        char_counts = np.fromiter((c.char_count for c in chunks), dtype=np.int64, count=n)
+        length_scores = self._length_scores(char_counts)
+        
+        # 중복 점수 (MD5별 개수를 한 번만 집계)
+        md5_counts = Counter(c.md5 for c in chunks)
+        same_md5_counts = np.fromiter((md5_counts[c.md5] for c in chunks), dtype=np.int64, count=n)
+        duplicate_scores = np.select(
+            [same_md5_counts <= 1, same_md5_counts == 2], [1.0, 0.5], default=0.0
+        )
+        
+        # 전체 점수 (calculate_quality()와 같은 순서로 더해서 결과를 일치시킴)
+        overall_scores = (
+            section_scores * 0.3 +
+            length_scores * 0.25 +
+            language_scores * 0.25 +
+            duplicate_scores * 0.2
+        )
+        
+        reports = []
+        for overall, section, length, language, duplicate in zip(
+            overall_scores.tolist(), section_scores.tolist(), length_scores.tolist(),
+            language_scores.tolist(), duplicate_scores.tolist()
+        ):
+            needs_review = overall < 0.5
+            reports.append(QualityReport(
+                overall_score=overall,
+                section_score=section,
+                length_score=length,
+                language_score=language,
+                duplicate_score=duplicate,
+                needs_review=needs_review,
+                reason=self._get_low_score_reason(
+                    section, length, language, duplicate
+                ) if needs_review else ""
+            ))
+        return reports
+    
     def _section_match_score(self, chunk: Chunk) -> float:
         """
         섹션과 텍스트 내용의 일치도
@@ -301,14 +487,19 @@ class QualityScorer:
         if chunk.section == 'general':
             return 0.5  # 일반 섹션은 중립 점수
         
-        text_lower = chunk.text.lower()
-        keywords = self.SECTION_KEYWORDS.get(chunk.section, [])
+        keywords = self._SECTION_KEYWORDS_LOWER.get(chunk.section)
         
         if not keywords:
             return 0.5
         
-        # 키워드 매칭 개수
-        matches = sum(1 for kw in keywords if kw.lower() in text_lower)
+        text_lower = chunk.text.lower()
+        
+        # 키워드 매칭 개수 (오토마톤이 있으면 텍스트를 한 번만 스캔)
+        automaton = self._SECTION_AUTOMATA[chunk.section]
+        if automaton is not None:
+            matches = len({kw for _, kw in automaton.iter(text_lower)})
+        else:
+            matches = sum(1 for kw in keywords if kw in text_lower)
         
         # 매칭 비율 (최대 1.0)
         match_ratio = matches / len(keywords)
@@ -335,6 +526,20 @@ class QualityScorer:
         else:
             return 0.3  # 너무 짧거나 김
     
+    @staticmethod
+    def _length_scores(char_counts: np.ndarray) -> np.ndarray:
+        """길이 적절성 점수 (배열 버전, 구간은 _length_score()와 동일)"""
+        c = char_counts
+        return np.select(
+            [
+                (c >= 200) & (c <= 400),
+                ((c >= 150) & (c < 200)) | ((c > 400) & (c <= 500)),
+                ((c >= 100) & (c < 150)) | ((c > 500) & (c <= 600)),
+            ],
+            [1.0, 0.8, 0.6],
+            default=0.3
+        )
+    
     def _language_consistency_score(self, chunk: Chunk) -> float:
         """
         언어 일관성 점수
@@ -345,8 +550,7 @@ class QualityScorer:
         text = chunk.text
         
         # 한글/영문 비율 계산
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
+        korean_chars, english_chars = _count_korean_english(text)
         total_alpha = korean_chars + english_chars
         
         if total_alpha == 0:
@@ -363,14 +567,14 @@ class QualityScorer:
         else:
             return 0.6  # 많이 섞임 (보통 - 나쁘지 않음)
     
-    def _duplicate_score(self, chunk: Chunk, all_chunks: List[Chunk]) -> float:
+    def _duplicate_score(self, chunk: Chunk, md5_counts: Counter) -> float:
         """
         중복 점수 (낮을수록 중복 많음)
         
         같은 MD5 해시를 가진 청크가 많으면 점수 하락
         """
         # 같은 MD5 해시 개수 확인
-        same_md5_count = sum(1 for c in all_chunks if c.md5 == chunk.md5)
+        same_md5_count = md5_counts[chunk.md5]
         
         if same_md5_count <= 1:
             return 1.0  # 중복 없음
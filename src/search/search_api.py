@@ -8,10 +8,14 @@ uvicorn search_api:app --reload --port 8000
 curl "http://localhost:8000/search?query=컴퓨터+비전&limit=5"
 """
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import numpy as np
 import time
 
 from storage.vector_db import VectorDatabase, DatabaseConfig, SearchResult
@@ -36,6 +40,105 @@ app.add_middleware(
 # 전역 변수
 db = None
 embedding_pipeline = None
+query_batcher = None
+
+# 검색 응답에 담는 본문 최대 길이 (DB에서 잘라서 가져옴)
+RESPONSE_TEXT_LIMIT = 500
+
+
+class QueryEmbeddingBatcher:
+    """
+    쿼리 임베딩 마이크로 배치
+    
+    동시에 들어온 검색 요청의 쿼리를 짧은 시간(max_wait) 동안 모아서
+    embed_matrix() 한 번으로 임베딩합니다. 모델 추론은 스레드에서 실행되므로
+    이벤트 루프를 막지 않고, 추론 중에 들어온 요청은 다음 배치로 묶입니다.
+    
+    같은 쿼리(공백 정규화 기준)는 LRU 캐시에서 바로 반환하며,
+    아직 계산 중인 쿼리는 진행 중인 결과를 함께 기다립니다 (중복 추론 없음).
+    
+    사용법:
+        batcher = QueryEmbeddingBatcher(embedding_pipeline)
+        batcher.start()
+        embedding = await batcher.embed("컴퓨터 비전")
+        await batcher.stop()
+    """
+    
+    def __init__(
+        self,
+        pipeline: EmbeddingPipeline,
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+        cache_size: int = 4096
+    ):
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait  # 첫 요청 이후 다른 요청을 기다리는 시간 (초)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()  # 쿼리 → 임베딩 (LRU)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """배치 처리 태스크 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """배치 처리 태스크 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def embed(self, query: str) -> np.ndarray:
+        """쿼리 하나를 배치에 넣고 임베딩 결과를 기다림 (캐시 적중 시 즉시 반환)"""
+        key = ' '.join(query.split())
+        
+        future = self._cache.get(key)
+        if future is not None:
+            self._cache.move_to_end(key)  # 최근 사용으로 갱신
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._cache[key] = future
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            await self._queue.put((key, future))
+        
+        # 한 요청이 취소되어도 같은 쿼리를 기다리는 다른 요청에는 영향 없음
+        return await asyncio.shield(future)
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            items: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            
+            # 잠깐 기다렸다가 그 사이 들어온 요청을 함께 처리
+            if self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+            while len(items) < self.max_batch_size and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            
+            try:
+                embeddings = await loop.run_in_executor(
+                    None,
+                    self.pipeline.embed_matrix,
+                    [query for query, _ in items]
+                )
+            except Exception as e:
+                for query, future in items:
+                    # 실패한 결과는 캐시하지 않음 (다음 요청에서 재시도)
+                    if self._cache.get(query) is future:
+                        del self._cache[query]
+                    future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(items, embeddings):
+                future.set_result(embedding)
 
 
 # 응답 모델
@@ -71,7 +174,7 @@ class StatsResponse(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 모델 로드"""
-    global db, embedding_pipeline
+    global db, embedding_pipeline, query_batcher
     
     print("🚀 API 서버 시작...")
     
@@ -96,6 +199,10 @@ async def startup_event():
     print("✅ 임베딩 모델 로드 완료")
     print(f"   모델: {embedding_pipeline.get_info()['full_name']}")
     print()
+    
+    # 쿼리 임베딩 마이크로 배치
+    query_batcher = QueryEmbeddingBatcher(embedding_pipeline)
+    query_batcher.start()
 
 
 # 종료 이벤트
@@ -103,6 +210,8 @@ async def startup_event():
 async def shutdown_event():
     """서버 종료 시 리소스 정리"""
     global db
+    if query_batcher:
+        await query_batcher.stop()
     if db:
         db.close()
     print("👋 API 서버 종료")
@@ -125,6 +234,7 @@ async def root():
 
 @app.get("/search", response_model=SearchResponse)
 async def search_vector(
+    background_tasks: BackgroundTasks,
     query: str = Query(..., description="검색 쿼리", min_length=1),
     limit: int = Query(10, ge=1, le=50, description="결과 수"),
     min_quality: int = Query(0, ge=0, le=100, description="최소 품질 점수"),
@@ -144,24 +254,27 @@ async def search_vector(
     start_time = time.time()
     
     try:
-        # 쿼리 임베딩
-        query_emb = embedding_pipeline.embed(query)
+        # 쿼리 임베딩 (동시 요청과 함께 배치 처리)
+        query_embedding = await query_batcher.embed(query)
         
         # 검색
-        results = db.search_vector(
-            query_embedding=query_emb.embedding,
+        results = await run_in_threadpool(
+            db.search_vector,
+            query_embedding=query_embedding,
             limit=limit,
             min_quality=min_quality,
             section_filter=section,
-            lang_filter=lang
+            lang_filter=lang,
+            text_limit=RESPONSE_TEXT_LIMIT
         )
         
         # 응답 생성
         duration_ms = int((time.time() - start_time) * 1000)
         
-        # 검색 로그
+        # 검색 로그 (응답을 보낸 뒤 백그라운드에서 기록)
         if results:
-            db.log_search(
+            background_tasks.add_task(
+                db.log_search,
                 query=query,
                 search_type='vector',
                 results_count=len(results),
@@ -180,7 +293,7 @@ async def search_vector(
                     lab_name=r.lab_name,
                     section=r.section,
                     title=r.title,
-                    text=r.text[:500],  # 텍스트 길이 제한
+                    text=r.text,  # DB에서 RESPONSE_TEXT_LIMIT자로 잘라서 가져옴
                     score=r.score,
                     vector_score=r.vector_score
                 )
@@ -196,6 +309,7 @@ async def search_vector(
 
 @app.get("/search/hybrid", response_model=SearchResponse)
 async def search_hybrid(
+    background_tasks: BackgroundTasks,
     query: str = Query(..., description="검색 쿼리", min_length=1),
     limit: int = Query(10, ge=1, le=50),
     vector_weight: float = Query(0.7, ge=0.0, le=1.0),
@@ -217,25 +331,28 @@ async def search_hybrid(
     start_time = time.time()
     
     try:
-        # 쿼리 임베딩
-        query_emb = embedding_pipeline.embed(query)
+        # 쿼리 임베딩 (동시 요청과 함께 배치 처리)
+        query_embedding = await query_batcher.embed(query)
         
         # 하이브리드 검색
-        results = db.search_hybrid(
+        results = await run_in_threadpool(
+            db.search_hybrid,
             query_text=query,
-            query_embedding=query_emb.embedding,
+            query_embedding=query_embedding,
             limit=limit,
             vector_weight=vector_weight,
             keyword_weight=keyword_weight,
             min_quality=min_quality,
-            section_filter=section
+            section_filter=section,
+            text_limit=RESPONSE_TEXT_LIMIT
         )
         
         duration_ms = int((time.time() - start_time) * 1000)
         
-        # 로그
+        # 로그 (응답을 보낸 뒤 백그라운드에서 기록)
         if results:
-            db.log_search(
+            background_tasks.add_task(
+                db.log_search,
                 query=query,
                 search_type='hybrid',
                 results_count=len(results),
@@ -254,7 +371,7 @@ async def search_hybrid(
                     lab_name=r.lab_name,
                     section=r.section,
                     title=r.title,
-                    text=r.text[:500],
+                    text=r.text,
                     score=r.score,
                     vector_score=r.vector_score,
                     keyword_score=r.keyword_score
@@ -273,7 +390,7 @@ async def search_hybrid(
 async def get_stats():
     """데이터베이스 통계"""
     try:
-        stats = db.get_stats()
+        stats = await run_in_threadpool(db.get_stats)
         
         return StatsResponse(
             total_labs=stats['total_labs'],
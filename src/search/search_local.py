@@ -18,6 +18,9 @@ PostgreSQL 없이 JSON 파일에서 벡터 검색을 수행합니다.
     
     # 통계 보기
     python search_local.py --mode stats
+    
+    # ONNX Runtime으로 쿼리 임베딩 (sentence-transformers>=3.2, onnxruntime 필요)
+    python search_local.py --backend onnx
 
 동작 원리:
     1. crawl_data/ 폴더에서 JSON 파일 로드
@@ -27,11 +30,35 @@ PostgreSQL 없이 JSON 파일에서 벡터 검색을 수행합니다.
 """
 
 from storage.local_storage import LocalVectorStore
-from core.embedding import EmbeddingPipeline
+from core.embedding import EmbeddingPipeline, EmbeddingConfig
 import sys
 
 
-def search_local(query: str, limit: int = 5, data_dir: str = './crawl_data'):
+def _load_pipeline(
+    backend: str = EmbeddingConfig.DEFAULT_BACKEND,
+    precision: str = EmbeddingConfig.DEFAULT_PRECISION
+) -> EmbeddingPipeline:
+    """
+    검색용 임베딩 파이프라인 로드
+    
+    backend='onnx'/'openvino'는 그래프 최적화된 런타임으로 추론하고,
+    precision='bf16'은 bf16 연산을 지원하는 CPU에서 쿼리 지연을 줄입니다.
+    """
+    return EmbeddingPipeline(
+        model_name='multilingual-mpnet',
+        device='cpu',
+        backend=backend,
+        precision=precision
+    )
+
+
+def search_local(
+    query: str,
+    limit: int = 5,
+    data_dir: str = './crawl_data',
+    backend: str = EmbeddingConfig.DEFAULT_BACKEND,
+    precision: str = EmbeddingConfig.DEFAULT_PRECISION
+):
     """
     로컬 저장소 검색 함수
     
@@ -39,6 +66,8 @@ def search_local(query: str, limit: int = 5, data_dir: str = './crawl_data'):
         query: 검색어 (예: "컴퓨터 비전과 딥러닝")
         limit: 최대 결과 개수 (기본 5개)
         data_dir: 데이터 디렉토리 경로 (기본 './crawl_data')
+        backend: 임베딩 추론 백엔드 ('torch', 'onnx', 'openvino')
+        precision: 임베딩 추론 정밀도 ('auto', 'fp32', 'fp16', 'bf16')
     
     동작 과정:
         1. JSON 파일에서 저장된 데이터 로드
@@ -66,7 +95,7 @@ def search_local(query: str, limit: int = 5, data_dir: str = './crawl_data'):
     
     # 2. 임베딩 파이프라인
     print("\n2. 임베딩 모델 로딩...")
-    pipeline = EmbeddingPipeline(model_name='multilingual-mpnet', device='cpu')
+    pipeline = _load_pipeline(backend, precision)
     
     # 3. 쿼리 임베딩
     print(f"\n3. 쿼리 임베딩 생성: '{query}'")
@@ -103,8 +132,16 @@ def search_local(query: str, limit: int = 5, data_dir: str = './crawl_data'):
     print("="*80)
 
 
-def interactive_search(data_dir: str = './crawl_data'):
-    """대화형 검색"""
+def interactive_search(
+    data_dir: str = './crawl_data',
+    backend: str = EmbeddingConfig.DEFAULT_BACKEND,
+    precision: str = EmbeddingConfig.DEFAULT_PRECISION
+):
+    """
+    대화형 검색
+    
+    저장소와 임베딩 모델은 시작할 때 한 번만 로드하고 모든 검색에서 재사용합니다.
+    """
     print("="*80)
     print("로컬 벡터 검색 - 대화형 모드")
     print("="*80)
@@ -112,7 +149,7 @@ def interactive_search(data_dir: str = './crawl_data'):
     
     # 저장소 & 파이프라인 초기화
     store = LocalVectorStore(data_dir=data_dir)
-    pipeline = EmbeddingPipeline(model_name='multilingual-mpnet', device='cpu')
+    pipeline = _load_pipeline(backend, precision)
     
     stats = store.get_stats()
     print(f"📊 저장소 정보: 연구실 {stats['total_labs']}개, 문서 {stats['total_docs']}개\n")
@@ -193,6 +230,12 @@ if __name__ == "__main__":
     parser.add_argument('--query', '-q', type=str, help='검색어 (search 모드)')
     parser.add_argument('--limit', '-l', type=int, default=5, help='결과 개수')
     parser.add_argument('--data-dir', '-d', type=str, default='./crawl_data', help='데이터 디렉토리')
+    parser.add_argument('--backend', choices=EmbeddingConfig.SUPPORTED_BACKENDS,
+                        default=EmbeddingConfig.DEFAULT_BACKEND,
+                        help='임베딩 추론 백엔드 (onnx/openvino: 그래프 최적화 런타임)')
+    parser.add_argument('--precision', choices=EmbeddingConfig.SUPPORTED_PRECISIONS,
+                        default=EmbeddingConfig.DEFAULT_PRECISION,
+                        help='임베딩 추론 정밀도 (CPU에서 bf16 지원 시 bf16 권장)')
     
     args = parser.parse_args()
     
@@ -201,10 +244,10 @@ if __name__ == "__main__":
             print("❌ search 모드에서는 --query 옵션이 필요합니다")
             print("예: python search_local.py --mode search --query '컴퓨터 비전'")
             sys.exit(1)
-        search_local(args.query, args.limit, args.data_dir)
+        search_local(args.query, args.limit, args.data_dir, args.backend, args.precision)
     
     elif args.mode == 'interactive':
-        interactive_search(args.data_dir)
+        interactive_search(args.data_dir, args.backend, args.precision)
     
     elif args.mode == 'stats':
         show_stats(args.data_dir)
@@ -3,17 +3,33 @@
 불용어 제거 + 부정 필터링 추가
 """
 
-from typing import List, Dict, Set, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Set, Tuple, Optional, Sequence
+from dataclasses import dataclass, field
 import numpy as np
-from rank_bm25 import BM25Okapi
+import orjson
 from sentence_transformers import SentenceTransformer
+import hashlib
 import json
+import math
+import os
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
-# 🔧 한국어/영어 불용어
-STOPWORDS = {
+try:
+    import simsimd  # 선택: pip install simsimd (의미 점수를 SIMD 커널로 계산)
+except ImportError:
+    simsimd = None
+
+try:
+    import ahocorasick  # 선택: pip install pyahocorasick (도메인 용어를 한 번의 스캔으로 검색)
+except ImportError:
+    ahocorasick = None
+
+# 🔧 한국어/영어 불용어 (불변 집합 - 인덱스 캐시 키에도 포함되므로 실행 중 수정 금지)
+STOPWORDS = frozenset({
     # 한국어 일반 단어
     '연구', '개발', '시스템', '기술', '응용', '분석', '설계', '구현',
     '이론', '기반', '관련', '등', '및', '를', '을', '는', '은', '이', '가',
@@ -25,7 +41,7 @@ STOPWORDS = {
     'application', 'applications', 'analysis', 'design', 'implementation',
     'theory', 'based', 'and', 'or', 'the', 'a', 'an', 'of', 'for', 
     'in', 'on', 'at', 'to', 'from', 'with', 'laboratory'
-}
+})
 
 # 도메인 키워드 사전
 RESEARCH_KEYWORDS = {
@@ -88,6 +104,117 @@ RESEARCH_KEYWORDS = {
 }
 
 
+# 용어 단위 테이블 (RESEARCH_KEYWORDS를 평탄화, 용어 인덱스 → 카테고리 인덱스)
+_CATEGORY_NAMES = list(RESEARCH_KEYWORDS)
+_TERMS = [term for data in RESEARCH_KEYWORDS.values() for term in data['terms']]
+_TERM_CATEGORY = np.array([
+    category_idx
+    for category_idx, data in enumerate(RESEARCH_KEYWORDS.values())
+    for _ in data['terms']
+], dtype=np.int64)
+
+# 용어 → 카테고리 원-핫 행렬 (용어 수 × 카테고리 수)
+# 용어 매칭 벡터 @ 원-핫 = 카테고리별 매칭 용어 수
+_CATEGORY_ONEHOT = np.zeros((len(_TERMS), len(_CATEGORY_NAMES)), dtype=np.int64)
+_CATEGORY_ONEHOT[np.arange(len(_TERMS)), _TERM_CATEGORY] = 1
+
+# 카테고리별 가중치와 용어 수 (RESEARCH_KEYWORDS 순서)
+_CATEGORY_WEIGHTS = np.array([data['weight'] for data in RESEARCH_KEYWORDS.values()])
+_CATEGORY_TERM_TOTALS = _CATEGORY_ONEHOT.sum(axis=0)
+
+# 용어 인덱스 → 카테고리 비트 (카테고리 집합을 정수 비트마스크 하나로 표현)
+assert len(_CATEGORY_NAMES) <= 64, "카테고리 비트마스크는 uint64 하나에 담아야 함"
+_TERM_CATEGORY_BITS = [1 << category_idx for category_idx in _TERM_CATEGORY.tolist()]
+
+
+def _build_term_automaton():
+    """모든 도메인 용어를 담은 Aho-Corasick 오토마톤 (값: 용어 인덱스들, pyahocorasick이 없으면 None)"""
+    if ahocorasick is None:
+        return None
+    
+    term_indices = defaultdict(list)
+    for term_idx, term in enumerate(_TERMS):
+        term_indices[term].append(term_idx)
+    
+    automaton = ahocorasick.Automaton()
+    for term, indices in term_indices.items():
+        automaton.add_word(term, tuple(indices))
+    automaton.make_automaton()
+    return automaton
+
+
+_TERM_AUTOMATON = _build_term_automaton()
+
+
+def _term_hits(text_lower: str) -> List[int]:
+    """소문자 텍스트에 (부분 문자열로) 등장하는 도메인 용어 인덱스 목록"""
+    if _TERM_AUTOMATON is not None:
+        # 오토마톤 한 번의 스캔으로 모든 용어 위치를 찾음 (겹치는 용어 포함)
+        return list({idx for _, indices in _TERM_AUTOMATON.iter(text_lower) for idx in indices})
+    return [term_idx for term_idx, term in enumerate(_TERMS) if term in text_lower]
+
+
+def _term_mask(text_lower: str) -> np.ndarray:
+    """소문자 텍스트에 등장하는 도메인 용어 여부 (용어 수,)"""
+    mask = np.zeros(len(_TERMS), dtype=bool)
+    mask[_term_hits(text_lower)] = True
+    return mask
+
+
+def _category_term_counts(text_lower: str) -> np.ndarray:
+    """카테고리별로 텍스트에 등장한 용어 수 (RESEARCH_KEYWORDS 순서)"""
+    return _term_mask(text_lower) @ _CATEGORY_ONEHOT
+
+
+def _category_bits(text_lower: str) -> int:
+    """텍스트에 용어가 하나라도 등장한 카테고리의 비트마스크 (비트 i = RESEARCH_KEYWORDS i번째)"""
+    bits = 0
+    for term_idx in _term_hits(text_lower):
+        bits |= _TERM_CATEGORY_BITS[term_idx]
+    return bits
+
+
+def _category_bits_mask(bits: int) -> np.ndarray:
+    """카테고리 비트마스크 → bool 배열 (카테고리 수,)"""
+    return np.array([(bits >> i) & 1 for i in range(len(_CATEGORY_NAMES))], dtype=bool)
+
+
+def _categories_in(text_lower: str) -> Set[str]:
+    """텍스트에 용어가 하나라도 등장한 카테고리 집합"""
+    bits = _category_bits(text_lower)
+    return {name for i, name in enumerate(_CATEGORY_NAMES) if (bits >> i) & 1}
+
+
+def _category_scores(lab_counts: np.ndarray) -> np.ndarray:
+    """
+    카테고리별 도메인 점수 min(매칭 비율 × 3, 1) × 가중치 (랩실 수, 카테고리 수)
+    
+    쿼리와 무관하므로 랩실 쪽은 초기화 때 한 번만 계산 (매칭 용어가 없으면 0)
+    """
+    match_ratio = lab_counts / _CATEGORY_TERM_TOTALS
+    return np.minimum(match_ratio * 3, 1.0) * _CATEGORY_WEIGHTS
+
+
+def _domain_scores(query_mask: np.ndarray, lab_scores: np.ndarray) -> np.ndarray:
+    """
+    keyword_match_score를 모든 랩실에 대해 한 번에 계산
+    
+    Args:
+        query_mask: 쿼리에 등장한 카테고리 여부 (카테고리 수,)
+        lab_scores: 랩실별 카테고리 점수 (랩실 수, 카테고리 수) - _category_scores 결과
+    """
+    # 쿼리에 등장한 카테고리 열만 골라서 랩실별로 합산 (파이썬 반복 없음)
+    active = lab_scores[:, query_mask]
+    total_score = active.sum(axis=1)
+    matched_count = np.count_nonzero(active, axis=1)
+    
+    return np.where(
+        matched_count > 0,
+        np.minimum(total_score / np.maximum(matched_count, 1), 1.0),
+        0.0
+    )
+
+
 def tokenize_with_stopwords(text: str) -> List[str]:
     """불용어를 제거한 토큰화"""
     tokens = text.lower().split()
@@ -96,58 +223,149 @@ def tokenize_with_stopwords(text: str) -> List[str]:
     return filtered_tokens
 
 
-def keyword_match_score(query: str, lab_text: str) -> float:
-    """도메인 키워드 기반 매칭 점수"""
-    query_lower = query.lower()
-    lab_lower = lab_text.lower()
+@lru_cache(maxsize=512)
+def _tokenize_query(query: str) -> Tuple[str, ...]:
+    """쿼리 토큰화 캐시 (같은 쿼리가 반복되면 다시 나누지 않음)"""
+    return tuple(tokenize_with_stopwords(query))
+
+
+class EagerBM25:
+    """
+    BM25 점수를 인덱싱 시점에 미리 계산해 두는 BM25 (rank_bm25.BM25Okapi와 같은 식/결과)
+    
+    단어별 (랩실 인덱스, 점수) 목록을 CSR 형태 배열(indptr, doc_ids, weights)로 보관하고,
+    쿼리 점수는 쿼리 단어들의 행을 이어 붙여 np.bincount 한 번으로 합산
+    """
+    
+    # 저장(state) 형식이나 점수 식/기본 파라미터가 바뀌면 올림 (캐시 키에 포함)
+    CACHE_VERSION = 1
     
-    total_score = 0.0
-    matched_categories = []
+    # state()로 저장하는 배열/값 이름
+    _STATE_FIELDS = ('doc_ids', 'weights', 'indptr', 'idf', 'corpus_size', 'avgdl', 'k1', 'b', 'epsilon')
     
-    for category, data in RESEARCH_KEYWORDS.items():
-        query_matches = [term for term in data['terms'] if term in query_lower]
+    def __init__(self, corpus: List[List[str]], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
         
-        if query_matches:
-            lab_matches = [term for term in data['terms'] if term in lab_lower]
-            
-            if lab_matches:
-                match_ratio = len(lab_matches) / len(data['terms'])
-                category_score = min(match_ratio * 3, 1.0) * data['weight']
-                total_score += category_score
-                matched_categories.append(category)
+        # 단어 → 행 번호 (코퍼스에 처음 등장한 순서)
+        self.vocab: Dict[str, int] = {}
+        rows, doc_ids, freqs = [], [], []
+        doc_len = np.zeros(len(corpus), dtype=np.int64)
+        for doc_idx, document in enumerate(corpus):
+            doc_len[doc_idx] = len(document)
+            for word, freq in Counter(document).items():
+                rows.append(self.vocab.setdefault(word, len(self.vocab)))
+                doc_ids.append(doc_idx)
+                freqs.append(freq)
+        
+        rows = np.array(rows, dtype=np.int64)
+        doc_ids = np.array(doc_ids, dtype=np.int64)
+        freqs = np.array(freqs, dtype=np.int64)
+        self.avgdl = int(doc_len.sum()) / max(self.corpus_size, 1)
+        
+        # IDF (음수면 epsilon × 평균 IDF로 바닥값)
+        doc_counts = np.bincount(rows, minlength=len(self.vocab))
+        idf = [
+            math.log(self.corpus_size - count + 0.5) - math.log(count + 0.5)
+            for count in doc_counts.tolist()
+        ]
+        average_idf = sum(idf) / max(len(idf), 1)
+        idf = np.array(idf)
+        idf[idf < 0] = self.epsilon * average_idf
+        self.idf = idf
+        
+        weights = idf[rows] * (
+            freqs * (k1 + 1) /
+            (freqs + k1 * (1 - b + b * doc_len[doc_ids] / self.avgdl))
+        )
+        
+        # 단어(행) 순으로 정렬 - 같은 단어 안에서는 랩실 순서 유지
+        order = np.argsort(rows, kind='stable')
+        self.doc_ids = doc_ids[order]
+        self.weights = weights[order]
+        self.indptr = np.concatenate([[0], np.cumsum(doc_counts)])
     
-    if matched_categories:
-        return min(total_score / len(matched_categories), 1.0)
-    return 0.0
+    def state(self, prefix: str = '') -> Dict[str, np.ndarray]:
+        """np.savez로 저장할 수 있는 배열 딕셔너리 (from_state로 복원)"""
+        state = {prefix + name: np.asarray(getattr(self, name)) for name in self._STATE_FIELDS}
+        state[prefix + 'vocab'] = np.array(list(self.vocab), dtype=str)
+        return state
+    
+    @classmethod
+    def from_state(cls, state, prefix: str = '') -> 'EagerBM25':
+        """state()로 저장한 배열에서 인덱스 복원 (코퍼스 토큰화/가중치 계산 없음)"""
+        bm25 = cls.__new__(cls)
+        bm25.vocab = {word: row for row, word in enumerate(state[prefix + 'vocab'].tolist())}
+        bm25.doc_ids = state[prefix + 'doc_ids']
+        bm25.weights = state[prefix + 'weights']
+        bm25.indptr = state[prefix + 'indptr']
+        bm25.idf = state[prefix + 'idf']
+        bm25.corpus_size = int(state[prefix + 'corpus_size'])
+        for name in ('avgdl', 'k1', 'b', 'epsilon'):
+            setattr(bm25, name, float(state[prefix + name]))
+        return bm25
+    
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """토큰화된 쿼리의 랩실별 BM25 점수 (랩실 수,)"""
+        rows = [self.vocab[token] for token in query if token in self.vocab]
+        if not rows:
+            return np.zeros(self.corpus_size)
+        
+        spans = [slice(self.indptr[row], self.indptr[row + 1]) for row in rows]
+        return np.bincount(
+            np.concatenate([self.doc_ids[span] for span in spans]),
+            weights=np.concatenate([self.weights[span] for span in spans]),
+            minlength=self.corpus_size
+        )
+
+
+def keyword_match_score(query: str, lab_text: str) -> float:
+    """도메인 키워드 기반 매칭 점수"""
+    query_mask = _category_bits_mask(_category_bits(query.lower()))
+    lab_counts = _category_term_counts(lab_text.lower())
+    return float(_domain_scores(query_mask, _category_scores(lab_counts[np.newaxis, :]))[0])
 
 
 def get_query_categories(query: str) -> Set[str]:
     """쿼리의 카테고리 추출"""
-    query_lower = query.lower()
-    categories = set()
-    
-    for category, data in RESEARCH_KEYWORDS.items():
-        if any(term in query_lower for term in data['terms']):
-            categories.add(category)
-    
-    return categories
+    return _categories_in(query.lower())
 
 
 def get_lab_categories(lab_text: str) -> Set[str]:
     """랩실의 카테고리 추출"""
-    lab_lower = lab_text.lower()
-    categories = set()
+    return _categories_in(lab_text.lower())
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 상위 k개의 인덱스 (높은 순, 동점이면 앞 인덱스 먼저)
     
-    for category, data in RESEARCH_KEYWORDS.items():
-        if any(term in lab_lower for term in data['terms']):
-            categories.add(category)
+    전체 정렬(O(N log N)) 대신 k번째 점수만 찾아서 골라낸 뒤 k개만 정렬 (O(N + k log k))
+    sorted(..., reverse=True)[:k]와 같은 결과
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    
+    if k < len(scores):
+        kth_score = -np.partition(-scores, k - 1)[k - 1]
+        above = np.flatnonzero(scores > kth_score)
+        ties = np.flatnonzero(scores == kth_score)[:k - len(above)]
+        top = np.concatenate([above, ties])
+    else:
+        top = np.arange(len(scores))
     
-    return categories
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+# Python 3.10+에서는 __slots__로 생성 (인스턴스별 __dict__ 없음 → 메모리 절약, 속성 접근 빠름)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Lab:
-    """연구실 정보 데이터 클래스"""
+    """연구실 정보 데이터 클래스 (불변, 해시 가능)"""
     id: str
     name: str
     professor: str
@@ -155,29 +373,72 @@ class Lab:
     homepage: str = ""
     location: str = ""
     department: str = ""  # 학과
-    sections: Dict[str, str] = None  # 섹션별 텍스트 (재랭킹용)
+    sections: Dict[str, str] = field(default=None, hash=False)  # 섹션별 텍스트 (재랭킹용)
     
     def __post_init__(self):
         if self.sections is None:
-            self.sections = {}
+            object.__setattr__(self, 'sections', {})
     
     def get_search_text(self) -> str:
         """name + description만 사용"""
         return f"{self.name} {self.description}"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Student:
-    """학생 정보 데이터 클래스"""
+    """학생 정보 데이터 클래스 (불변, 해시 가능)"""
     research_interests: str
 
 
+# 연구실 레코드(구조화 배열)에 담는 설명 앞부분 길이
+LAB_RECORD_DESCRIPTION_CHARS = 256
+
+
+def _build_lab_records(labs: List[Lab]) -> np.ndarray:
+    """
+    연구실 목록 → NumPy 구조화 배열 (id, name, professor, description 앞부분)
+    
+    출력용 필드를 한 번만 잘라서 연속 저장 → 상위 k개는 인덱스 배열 하나로 추출
+    문자열 폭은 데이터의 최대 길이에 맞춤 (설명만 LAB_RECORD_DESCRIPTION_CHARS자로 자름)
+    """
+    columns = {
+        'id': [lab.id for lab in labs],
+        'name': [lab.name for lab in labs],
+        'professor': [lab.professor for lab in labs],
+        'description': [lab.description[:LAB_RECORD_DESCRIPTION_CHARS] for lab in labs],
+    }
+    dtype = np.dtype([
+        (field, f"U{max(map(len, values), default=0) or 1}")
+        for field, values in columns.items()
+    ])
+    return np.array(list(zip(*columns.values())), dtype=dtype)
+
+
 class CandidateGenerator:
     """
     키워드 검색 + 의미 검색을 결합하여 후보 랩실 추출
     [최종 개선 버전 v2: 불용어 제거 + 부정 필터링]
     """
     
+    SUPPORTED_EMBEDDING_PRECISIONS = ('float32', 'float16', 'int8')
+    SUPPORTED_EMBEDDING_BACKENDS = ('torch', 'onnx', 'openvino')
+    
+    # 쿼리 임베딩 캐시 크기 (같은 관심사 문장은 다시 인코딩하지 않음)
+    QUERY_CACHE_SIZE = 1024
+    
+    # 랩실이 이보다 많고 CUDA가 있으면 의미 점수를 GPU(fp16)에서 계산
+    GPU_MIN_LABS = 10_000
+    
+    # float16/int8 정밀도 + simsimd 없음: 한 번에 float32로 복원하는 랩실 수 (캐시에 들어가는 크기)
+    SCORE_BLOCK_ROWS = 8192
+    
+    # 랩실이 이보다 많고 CPU가 여러 개면 토큰화를 프로세스 풀로 나눠서 처리
+    # (프로세스 시작/결과 전달 비용 때문에 작은 데이터에서는 단일 프로세스가 더 빠름)
+    PARALLEL_TOKENIZE_MIN_LABS = 50_000
+    
+    # 랩실 임베딩 인코딩 배치 크기
+    ENCODE_BATCH_SIZE = 64
+    
     def __init__(
         self, 
         labs_json_path: str = "./data/crawl_data/labs.json",
@@ -185,7 +446,13 @@ class CandidateGenerator:
         keyword_weight: float = 0.5,
         semantic_weight: float = 0.5,
         use_domain_keywords: bool = True,
-        use_negative_filtering: bool = True  # 🔧 부정 필터링
+        use_negative_filtering: bool = True,  # 🔧 부정 필터링
+        embedding_precision: str = 'float32',
+        embedding_backend: str = 'torch',
+        embedding_cache_dir: Optional[str] = "./data/cache",
+        keep_fp32_embeddings: bool = False,
+        use_gpu: bool = True,
+        embedding_model_file: Optional[str] = None
     ):
         """
         Args:
@@ -195,13 +462,58 @@ class CandidateGenerator:
             semantic_weight: 의미 검색 가중치
             use_domain_keywords: 도메인 키워드 사용 여부
             use_negative_filtering: 부정 필터링 사용 여부
+            embedding_precision: 의미 검색 임베딩 정밀도 ('float32', 'float16', 'int8')
+                float16은 메모리/대역폭 1/2, int8은 1/4 (순위 변화는 거의 없음)
+            embedding_backend: 임베딩 추론 백엔드 ('torch', 'onnx', 'openvino')
+                onnx/openvino는 sentence-transformers>=3.2 필요 (그래프 최적화된 추론)
+            embedding_cache_dir: 랩실 임베딩(.npy)과 BM25/도메인 용어 인덱스(.npz) 캐시 폴더 (None이면 캐시 안 함)
+                모델명 + 랩실 데이터가 같으면 다음 실행부터 인코딩 없이 mmap으로 로드
+            keep_fp32_embeddings: float16/int8 정밀도에서도 float32 행렬(lab_embeddings)을 유지할지 여부
+                기본은 변환 후 해제 (메모리 2~4배 절약)
+            use_gpu: 랩실이 GPU_MIN_LABS개 이상이고 CUDA가 있으면 GPU에서 의미 점수 계산
+                (float32/float16 정밀도 전용, GPU에는 fp16으로 올림)
+            embedding_model_file: onnx/openvino 백엔드에서 불러올 모델 파일 (None이면 기본 model.onnx)
+                예: 'onnx/model_O3.onnx' (그래프 최적화), 'onnx/model_qint8_avx512_vnni.onnx' (INT8 동적 양자화)
+                sentence_transformers의 export_optimized_onnx_model / export_dynamic_quantized_onnx_model로 생성
         """
+        if embedding_precision not in self.SUPPORTED_EMBEDDING_PRECISIONS:
+            raise ValueError(f"지원하지 않는 임베딩 정밀도: {embedding_precision}")
+        if embedding_backend not in self.SUPPORTED_EMBEDDING_BACKENDS:
+            raise ValueError(f"지원하지 않는 백엔드: {embedding_backend}")
+        if embedding_model_file and embedding_backend == 'torch':
+            raise ValueError("embedding_model_file은 onnx/openvino 백엔드에서만 사용할 수 있습니다")
+        self.embedding_precision = embedding_precision
+        self.embedding_backend = embedding_backend
+        self.embedding_model_name = embedding_model_name
+        self.embedding_model_file = embedding_model_file
+        self.embedding_cache_dir = embedding_cache_dir
+        self.keep_fp32_embeddings = keep_fp32_embeddings
+        self.use_gpu = use_gpu
+        self._query_embedding_cache = OrderedDict()
+        
         print("📂 데이터 로딩 중...")
         self.labs = self._load_labs_from_json(labs_json_path)
+        self.labs_by_id: Dict[str, Lab] = {lab.id: lab for lab in self.labs}
+        self._lab_index = {lab.id: idx for idx, lab in enumerate(self.labs)}
+        self.lab_records = _build_lab_records(self.labs)
         print(f"✅ {len(self.labs)}개 연구실 로드 완료")
         
+        # 검색 텍스트 (BM25, 도메인 인덱스, 임베딩에서 공유)
+        self._prepare_search_texts()
+        
+        # BM25 + 도메인 용어 인덱스 (캐시에 있으면 토큰화/스캔 없이 로드)
+        # 모델 로딩 전에 계산 → 토큰화 프로세스 풀이 모델이 올라간 프로세스를 복제하지 않음
+        self._prepare_keyword_indexes()
+        
         print("🤖 임베딩 모델 로딩 중...")
-        self.embedding_model = SentenceTransformer(embedding_model_name)
+        model_kwargs = {}
+        if embedding_backend != 'torch':
+            # ONNX Runtime / OpenVINO
+            model_kwargs['backend'] = embedding_backend
+            if embedding_model_file:
+                # 최적화/양자화된 모델 파일 (같은 모델 저장소 안의 경로)
+                model_kwargs['model_kwargs'] = {'file_name': embedding_model_file}
+        self.embedding_model = SentenceTransformer(embedding_model_name, **model_kwargs)
         print("✅ 모델 로드 완료")
         
         # 설정
@@ -216,19 +528,15 @@ class CandidateGenerator:
         if use_negative_filtering:
             print("🚫 부정 필터링 활성화")
         
-        # BM25 인덱스 준비 (불용어 제거 적용)
-        print("🔍 BM25 인덱스 준비 중 (불용어 제거)...")
-        self._prepare_bm25_index()
-        
         # E5 임베딩 벡터 사전 계산
         print("🧠 임베딩 벡터 사전 계산 중...")
         self._prepare_embeddings()
         print("✅ 초기화 완료!\n")
     
     def _load_labs_from_json(self, labs_path: str) -> List[Lab]:
-        """labs.json만 로드"""
-        with open(labs_path, 'r', encoding='utf-8') as f:
-            labs_data = json.load(f)
+        """labs.json만 로드 (orjson으로 바이트를 한 번에 파싱)"""
+        with open(labs_path, 'rb') as f:
+            labs_data = orjson.loads(f.read())
         
         labs = []
         for lab_id, lab_info in labs_data.items():
@@ -244,37 +552,278 @@ class CandidateGenerator:
         
         return labs
     
+    def _prepare_search_texts(self):
+        """랩실 검색 텍스트와 소문자 텍스트를 한 번만 계산"""
+        self._search_texts = [lab.get_search_text() for lab in self.labs]
+        self._lab_texts_lower = [text.lower() for text in self._search_texts]
+    
+    def _cache_path(self, prefix: str, extension: str, key_parts: list) -> Optional[str]:
+        """
+        embedding_cache_dir 안의 캐시 파일 경로 (캐시를 안 쓰면 None)
+        
+        키는 (key_parts + 랩실 id/텍스트)의 해시 → 데이터나 설정이 바뀌면 새 파일
+        """
+        if not self.embedding_cache_dir:
+            return None
+        key_source = json.dumps(
+            [*key_parts, [[lab.id, text] for lab, text in zip(self.labs, self._search_texts)]],
+            ensure_ascii=False
+        )
+        key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.embedding_cache_dir, f"{prefix}_{key}.{extension}")
+    
+    def _prepare_keyword_indexes(self):
+        """
+        BM25 인덱스 + 도메인 용어 행렬 준비
+        
+        embedding_cache_dir가 있으면 .npz로 저장하고 다음 실행부터는 토큰화/용어 스캔 없이 로드
+        (불용어, 도메인 용어 사전, BM25 파라미터도 키에 포함)
+        """
+        cache_path = self._cache_path(
+            'index', 'npz', [sorted(STOPWORDS), _TERMS, EagerBM25.CACHE_VERSION]
+        )
+        
+        if cache_path and os.path.exists(cache_path):
+            print(f"💾 키워드 인덱스 캐시 사용: {cache_path}")
+            with np.load(cache_path) as data:
+                self.bm25 = EagerBM25.from_state(data, prefix='bm25_')
+                self._prepare_domain_index(data['lab_term_matrix'])
+            return
+        
+        # BM25 인덱스 준비 (불용어 제거 적용)
+        print("🔍 BM25 인덱스 준비 중 (불용어 제거)...")
+        self._prepare_bm25_index()
+        
+        # 랩실별 도메인 용어 매칭 사전 계산
+        self._prepare_domain_index()
+        
+        if cache_path:
+            os.makedirs(self.embedding_cache_dir, exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, lab_term_matrix=self.lab_term_matrix, **self.bm25.state(prefix='bm25_'))
+            os.replace(tmp_path, cache_path)
+    
+    def _tokenize_corpus(self) -> List[List[str]]:
+        """랩실 텍스트 불용어 제거 토큰화 (대규모면 프로세스 풀로 나눠서)"""
+        if len(self.labs) >= self.PARALLEL_TOKENIZE_MIN_LABS and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(
+                    tokenize_with_stopwords, self._lab_texts_lower, chunksize=512
+                ))
+        return [tokenize_with_stopwords(text) for text in self._lab_texts_lower]
+    
     def _prepare_bm25_index(self):
-        """🔧 BM25 인덱스 준비 (불용어 제거 적용)"""
-        corpus = [lab.get_search_text() for lab in self.labs]
-        tokenized_corpus = [tokenize_with_stopwords(doc) for doc in corpus]
-        self.bm25 = BM25Okapi(tokenized_corpus)
+        """
+        🔧 BM25 인덱스 준비 (불용어 제거 적용)
+        
+        단어별 BM25 점수를 미리 계산 → 쿼리마다 전체 랩실을 파이썬으로 훑지 않고
+        쿼리 단어의 행만 더함
+        """
+        self.bm25 = EagerBM25(self._tokenize_corpus())
+    
+    def _prepare_domain_index(self, lab_term_matrix: Optional[np.ndarray] = None):
+        """
+        랩실별 도메인 용어 매칭 사전 계산 - 쿼리마다 랩실 텍스트를 다시 훑지 않음
+        
+        lab_term_matrix: 랩실 수 × 용어 수 (bool, 캐시에서 읽었으면 그대로 사용)
+        lab_category_counts: 랩실 수 × 카테고리 수 (= lab_term_matrix @ 원-핫)
+        lab_category_scores: 랩실 수 × 카테고리 수 (카테고리별 도메인 점수)
+        """
+        if lab_term_matrix is None:
+            # 랩실마다 용어 벡터를 따로 만들지 않고 행렬에 바로 기록
+            lab_term_matrix = np.zeros((len(self.labs), len(_TERMS)), dtype=bool)
+            for lab_idx, text in enumerate(self._lab_texts_lower):
+                lab_term_matrix[lab_idx, _term_hits(text)] = True
+        self.lab_term_matrix = lab_term_matrix
+        self.lab_category_counts = self.lab_term_matrix.astype(np.int64) @ _CATEGORY_ONEHOT
+        self.lab_category_scores = _category_scores(self.lab_category_counts)
+        
+        # 부정 필터링용 랩실 카테고리 비트마스크 (랩실 수,) uint64 - _category_bits와 같은 비트 배치
+        category_bits = np.uint64(1) << np.arange(len(_CATEGORY_NAMES), dtype=np.uint64)
+        self.lab_category_bits = np.bitwise_or.reduce(
+            np.where(self.lab_category_counts > 0, category_bits, np.uint64(0)),
+            axis=1
+        )
     
     def _prepare_embeddings(self):
-        """E5-small 임베딩 벡터 사전 계산"""
-        lab_texts = [lab.get_search_text() for lab in self.labs]
-        lab_texts_with_prefix = [f"passage: {text}" for text in lab_texts]
-        self.lab_embeddings = self.embedding_model.encode(
-            lab_texts_with_prefix, 
-            normalize_embeddings=True,
-            show_progress_bar=True
+        """
+        E5-small 임베딩 벡터 사전 계산
+        
+        embedding_cache_dir가 있으면 (모델명 + 랩실 id/텍스트) 해시를 키로 .npy에 저장하고,
+        다음 실행부터는 인코딩 없이 mmap으로 읽음 (데이터가 바뀌면 키가 달라져 새로 계산)
+        """
+        lab_texts = self._search_texts
+        
+        # 양자화된 모델 파일은 임베딩이 달라지므로 키에 포함 (기본 모델은 기존 키 유지)
+        model_id = self.embedding_model_name
+        if self.embedding_model_file:
+            model_id = f"{model_id}:{self.embedding_model_file}"
+        cache_path = self._cache_path('emb', 'npy', [model_id])
+        
+        if cache_path and os.path.exists(cache_path):
+            print(f"💾 임베딩 캐시 사용: {cache_path}")
+            lab_embeddings = np.load(cache_path, mmap_mode='r')
+        else:
+            lab_texts_with_prefix = [f"passage: {text}" for text in lab_texts]
+            lab_embeddings = self.embedding_model.encode(
+                lab_texts_with_prefix, 
+                batch_size=self.ENCODE_BATCH_SIZE,
+                normalize_embeddings=True,
+                show_progress_bar=True
+            )
+            lab_embeddings = np.ascontiguousarray(lab_embeddings, dtype=np.float32)
+            
+            if cache_path:
+                # 임시 파일에 쓴 뒤 교체 (중간에 죽어도 깨진 캐시가 남지 않음)
+                os.makedirs(self.embedding_cache_dir, exist_ok=True)
+                tmp_path = cache_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, lab_embeddings)
+                os.replace(tmp_path, cache_path)
+        
+        # SIMD 커널이 바로 읽을 수 있도록 연속된 float32 행렬로 보관
+        self.lab_embeddings = np.ascontiguousarray(lab_embeddings, dtype=np.float32)
+        
+        # float16: 정규화된 E5 임베딩은 반정밀도 반올림 오차에 둔감함
+        self.lab_embeddings_f16 = None
+        if self.embedding_precision == 'float16':
+            self.lab_embeddings_f16 = self.lab_embeddings.astype(np.float16)
+            if not self.keep_fp32_embeddings:
+                self.lab_embeddings = None
+        
+        # int8: 랩실별 대칭 스케일(127/최대 절댓값)로 양자화
+        self.lab_embeddings_i8 = None
+        self.lab_embedding_scales = None
+        if self.embedding_precision == 'int8':
+            max_abs = np.abs(self.lab_embeddings).max(axis=1)
+            max_abs[max_abs == 0] = 1.0
+            self.lab_embedding_scales = (127.0 / max_abs).astype(np.float32)
+            self.lab_embeddings_i8 = np.round(
+                self.lab_embeddings * self.lab_embedding_scales[:, np.newaxis]
+            ).astype(np.int8)
+            
+            # 검색은 int8 행렬만 사용하므로 float32 원본은 해제
+            if not self.keep_fp32_embeddings:
+                self.lab_embeddings = None
+        
+        self._prepare_gpu_embeddings()
+    
+    def _prepare_gpu_embeddings(self):
+        """대규모 랩실 데이터면 임베딩을 GPU에 fp16 텐서로 한 번만 올려 둠"""
+        self.lab_embeddings_gpu = None
+        if (
+            not self.use_gpu
+            or self.embedding_precision == 'int8'
+            or len(self.labs) < self.GPU_MIN_LABS
+        ):
+            return
+        
+        import torch
+        if not torch.cuda.is_available():
+            return
+        
+        source = self.lab_embeddings_f16 if self.lab_embeddings_f16 is not None else self.lab_embeddings
+        lab_embeddings = torch.from_numpy(np.array(source))
+        self.lab_embeddings_gpu = lab_embeddings.to('cuda', dtype=torch.float16).contiguous()
+        print(f"🚀 GPU 의미 검색 활성화 ({len(self.labs)}개 연구실, fp16)")
+    
+    def _semantic_scores(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        모든 랩실과의 코사인 유사도 (임베딩이 정규화되어 있으므로 내적 = 코사인)
+        
+        쿼리 여러 개를 (쿼리 수, 차원) 행렬로 받아서 한 번에 계산 → (쿼리 수, 랩실 수)
+        simsimd가 설치되어 있으면 AVX2/AVX-512/NEON 커널 사용, 없으면 numpy
+        """
+        query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+        if self.lab_embeddings_gpu is not None:
+            return self._semantic_scores_gpu(query_embeddings)
+        if self.lab_embeddings_i8 is not None:
+            return self._semantic_scores_int8(query_embeddings)
+        if self.lab_embeddings_f16 is not None:
+            return self._semantic_scores_fp16(query_embeddings)
+        
+        if simsimd is not None:
+            scores = simsimd.cdist(query_embeddings, self.lab_embeddings, metric='dot')
+            return np.asarray(scores, dtype=np.float32)
+        return np.dot(query_embeddings, self.lab_embeddings.T)
+    
+    def _semantic_scores_gpu(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        GPU에서 fp16 행렬 곱 한 번으로 유사도 계산 (점수만 CPU로 복사)
+        
+        점수 재조정(최소/최대)과 키워드 점수 결합에 전체 점수가 필요하므로 top-k 전에 가져옴
+        """
+        import torch
+        
+        queries = torch.from_numpy(query_embeddings).to(
+            self.lab_embeddings_gpu.device, dtype=torch.float16
         )
+        with torch.no_grad():
+            scores = queries @ self.lab_embeddings_gpu.T
+        return scores.float().cpu().numpy()
+    
+    def _semantic_scores_fp16(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        float16 임베딩으로 유사도 계산 (float32로 누적)
+        
+        simsimd가 있으면 f16 커널로 바로 계산, 없으면 블록 단위로 float32 복원 후 행렬 곱
+        (numpy의 float16 행렬 곱은 BLAS를 쓰지 않아 매우 느림)
+        """
+        if simsimd is not None:
+            query_f16 = query_embeddings.astype(np.float16)
+            scores = simsimd.cdist(query_f16, self.lab_embeddings_f16, metric='dot')
+            return np.asarray(scores, dtype=np.float32)
+        return self._blocked_dot(query_embeddings, self.lab_embeddings_f16)
+    
+    def _semantic_scores_int8(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        int8 임베딩으로 유사도 계산 (랩실별 스케일로 나눠서 복원)
+        
+        simsimd가 있으면 쿼리도 int8로 양자화해서 정수 내적 (AVX-512 VNNI),
+        없으면 블록 단위로 float32 복원 후 행렬 곱
+        """
+        if simsimd is not None:
+            max_abs = np.maximum(np.abs(query_embeddings).max(axis=1), 1e-12)
+            query_scales = (127.0 / max_abs)[:, np.newaxis]
+            query_i8 = np.round(query_embeddings * query_scales).astype(np.int8)
+            dots = simsimd.cdist(query_i8, self.lab_embeddings_i8, metric='dot')
+            scores = np.asarray(dots) / (query_scales * self.lab_embedding_scales)
+            return scores.astype(np.float32)
+        return self._blocked_dot(query_embeddings, self.lab_embeddings_i8) / self.lab_embedding_scales
+    
+    def _blocked_dot(self, query_embeddings: np.ndarray, lab_matrix: np.ndarray) -> np.ndarray:
+        """
+        저정밀도(float16/int8) 랩실 행렬과의 내적 (쿼리 수, 랩실 수)
+        
+        행렬 전체를 float32로 복사하지 않고 SCORE_BLOCK_ROWS행씩 복원해서 BLAS 행렬 곱
+        (메모리에서는 저정밀도로 읽고, 복원한 블록은 캐시 안에서 사용)
+        """
+        num_labs = len(lab_matrix)
+        scores = np.empty((len(query_embeddings), num_labs), dtype=np.float32)
+        for start in range(0, num_labs, self.SCORE_BLOCK_ROWS):
+            block = lab_matrix[start:start + self.SCORE_BLOCK_ROWS].astype(np.float32)
+            scores[:, start:start + len(block)] = np.dot(query_embeddings, block.T)
+        return scores
     
     def _normalize_keyword_scores(self, scores: np.ndarray) -> np.ndarray:
-        """키워드 점수 정규화 (0~1)"""
+        """키워드 점수 정규화 (0~1) - log1p 결과 배열 하나에서 제자리 계산"""
         log_scores = np.log1p(scores)
-        min_score = np.min(log_scores)
-        max_score = np.max(log_scores)
+        min_score = log_scores.min()
+        max_score = log_scores.max()
         
         if max_score - min_score < 1e-8:
             return np.zeros_like(scores)
         
-        normalized = (log_scores - min_score) / (max_score - min_score)
-        return normalized
+        log_scores -= min_score
+        log_scores /= max_score - min_score
+        return log_scores
     
     def _rescale_semantic_scores(self, scores: np.ndarray, threshold: float = 0.70) -> np.ndarray:
         """
         🔧 의미 점수 재조정 (threshold 상향: 0.65 → 0.70)
+        
+        threshold 이상인 점수는 한 번만 뽑아서 최소/최대 계산과 정규화에 같이 사용
         """
         scores_filtered = np.where(scores >= threshold, scores, 0.0)
         
@@ -282,40 +831,58 @@ class CandidateGenerator:
         if not np.any(nonzero_mask):
             return scores_filtered
         
-        min_score = np.min(scores_filtered[nonzero_mask])
-        max_score = np.max(scores_filtered[nonzero_mask])
+        values = scores_filtered[nonzero_mask]
+        min_score = values.min()
+        max_score = values.max()
         
         if max_score - min_score < 1e-8:
             scores_filtered[nonzero_mask] = 0.5
         else:
-            scores_filtered[nonzero_mask] = (
-                (scores_filtered[nonzero_mask] - min_score) / (max_score - min_score)
-            )
+            values -= min_score
+            values /= max_score - min_score
+            scores_filtered[nonzero_mask] = values
         
         return scores_filtered
     
-    def _filter_irrelevant_labs(self, query: str, lab: Lab, combined_score: float) -> bool:
+    def _filter_irrelevant_labs(
+        self,
+        query_bits: int,
+        combined_scores: np.ndarray
+    ) -> np.ndarray:
         """
-        🔧 [NEW] 명백히 관련 없는 연구실 필터링
+        🔧 [NEW] 명백히 관련 없는 연구실 필터링 (모든 랩실을 한 번에, 통과하면 True)
+        
+        쿼리 카테고리는 쿼리당 한 번, 랩실 카테고리는 초기화 때 비트마스크로 미리 계산
+        → 카테고리 겹침 확인은 랩실 전체에 uint64 AND 한 번
         """
+        passed = np.ones(len(combined_scores), dtype=bool)
         if not self.use_negative_filtering:
-            return True
+            return passed
         
-        # 1. 쿼리와 랩실의 카테고리 추출
-        query_categories = get_query_categories(query)
-        lab_text = lab.get_search_text()
-        lab_categories = get_lab_categories(lab_text)
+        # 1. 쿼리와 랩실의 카테고리
+        if not query_bits:
+            return passed
         
         # 2. 카테고리 겹침 확인
-        if query_categories and lab_categories:
-            overlap = query_categories & lab_categories
-            if not overlap:
-                # 카테고리가 전혀 안 겹침
-                # 단, 점수가 매우 높으면 (0.8 이상) 통과
-                if combined_score < 0.8:
-                    return False
+        # 카테고리가 전혀 안 겹치면 제외, 단 점수가 매우 높으면 (0.8 이상) 통과
+        lab_bits = self.lab_category_bits
+        no_overlap = (lab_bits != 0) & ((lab_bits & np.uint64(query_bits)) == 0)
+        passed[no_overlap & (combined_scores < 0.8)] = False
         
-        return True
+        return passed
+    
+    def get_lab(self, lab_id: str) -> Optional[Lab]:
+        """id로 연구실 조회 (없으면 None)"""
+        return self.labs_by_id.get(lab_id)
+    
+    def get_lab_records(self, lab_ids: List[str]) -> np.ndarray:
+        """id 목록 순서대로 연구실 레코드 추출 (구조화 배열, 출력용)"""
+        indices = np.fromiter(
+            (self._lab_index[lab_id] for lab_id in lab_ids),
+            dtype=np.int64,
+            count=len(lab_ids)
+        )
+        return self.lab_records[indices]
     
     def get_candidates_with_scores(
         self,
@@ -327,73 +894,154 @@ class CandidateGenerator:
         """
         query = student.research_interests
         
+        query_embeddings = self._encode_queries([query])
+        semantic_scores_raw = self._semantic_scores(query_embeddings)[0]
+        
+        return self._rank_candidates(query, semantic_scores_raw, final_top_k)
+    
+    def get_candidates_batch(
+        self,
+        students: List[Student],
+        final_top_k: int = 15,
+        batch_size: int = 32,
+        num_workers: int = 1
+    ) -> List[Dict[str, Dict]]:
+        """
+        여러 학생의 후보군을 한 번에 생성
+        
+        쿼리 임베딩은 encode 한 번(batch_size 단위)으로, 의미 점수는 행렬 곱 한 번으로 계산
+        결과는 students 순서대로 get_candidates_with_scores와 같은 형식
+        
+        num_workers > 1이면 쿼리별 점수 결합/Top-K를 스레드 풀로 나눠서 처리
+        (인덱스는 읽기 전용이라 공유 가능, numpy 연산 중에는 GIL이 풀림)
+        """
+        if not students:
+            return []
+        
+        queries = [student.research_interests for student in students]
+        query_embeddings = self._encode_queries(queries, batch_size=batch_size)
+        semantic_scores_raw = self._semantic_scores(query_embeddings)
+        
+        if num_workers > 1 and len(queries) > 1:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                return list(executor.map(
+                    self._rank_candidates,
+                    queries,
+                    semantic_scores_raw,
+                    [final_top_k] * len(queries)
+                ))
+        
+        return [
+            self._rank_candidates(query, scores, final_top_k)
+            for query, scores in zip(queries, semantic_scores_raw)
+        ]
+    
+    def _encode_queries(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        쿼리 임베딩 (쿼리 수, 차원) - 캐시에 없는 쿼리만 encode 한 번으로 계산
+        
+        최근 QUERY_CACHE_SIZE개 쿼리의 임베딩을 LRU로 보관
+        """
+        cache = self._query_embedding_cache
+        missing = list(dict.fromkeys(query for query in queries if query not in cache))
+        
+        if missing:
+            embeddings = self.embedding_model.encode(
+                [f"query: {query}" for query in missing],
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+            for query, embedding in zip(missing, embeddings):
+                cache[query] = embedding
+        
+        result = []
+        for query in queries:
+            cache.move_to_end(query)
+            result.append(cache[query])
+        
+        while len(cache) > self.QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return np.array(result, dtype=np.float32)
+    
+    def _rank_candidates(
+        self,
+        query: str,
+        semantic_scores_raw: np.ndarray,
+        final_top_k: int
+    ) -> Dict[str, Dict]:
+        """쿼리 하나의 점수 결합 + 필터링 + Top-K (의미 점수 원본은 호출한 쪽에서 계산)"""
         # ===== 1. BM25 키워드 점수 (불용어 제거 적용) =====
-        tokenized_query = tokenize_with_stopwords(query)
+        tokenized_query = _tokenize_query(query)
         keyword_scores_raw = self.bm25.get_scores(tokenized_query)
         keyword_scores_norm = self._normalize_keyword_scores(keyword_scores_raw)
         
         # ===== 2. 의미 점수 (threshold 상향) =====
-        query_with_prefix = f"query: {query}"
-        query_embedding = self.embedding_model.encode(
-            query_with_prefix, normalize_embeddings=True
-        )
-        semantic_scores_raw = np.dot(self.lab_embeddings, query_embedding)
         semantic_scores_rescaled = self._rescale_semantic_scores(semantic_scores_raw)
         
         # ===== 3. 도메인 키워드 점수 =====
+        # 쿼리 카테고리 (오토마톤 한 번 스캔, 도메인 점수와 부정 필터링에서 함께 사용)
+        query_bits = _category_bits(query.lower())
+        query_mask = _category_bits_mask(query_bits)
+        
         domain_scores = np.zeros(len(self.labs))
         if self.use_domain_keywords:
-            for idx, lab in enumerate(self.labs):
-                lab_text = lab.get_search_text()
-                domain_scores[idx] = keyword_match_score(query, lab_text)
+            domain_scores = _domain_scores(query_mask, self.lab_category_scores)
         
-        # ===== 4. Combined score 계산 =====
-        results = {}
-        for idx, lab in enumerate(self.labs):
-            keyword_score = float(keyword_scores_norm[idx])
-            semantic_score = float(semantic_scores_rescaled[idx])
-            domain_score = float(domain_scores[idx])
-            
-            # 🔧 도메인 점수 우선 반영
-            if self.use_domain_keywords and domain_score > 0.3:
-                # 도메인 매칭이 있으면 도메인 우선
-                effective_keyword = domain_score * 0.7 + keyword_score * 0.3
-            else:
-                # 도메인 매칭 없으면 BM25
-                effective_keyword = keyword_score
-            
-            combined_score = (
-                effective_keyword * self.keyword_weight +
-                semantic_score * self.semantic_weight
+        # ===== 4. Combined score 계산 (모든 랩실을 한 번에) =====
+        keyword_scores = keyword_scores_norm.astype(np.float64)
+        semantic_scores = semantic_scores_rescaled.astype(np.float64)
+        
+        # 🔧 도메인 점수 우선 반영
+        if self.use_domain_keywords:
+            # 도메인 매칭이 있으면 도메인 우선, 없으면 BM25
+            effective_keyword = np.where(
+                domain_scores > 0.3,
+                domain_scores * 0.7 + keyword_scores * 0.3,
+                keyword_scores
             )
-            
-            # 🔧 부정 필터링 적용
-            if not self._filter_irrelevant_labs(query, lab, combined_score):
-                continue
-            
-            # 최소 임계값
-            if combined_score > 0.05:
-                results[lab.id] = {
-                    "keyword_score": keyword_score,
-                    "semantic_score": semantic_score,
-                    "domain_score": domain_score,
-                    "combined_score": combined_score,
-                    "sources": []
-                }
-                
-                if effective_keyword > 0.1:
-                    results[lab.id]["sources"].append("keyword")
-                if semantic_score > 0.1:
-                    results[lab.id]["sources"].append("semantic")
+        else:
+            effective_keyword = keyword_scores
         
-        # ===== 5. Combined score 기준 Top-K 선택 =====
-        sorted_results = sorted(
-            results.items(),
-            key=lambda x: x[1]['combined_score'],
-            reverse=True
+        combined_scores = (
+            effective_keyword * self.keyword_weight +
+            semantic_scores * self.semantic_weight
         )
         
-        return dict(sorted_results[:final_top_k])
+        # 🔧 부정 필터링 + 최소 임계값
+        passed = self._filter_irrelevant_labs(query_bits, combined_scores)
+        candidates = np.flatnonzero(passed & (combined_scores > 0.05))
+        
+        # ===== 5. Combined score 기준 Top-K 선택 =====
+        top = candidates[_top_k_indices(combined_scores[candidates], final_top_k)]
+        
+        # Top-K 행만 한 번에 파이썬 값으로 변환
+        results = {}
+        for idx, keyword, semantic, domain, combined, from_keyword, from_semantic in zip(
+            top.tolist(),
+            keyword_scores[top].tolist(),
+            semantic_scores[top].tolist(),
+            domain_scores[top].tolist(),
+            combined_scores[top].tolist(),
+            (effective_keyword[top] > 0.1).tolist(),
+            (semantic_scores[top] > 0.1).tolist()
+        ):
+            sources = []
+            if from_keyword:
+                sources.append("keyword")
+            if from_semantic:
+                sources.append("semantic")
+            
+            results[self.labs[idx].id] = {
+                "keyword_score": keyword,
+                "semantic_score": semantic,
+                "domain_score": domain,
+                "combined_score": combined,
+                "sources": sources
+            }
+        
+        return results
 
 
 if __name__ == "__main__":
@@ -423,32 +1071,28 @@ if __name__ == "__main__":
         "무선 통신 및 5G 네트워크"
     ]
     
-    for i, query in enumerate(test_queries, 1):
+    # 후보군 생성 (모든 쿼리를 한 번에 임베딩)
+    students = [Student(research_interests=query) for query in test_queries]
+    all_candidates = generator.get_candidates_batch(students, final_top_k=10)
+    
+    for i, (query, candidates_with_scores) in enumerate(zip(test_queries, all_candidates), 1):
         print("\n" + "="*80)
         print(f"📝 테스트 {i}: {query}")
         print("="*80)
         
-        student = Student(research_interests=query)
-        
-        # 후보군 생성
-        candidates_with_scores = generator.get_candidates_with_scores(
-            student,
-            final_top_k=10
-        )
-        
         # 출력
         print(f"\n🏆 상위 10개 후보 연구실:\n")
-        for rank, (lab_id, scores) in enumerate(candidates_with_scores.items(), 1):
-            lab = next(lab for lab in generator.labs if lab.id == lab_id)
+        records = generator.get_lab_records(list(candidates_with_scores))
+        for rank, (record, scores) in enumerate(zip(records, candidates_with_scores.values()), 1):
             sources = ', '.join(scores['sources']) if scores['sources'] else 'combined'
             
-            print(f"{rank}. [{lab.professor}] {lab.name}")
+            print(f"{rank}. [{record['professor']}] {record['name']}")
             # print(f"   총점: {scores['combined_score']:.4f}")
             # print(f"   세부: 키워드={scores['keyword_score']:.4f}, "
             #       f"의미={scores['semantic_score']:.4f}, "
             #       f"도메인={scores['domain_score']:.4f}")
             # print(f"   매칭: {sources}")
-            # print(f"   설명: {lab.description[:80]}...")
+            # print(f"   설명: {record['description'][:80]}...")
             print()
     
     print("="*80)
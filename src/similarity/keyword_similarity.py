@@ -8,9 +8,9 @@
 """
 
 from typing import List, Set, Dict
+from collections import OrderedDict
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from sentence_transformers import SentenceTransformer
 
 from .base import BaseSimilarity, SimilarityResult
@@ -31,12 +31,17 @@ class MajorSimilarity(BaseSimilarity):
         "경영경제": ["경영학", "경제학", "회계학", "금융학"],
     }
     
+    # 역방향 매핑 (학과명 -> 계열), 임포트 시 한 번만 생성
+    _MAJOR_TO_GROUP = {
+        major: group for group, majors in MAJOR_GROUPS.items() for major in majors
+    }
+    
+    # 공학 계열 (계열끼리 0.5)
+    _ENGINEERING_GROUPS = frozenset({"컴퓨터", "전기전자", "기계", "화학생명"})
+    
     def __init__(self):
-        # 역방향 매핑 생성 (학과명 -> 계열)
-        self.major_to_group = {}
-        for group, majors in self.MAJOR_GROUPS.items():
-            for major in majors:
-                self.major_to_group[major] = group
+        # 인스턴스마다 다시 만들지 않고 클래스 매핑을 공유 (읽기 전용)
+        self.major_to_group = self._MAJOR_TO_GROUP
     
     def calculate(self, text1: str, text2: str, **kwargs) -> SimilarityResult:
         """
@@ -82,8 +87,7 @@ class MajorSimilarity(BaseSimilarity):
         # 4. 관련 있는 계열인지 확인
         if group1 and group2:
             # 공학 계열끼리는 0.5
-            engineering_groups = {"컴퓨터", "전기전자", "기계", "화학생명"}
-            if group1 in engineering_groups and group2 in engineering_groups:
+            if group1 in self._ENGINEERING_GROUPS and group2 in self._ENGINEERING_GROUPS:
                 return SimilarityResult(
                     score=0.5,
                     method="related_engineering",
@@ -134,33 +138,29 @@ class CertificationSimilarity(BaseSimilarity):
         if not certs1 or not certs2:
             return SimilarityResult(score=0.0, method="empty_lists")
         
-        # 자격증별 가중치 부여
-        weighted_scores = []
-        
-        for cert1 in certs1:
-            best_match_score = 0.0
-            for cert2 in certs2:
-                # 문자열 유사도
-                if cert1 == cert2:
-                    match_score = 1.0
-                elif cert1 in cert2 or cert2 in cert1:
-                    match_score = 0.7
-                else:
-                    # 키워드 기반 유사도
-                    words1 = set(cert1.split())
-                    words2 = set(cert2.split())
-                    if words1 & words2:
-                        match_score = len(words1 & words2) / len(words1 | words2)
-                    else:
-                        match_score = 0.0
-                
-                # 자격증 등급별 가중치 적용
-                weight = self._get_cert_weight(cert1)
-                weighted_match = match_score * weight
-                
-                best_match_score = max(best_match_score, weighted_match)
-            
-            weighted_scores.append(best_match_score)
+        # 자격증별 단어 집합/가중치는 쌍마다가 아니라 한 번만 계산
+        words1 = [frozenset(c.split()) for c in certs1]
+        words2 = [frozenset(c.split()) for c in certs2]
+        weights1 = np.array([self._get_cert_weight(c) for c in certs1])
+        
+        # 키워드 기반 유사도 (Jaccard): |A∪B| = |A| + |B| - |A∩B|
+        inter = np.array([[len(w1 & w2) for w2 in words2] for w1 in words1], dtype=np.float64)
+        union = (
+            np.array([len(w) for w in words1])[:, np.newaxis]
+            + np.array([len(w) for w in words2])[np.newaxis, :]
+            - inter
+        )
+        match_scores = inter / union
+        
+        # 문자열 유사도: 완전 일치 1.0 > 부분 문자열 0.7 > Jaccard
+        names1 = np.array(certs1)[:, np.newaxis]
+        names2 = np.array(certs2)[np.newaxis, :]
+        contains = (np.char.find(names2, names1) >= 0) | (np.char.find(names1, names2) >= 0)
+        match_scores = np.where(contains, 0.7, match_scores)
+        match_scores = np.where(names1 == names2, 1.0, match_scores)
+        
+        # 자격증 등급별 가중치 적용 후 cert1마다 최고 매칭
+        weighted_scores = (match_scores * weights1[:, np.newaxis]).max(axis=1).tolist()
         
         # 최종 점수: 평균
         final_score = np.mean(weighted_scores) if weighted_scores else 0.0
@@ -191,6 +191,28 @@ class AwardSimilarity(BaseSimilarity):
     
     def __init__(self):
         self.tfidf = TfidfVectorizer()
+        self._fitted = False
+    
+    def fit(self, corpus: List[str]) -> "AwardSimilarity":
+        """
+        수상경력 코퍼스 전체로 TF-IDF 어휘/IDF를 한 번만 학습
+        
+        학습 후에는 쌍마다 fit하지 않고 transform만 수행
+        (문서 2개로 추정한 IDF는 log(2/df) 수준이라 의미가 없음)
+        어휘가 비어 학습에 실패하면 쌍별 계산을 유지
+        학습한 어휘는 그 코퍼스 전용이므로 다 쓰면 reset()으로 해제
+        """
+        try:
+            self.tfidf.fit([text for text in corpus if text])
+            self._fitted = True
+        except ValueError:
+            self._fitted = False
+        return self
+    
+    def reset(self):
+        """fit()으로 학습한 어휘 해제 (다시 쌍별 계산)"""
+        self.tfidf = TfidfVectorizer()
+        self._fitted = False
     
     def calculate(
         self, 
@@ -221,17 +243,32 @@ class AwardSimilarity(BaseSimilarity):
             return self._jaccard_similarity(text1, text2)
     
     def _tfidf_similarity(self, text1: str, text2: str) -> SimilarityResult:
-        """TF-IDF 기반 코사인 유사도"""
+        """
+        TF-IDF 기반 코사인 유사도
+        
+        fit()으로 학습했으면 transform만, 아니면 두 텍스트로 바로 학습
+        학습한 어휘에 없는 단어뿐이라 한쪽이 0 벡터가 되면 두 텍스트로 따로 학습
+        TF-IDF 행은 L2 정규화되어 있으므로 코사인 = 희소 행 내적 한 번
+        """
         try:
-            tfidf_matrix = self.tfidf.fit_transform([text1, text2])
-            cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            shared_vocabulary = self._fitted
+            if shared_vocabulary:
+                tfidf_matrix = self.tfidf.transform([text1, text2])
+                if tfidf_matrix[0].nnz == 0 or tfidf_matrix[1].nnz == 0:
+                    # 학습한 어휘는 그대로 두고 별도 벡터라이저 사용
+                    shared_vocabulary = False
+                    tfidf_matrix = TfidfVectorizer().fit_transform([text1, text2])
+            else:
+                tfidf_matrix = self.tfidf.fit_transform([text1, text2])
+            cosine_sim = tfidf_matrix[0].multiply(tfidf_matrix[1]).sum()
             
             return SimilarityResult(
-                score=float(cosine_sim),
+                score=min(float(cosine_sim), 1.0),
                 method="tfidf_cosine",
                 details={
                     "text1_length": len(text1),
-                    "text2_length": len(text2)
+                    "text2_length": len(text2),
+                    "shared_vocabulary": shared_vocabulary
                 }
             )
         except:
@@ -269,8 +306,55 @@ class TechStackSimilarity(BaseSimilarity):
     Jaccard + Embedding 보조
     """
     
+    # 기술 단어 임베딩 캐시 크기 (학생 기술 스택은 여러 연구실과 반복 비교됨)
+    EMBEDDING_CACHE_SIZE = 4096
+    
     def __init__(self, model_name: str = "intfloat/e5-small-v2"):
         self.model = SentenceTransformer(model_name)
+        self._embedding_cache = OrderedDict()
+    
+    @staticmethod
+    def _split_techs(text: str) -> List[str]:
+        """콤마 구분 기술 스택 → 소문자 기술 단어 리스트"""
+        return [t.strip().lower() for t in text.split(',') if t.strip()]
+    
+    def prepare(self, texts: List[str], batch_size: int = 256):
+        """
+        여러 기술 스택(학생 N명 × 연구실 M개 등)에 나오는 기술 단어를 encode 한 번으로 미리 임베딩
+        
+        이후 calculate는 캐시에서 행만 꺼내 쓰므로 쌍마다 모델을 호출하지 않음
+        """
+        techs = [tech for text in texts for tech in self._split_techs(text)]
+        self._encode_techs(techs, batch_size=batch_size)
+    
+    def _encode_techs(self, techs: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        기술 단어 임베딩 (단어 수, 차원) - 캐시에 없는 단어만 중복 제거 후 encode 한 번으로 계산
+        
+        최근 EMBEDDING_CACHE_SIZE개 단어의 임베딩을 LRU로 보관
+        """
+        cache = self._embedding_cache
+        missing = list(dict.fromkeys(tech for tech in techs if tech not in cache))
+        
+        if missing:
+            embeddings = self.model.encode(
+                missing,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+            for tech, embedding in zip(missing, embeddings):
+                cache[tech] = embedding
+        
+        result = []
+        for tech in techs:
+            cache.move_to_end(tech)
+            result.append(cache[tech])
+        
+        while len(cache) > self.EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return np.array(result)
     
     def calculate(
         self, 
@@ -292,8 +376,8 @@ class TechStackSimilarity(BaseSimilarity):
         Returns:
             SimilarityResult (hybrid)
         """
-        techs1 = [t.strip().lower() for t in text1.split(',') if t.strip()]
-        techs2 = [t.strip().lower() for t in text2.split(',') if t.strip()]
+        techs1 = self._split_techs(text1)
+        techs2 = self._split_techs(text2)
         
         if not techs1 or not techs2:
             return SimilarityResult(score=0.0, method="empty_stacks")
@@ -304,11 +388,11 @@ class TechStackSimilarity(BaseSimilarity):
         jaccard = len(set1 & set2) / len(set1 | set2)
         
         # 2. 임베딩 유사도 (각 기술 단어의 평균 임베딩)
-        emb1 = self.model.encode(techs1, normalize_embeddings=True)
-        emb2 = self.model.encode(techs2, normalize_embeddings=True)
+        # 두 스택을 한 번에 임베딩 (캐시에 있는 단어는 encode 생략)
+        embeddings = self._encode_techs(techs1 + techs2)
         
-        mean_emb1 = np.mean(emb1, axis=0)
-        mean_emb2 = np.mean(emb2, axis=0)
+        mean_emb1 = np.mean(embeddings[:len(techs1)], axis=0)
+        mean_emb2 = np.mean(embeddings[len(techs1):], axis=0)
         
         # 정규화
         mean_emb1 = mean_emb1 / np.linalg.norm(mean_emb1)
@@ -332,12 +332,30 @@ class RerankingScorer:
         
         print(f"\n🔄 재랭킹 시작: {len(candidate_labs)}개 후보 연구실")
         
-        for lab in candidate_labs:
-            score = self.score_lab(student, lab)
-            
-            # 최소 임계값 필터링
-            if score.final_score >= self.config.min_score_threshold:
-                scores.append(score)
+        # 학생 + 후보 연구실 기술 스택의 기술 단어를 encode 한 번으로 미리 임베딩
+        if student.tech_stack:
+            self.tech_sim.prepare([student.tech_stack] + [
+                lab.sections.get("technologies", lab.sections.get("methods", ""))
+                for lab in candidate_labs
+            ])
+        
+        # 수상경력 TF-IDF는 후보 연구실 전체 성과 + 학생 수상경력으로 한 번만 학습
+        # (이번 재랭킹 전용 - 끝나면 해제해서 이후 score_lab 호출에 남지 않게)
+        if student.awards:
+            self.award_sim.fit([student.awards] + [
+                lab.sections.get("achievements", lab.sections.get("publications", ""))
+                for lab in candidate_labs
+            ])
+        
+        try:
+            for lab in candidate_labs:
+                score = self.score_lab(student, lab)
+                
+                # 최소 임계값 필터링
+                if score.final_score >= self.config.min_score_threshold:
+                    scores.append(score)
+        finally:
+            self.award_sim.reset()
         
         # 점수 순으로 정렬
         scores.sort(key=lambda x: x.final_score, reverse=True)
@@ -100,8 +100,8 @@ def test_full_pipeline():
     # 결과에서 연구실 리스트 추출
     candidates = []
     for lab_id, lab_info in result.items():
-        # 연구실 객체는 generator.labs에서 id로 찾기
-        lab = next((l for l in generator.labs if l.id == lab_id), None)
+        # 연구실 객체는 generator에서 id로 조회
+        lab = generator.get_lab(lab_id)
         if lab:
             candidates.append(lab)
     
@@ -19,7 +19,8 @@ PostgreSQL 대신 JSON 파일로 데이터를 저장하고 검색합니다.
     ./crawl_data/
     ├── labs.json           # 연구실 기본 정보
     ├── documents.json      # 문서 + 임베딩 벡터
-    └── stats.json          # 통계 정보
+    ├── stats.json          # 통계 정보
+    └── http_meta.json      # 페이지별 ETag/Last-Modified (재크롤링 시 조건부 요청)
 
 주요 기능:
 1. 연구실 정보 저장/조회
@@ -35,12 +36,19 @@ PostgreSQL 대신 JSON 파일로 데이터를 저장하고 검색합니다.
 """
 
 import json
+import orjson
 import numpy as np
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 import os
+import threading
 from datetime import datetime
 
+try:
+    import ijson  # 선택: pip install ijson (대용량 documents.json 스트리밍 로드)
+except ImportError:
+    ijson = None
+
 
 @dataclass
 class LocalDocument:
@@ -61,8 +69,9 @@ class LocalDocument:
         tokens (int): 토큰 수
         source_url (str): 출처 URL
         md5 (str): 텍스트 MD5 해시 (중복 체크용)
-        embedding (List[float]): 임베딩 벡터 (768개 숫자)
-            ※ JSON 저장을 위해 리스트로 저장
+        embedding (np.ndarray): 임베딩 벡터 (768개 숫자, float16)
+            ※ 메모리/파일 크기를 줄이기 위해 float16으로 보관
+            ※ 파일에는 숫자 리스트로 저장 (기존 JSON 형식 유지)
         emb_model (str): 임베딩 모델 이름
         emb_ver (int): 임베딩 버전
         quality_score (int): 품질 점수 (0-100)
@@ -78,7 +87,7 @@ class LocalDocument:
     tokens: int
     source_url: str
     md5: str
-    embedding: List[float]  # numpy array를 list로 저장 (JSON 호환성)
+    embedding: np.ndarray  # float16 배열 (파일에는 리스트로 저장)
     emb_model: str
     emb_ver: int
     quality_score: int
@@ -122,13 +131,18 @@ class LocalVectorStore:
         data_dir/
         ├── labs.json        - 연구실 정보
         ├── documents.json   - 문서 + 임베딩
-        └── stats.json       - 통계 (ID 카운터 등)
+        ├── stats.json       - 통계 (ID 카운터 등)
+        └── http_meta.json   - 페이지별 HTTP 캐시 헤더
+    
+    documents.json이 STREAM_LOAD_BYTES 이상이고 ijson이 설치되어 있으면
+    파일 전체를 파싱하지 않고 문서 단위로 스트리밍 로드합니다 (메모리 절약).
     
     주요 메서드:
         insert_lab()         - 연구실 추가
         insert_document()    - 문서 추가
         search_vector()      - 벡터 검색
         get_stats()          - 통계 조회
+        get_http_meta()      - 페이지의 ETag/Last-Modified 조회
     
     사용 예:
         store = LocalVectorStore('./data')
@@ -137,13 +151,39 @@ class LocalVectorStore:
         results = store.search_vector(query_vec, limit=5)
     """
     
-    def __init__(self, data_dir: str = './data/crawl_data'):
+    # 이 크기 이상의 documents.json은 스트리밍 로드 (ijson 필요)
+    # (작은 파일은 orjson 한 번에 파싱하는 쪽이 수십 배 빠름)
+    STREAM_LOAD_BYTES = 256 * 1024 * 1024
+    
+    # 검색 행렬 정밀도
+    #   'float32': 정확한 코사인 유사도 (BLAS 행렬 곱, 가장 빠름)
+    #   'int8'   : 차원별 스케일로 양자화 (검색 행렬 메모리 1/4, 점수 오차 ~1e-3)
+    SUPPORTED_SEARCH_PRECISIONS = ('float32', 'int8')
+    
+    # int8 점수 계산 시 한 번에 float32로 복원하는 행 수 (캐시에 들어가는 크기)
+    _SCORE_BLOCK_ROWS = 8192
+    
+    # 근사 검색(HNSW, use_ann=True) 설정
+    ANN_MIN_DOCS = 10_000   # 문서가 이보다 적으면 전체 행렬 곱이 더 빠르고 정확함
+    ANN_HNSW_M = 32         # 노드당 연결 수 (클수록 정확, 메모리 증가)
+    ANN_EF_SEARCH = 64      # 검색 시 탐색 후보 수 (최소값, limit이 크면 늘어남)
+    
+    def __init__(
+        self,
+        data_dir: str = './data/crawl_data',
+        search_precision: str = 'float32',
+        use_ann: bool = False
+    ):
         """
         초기화
         
         Args:
             data_dir: 데이터를 저장할 디렉토리 경로
                 기본값은 './local_data'
+            search_precision: 검색 행렬 정밀도 ('float32' 또는 'int8')
+                문서가 많아 메모리가 부족하면 'int8' 사용
+            use_ann: faiss HNSW 근사 검색 사용 (문서 ANN_MIN_DOCS개 이상, 필터 없는 검색)
+                인덱스는 data_dir/index.faiss에 저장되어 다음 실행 시 재사용
         
         동작:
             1. 디렉토리가 없으면 자동 생성
@@ -154,6 +194,21 @@ class LocalVectorStore:
         self.labs_file = os.path.join(data_dir, 'labs.json')
         self.docs_file = os.path.join(data_dir, 'documents.json')
         self.stats_file = os.path.join(data_dir, 'stats.json')
+        self.http_meta_file = os.path.join(data_dir, 'http_meta.json')
+        self.ann_index_file = os.path.join(data_dir, 'index.faiss')
+        self.ann_ids_file = os.path.join(data_dir, 'index_ids.json')
+        
+        self._faiss = None
+        if use_ann:
+            try:
+                import faiss
+            except ImportError:
+                raise ImportError("faiss가 설치되지 않았습니다: pip install faiss-cpu")
+            self._faiss = faiss
+        
+        if search_precision not in self.SUPPORTED_SEARCH_PRECISIONS:
+            raise ValueError(f"지원하지 않는 검색 정밀도: {search_precision}")
+        self.search_precision = search_precision
         
         # 디렉토리 생성 (없으면)
         os.makedirs(data_dir, exist_ok=True)
@@ -162,6 +217,13 @@ class LocalVectorStore:
         self.labs = self._load_labs()        # {lab_id: LocalLab}
         self.documents = self._load_documents()  # {doc_id: LocalDocument}
         self.stats = self._load_stats()      # {total_labs, total_docs, ...}
+        self.http_meta = self._load_http_meta()  # {url: {etag, last_modified}}
+        
+        # 쓰기 잠금 (백그라운드 저장 스레드와 메인 스레드가 동시에 쓰는 경우 대비)
+        self._lock = threading.RLock()
+        
+        # 검색용 인덱스 (정규화된 임베딩 행렬 + 필터 컬럼, 문서가 바뀌면 다시 생성)
+        self._search_index: Optional[Dict] = None
     
     def _load_labs(self) -> Dict[int, LocalLab]:
         """연구실 데이터 로드"""
@@ -173,13 +235,28 @@ class LocalVectorStore:
             return {int(k): LocalLab(**v) for k, v in data.items()}
     
     def _load_documents(self) -> Dict[int, LocalDocument]:
-        """문서 데이터 로드"""
+        """
+        문서 데이터 로드
+        
+        대용량 파일은 ijson으로 문서 하나씩 읽어서 바로 float16 배열로 바꾸므로,
+        전체 JSON을 파이썬 객체로 만드는 것보다 최대 메모리가 훨씬 작습니다.
+        """
         if not os.path.exists(self.docs_file):
             return {}
         
-        with open(self.docs_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return {int(k): LocalDocument(**v) for k, v in data.items()}
+        stream = ijson is not None and os.path.getsize(self.docs_file) >= self.STREAM_LOAD_BYTES
+        
+        documents = {}
+        with open(self.docs_file, 'rb') as f:
+            if stream:
+                items = ijson.kvitems(f, '', use_float=True)
+            else:
+                items = orjson.loads(f.read()).items()
+            
+            for k, v in items:
+                v['embedding'] = np.asarray(v['embedding'], dtype=np.float16)
+                documents[int(k)] = LocalDocument(**v)
+        return documents
     
     def _load_stats(self) -> Dict:
         """통계 데이터 로드"""
@@ -194,6 +271,14 @@ class LocalVectorStore:
         with open(self.stats_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     
+    def _load_http_meta(self) -> Dict[str, Dict]:
+        """HTTP 캐시 헤더 로드"""
+        if not os.path.exists(self.http_meta_file):
+            return {}
+        
+        with open(self.http_meta_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _save_labs(self):
         """연구실 데이터 저장"""
         data = {k: asdict(v) for k, v in self.labs.items()}
@@ -201,10 +286,18 @@ class LocalVectorStore:
             json.dump(data, f, ensure_ascii=False, indent=2)
     
     def _save_documents(self):
-        """문서 데이터 저장"""
-        data = {k: asdict(v) for k, v in self.documents.items()}
-        with open(self.docs_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """
+        문서 데이터 저장
+        
+        orjson이 numpy 배열을 리스트로 직접 직렬화합니다 (tolist() 불필요).
+        orjson은 float16을 지원하지 않으므로 저장 시에만 float32로 변환합니다.
+        """
+        data = {
+            str(k): {**vars(v), 'embedding': v.embedding.astype(np.float32)}
+            for k, v in self.documents.items()
+        }
+        with open(self.docs_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
     
     def _save_stats(self):
         """통계 데이터 저장"""
@@ -213,35 +306,36 @@ class LocalVectorStore:
     
     def insert_lab(self, lab_data: Dict) -> int:
         """연구실 추가"""
-        # 중복 체크
-        for lab_id, lab in self.labs.items():
-            if lab.kor_name == lab_data.get('kor_name'):
-                return lab_id
-        
-        # 새 ID 생성
-        lab_id = self.stats['last_lab_id'] + 1
-        
-        # 연구실 생성
-        lab = LocalLab(
-            lab_id=lab_id,
-            kor_name=lab_data.get('kor_name', ''),
-            eng_name=lab_data.get('eng_name'),
-            professor=lab_data.get('professor'),
-            homepage=lab_data.get('homepage'),
-            location=lab_data.get('location'),
-            contact_email=lab_data.get('contact_email'),
-            contact_phone=lab_data.get('contact_phone'),
-            description=lab_data.get('description')
-        )
-        
-        self.labs[lab_id] = lab
-        self.stats['last_lab_id'] = lab_id
-        self.stats['total_labs'] = len(self.labs)
-        
-        self._save_labs()
-        self._save_stats()
-        
-        return lab_id
+        with self._lock:
+            # 중복 체크
+            for lab_id, lab in self.labs.items():
+                if lab.kor_name == lab_data.get('kor_name'):
+                    return lab_id
+            
+            # 새 ID 생성
+            lab_id = self.stats['last_lab_id'] + 1
+            
+            # 연구실 생성
+            lab = LocalLab(
+                lab_id=lab_id,
+                kor_name=lab_data.get('kor_name', ''),
+                eng_name=lab_data.get('eng_name'),
+                professor=lab_data.get('professor'),
+                homepage=lab_data.get('homepage'),
+                location=lab_data.get('location'),
+                contact_email=lab_data.get('contact_email'),
+                contact_phone=lab_data.get('contact_phone'),
+                description=lab_data.get('description')
+            )
+            
+            self.labs[lab_id] = lab
+            self.stats['last_lab_id'] = lab_id
+            self.stats['total_labs'] = len(self.labs)
+            
+            self._save_labs()
+            self._save_stats()
+            
+            return lab_id
     
     def check_duplicate(self, lab_id: int, md5: str) -> bool:
         """중복 문서 체크"""
@@ -252,56 +346,59 @@ class LocalVectorStore:
     
     def insert_document(self, lab_id: int, doc_data: Dict) -> int:
         """문서 추가"""
-        # 중복 체크
-        md5 = doc_data.get('md5', '')
-        if self.check_duplicate(lab_id, md5):
-            print(f"  ⚠️  중복 문서 스킵 (MD5: {md5[:8]}...)")
-            return -1
-        
-        # 새 ID 생성
-        doc_id = self.stats['last_doc_id'] + 1
-        
-        # 연구실 이름 가져오기
-        lab_name = self.labs[lab_id].kor_name if lab_id in self.labs else "Unknown"
-        
-        # 문서 생성
-        doc = LocalDocument(
-            doc_id=doc_id,
-            lab_id=lab_id,
-            lab_name=lab_name,
-            section=doc_data.get('section', 'general'),
-            title=doc_data.get('title'),
-            text=doc_data.get('text', ''),
-            lang=doc_data.get('lang', 'unknown'),
-            tokens=doc_data.get('tokens', 0),
-            source_url=doc_data.get('source_url', ''),
-            md5=md5,
-            embedding=doc_data.get('embedding', []),
-            emb_model=doc_data.get('emb_model', ''),
-            emb_ver=doc_data.get('emb_ver', 1),
-            quality_score=doc_data.get('quality_score', 0),
-            created_at=datetime.now().isoformat()
-        )
-        
-        self.documents[doc_id] = doc
-        self.stats['last_doc_id'] = doc_id
-        self.stats['total_docs'] = len(self.documents)
-        
-        self._save_documents()
-        self._save_stats()
-        
-        return doc_id
+        with self._lock:
+            # 중복 체크
+            md5 = doc_data.get('md5', '')
+            if self.check_duplicate(lab_id, md5):
+                print(f"  ⚠️  중복 문서 스킵 (MD5: {md5[:8]}...)")
+                return -1
+            
+            # 새 ID 생성
+            doc_id = self.stats['last_doc_id'] + 1
+            
+            # 연구실 이름 가져오기
+            lab_name = self.labs[lab_id].kor_name if lab_id in self.labs else "Unknown"
+            
+            # 문서 생성
+            doc = LocalDocument(
+                doc_id=doc_id,
+                lab_id=lab_id,
+                lab_name=lab_name,
+                section=doc_data.get('section', 'general'),
+                title=doc_data.get('title'),
+                text=doc_data.get('text', ''),
+                lang=doc_data.get('lang', 'unknown'),
+                tokens=doc_data.get('tokens', 0),
+                source_url=doc_data.get('source_url', ''),
+                md5=md5,
+                embedding=np.asarray(doc_data.get('embedding', []), dtype=np.float16),
+                emb_model=doc_data.get('emb_model', ''),
+                emb_ver=doc_data.get('emb_ver', 1),
+                quality_score=doc_data.get('quality_score', 0),
+                created_at=datetime.now().isoformat()
+            )
+            
+            self.documents[doc_id] = doc
+            self._search_index = None  # 검색 인덱스 무효화
+            self.stats['last_doc_id'] = doc_id
+            self.stats['total_docs'] = len(self.documents)
+            
+            self._save_documents()
+            self._save_stats()
+            
+            return doc_id
     
     def insert_documents_batch(self, lab_id: int, docs_data: List[Dict]) -> List[int]:
         """문서 배치 추가"""
-        doc_ids = []
-        
-        for doc_data in docs_data:
-            doc_id = self.insert_document(lab_id, doc_data)
-            if doc_id > 0:
-                doc_ids.append(doc_id)
-        
-        return doc_ids
+        with self._lock:
+            doc_ids = []
+            
+            for doc_data in docs_data:
+                doc_id = self.insert_document(lab_id, doc_data)
+                if doc_id > 0:
+                    doc_ids.append(doc_id)
+            
+            return doc_ids
     
     def search_vector(
         self,
@@ -325,11 +422,10 @@ class LocalVectorStore:
             SearchResult 리스트 (유사도 높은 순으로 정렬)
         
         동작 원리:
-            1. 모든 문서를 순회
-            2. 필터 조건 확인 (품질, 섹션, 언어)
-            3. 각 문서와 쿼리의 코사인 유사도 계산
-            4. 유사도 순으로 정렬
-            5. 상위 limit개 반환
+            1. 정규화된 문서 임베딩 행렬 준비 (처음 검색 시 한 번만 생성)
+            2. 필터 조건을 마스크로 계산 (품질, 섹션, 언어)
+            3. 행렬 × 정규화된 쿼리 벡터 한 번으로 모든 코사인 유사도 계산
+            4. argpartition으로 상위 limit개만 골라서 정렬
         
         예시:
             query_emb = pipeline.embed("AI 연구")
@@ -341,23 +437,50 @@ class LocalVectorStore:
             for r in results:
                 print(f"{r.lab_name}: {r.score:.3f}")
         """
-        results = []
-        
-        # 모든 문서를 순회하며 검색
-        for doc in self.documents.values():
-            # 필터 적용
-            if doc.quality_score < min_quality:
-                continue  # 품질 점수가 낮으면 스킵
-            if section_filter and doc.section != section_filter:
-                continue  # 섹션이 다르면 스킵
-            if lang_filter and doc.lang != lang_filter:
-                continue  # 언어가 다르면 스킵
-            
-            # 코사인 유사도 계산
-            doc_embedding = np.array(doc.embedding)  # 리스트 → numpy 배열
-            similarity = self._cosine_similarity(query_embedding, doc_embedding)
+        index = self._get_search_index()
+        if index is None or limit <= 0:
+            return []
+        
+        # 필터 적용 (조건에 맞는 문서 위치)
+        mask = index['quality'] >= min_quality
+        if section_filter:
+            mask &= index['section'] == section_filter
+        if lang_filter:
+            mask &= index['lang'] == lang_filter
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+        
+        # 코사인 유사도 = 정규화된 문서 행렬 · 정규화된 쿼리 (float32 행렬-벡터 곱 한 번)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm > 0:
+            query = query / query_norm
+        
+        ann = index.get('ann')
+        if ann is not None and candidates.size == len(index['doc_ids']):
+            # 필터가 없으면 HNSW 근사 검색 (이미 점수 순으로 정렬됨)
+            ann.hnsw.efSearch = max(self.ANN_EF_SEARCH, limit)
+            top_scores, positions = ann.search(query[np.newaxis, :], min(limit, candidates.size))
+            found = positions[0] >= 0
+            top_scores, positions = top_scores[0][found], positions[0][found]
+        else:
+            matrix = index['matrix']
+            if candidates.size < len(matrix):
+                matrix = matrix[candidates]
+            scores = self._matrix_scores(matrix, query, index.get('scales'))
             
-            # 결과 추가
+            # 상위 limit개만 골라서 점수 순으로 정렬 (높은 것부터)
+            if limit < scores.size:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+            else:
+                top = np.arange(scores.size)
+            top = top[np.argsort(-scores[top], kind='stable')]
+            top_scores, positions = scores[top], candidates[top]
+        
+        results = []
+        for position, score in zip(positions, top_scores):
+            doc = self.documents[index['doc_ids'][position]]
             results.append(SearchResult(
                 doc_id=doc.doc_id,
                 lab_id=doc.lab_id,
@@ -365,18 +488,120 @@ class LocalVectorStore:
                 section=doc.section,
                 title=doc.title,
                 text=doc.text,
-                score=float(similarity)  # 유사도 점수 (0~1)
+                score=float(score)  # 유사도 점수 (0~1)
             ))
+        return results
+    
+    def _matrix_scores(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        scales: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        문서 행렬과 쿼리의 내적
+        
+        int8 행렬이면 차원별 스케일을 쿼리 쪽에 곱해 두고,
+        블록 단위로 float32로 복원해서 곱합니다 (전체 복원 사본을 만들지 않음).
+        """
+        if scales is None:
+            return matrix @ query
+        
+        query = query * scales
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), self._SCORE_BLOCK_ROWS):
+            block = matrix[start:start + self._SCORE_BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+        return scores
+    
+    def _get_search_index(self) -> Optional[Dict]:
+        """
+        검색 인덱스 (없으면 생성)
+        
+        문서 임베딩을 행 단위로 정규화한 (N, dim) float32 행렬과
+        필터용 컬럼(품질/섹션/언어)을 문서 순서대로 모아 둡니다.
+        search_precision='int8'이면 행렬을 차원별 대칭 스케일(최대 절댓값/127)로
+        양자화하고 스케일을 함께 저장합니다.
+        use_ann=True이고 문서가 ANN_MIN_DOCS개 이상이면 HNSW 인덱스도 준비합니다.
+        문서가 추가되면 무효화되고 다음 검색에서 다시 만듭니다.
+        """
+        with self._lock:
+            if self._search_index is not None or not self.documents:
+                return self._search_index
+            
+            docs = list(self.documents.values())
+            matrix = np.stack([doc.embedding for doc in docs]).astype(np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0  # 영벡터는 유사도 0
+            matrix /= norms
+            doc_ids = [doc.doc_id for doc in docs]
+            
+            ann = None
+            if self._faiss is not None and len(docs) >= self.ANN_MIN_DOCS:
+                ann = self._load_or_build_ann_index(matrix, doc_ids)
+            
+            scales = None
+            if self.search_precision == 'int8':
+                scales = np.abs(matrix).max(axis=0) / 127.0
+                scales[scales == 0] = 1.0
+                matrix = np.round(matrix / scales).astype(np.int8)
+            
+            self._search_index = {
+                'doc_ids': doc_ids,
+                'matrix': matrix,
+                'scales': scales,
+                'ann': ann,
+                'quality': np.array([doc.quality_score for doc in docs]),
+                'section': np.array([doc.section for doc in docs]),
+                'lang': np.array([doc.lang for doc in docs]),
+            }
+            return self._search_index
+    
+    def _load_or_build_ann_index(self, matrix: np.ndarray, doc_ids: List[int]):
+        """
+        HNSW 인덱스 로드 (저장된 인덱스의 문서 목록이 다르면 새로 생성 후 저장)
+        
+        정규화된 벡터의 내적(METRIC_INNER_PRODUCT) = 코사인 유사도
+        """
+        faiss = self._faiss
         
-        # 점수 순으로 정렬 (높은 것부터)
-        results.sort(key=lambda x: x.score, reverse=True)
+        if os.path.exists(self.ann_index_file) and os.path.exists(self.ann_ids_file):
+            with open(self.ann_ids_file, 'rb') as f:
+                saved_ids = orjson.loads(f.read())
+            if saved_ids == doc_ids:
+                return faiss.read_index(self.ann_index_file)
         
-        # 상위 limit개만 반환
-        return results[:limit]
+        ann = faiss.IndexHNSWFlat(matrix.shape[1], self.ANN_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        ann.add(matrix)
+        
+        faiss.write_index(ann, self.ann_index_file)
+        with open(self.ann_ids_file, 'wb') as f:
+            f.write(orjson.dumps(doc_ids))
+        return ann
     
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """코사인 유사도 계산"""
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+    def get_http_meta(self, url: str) -> Dict:
+        """
+        페이지의 HTTP 캐시 헤더 조회
+        
+        Returns:
+            {'etag': ..., 'last_modified': ...} (기록이 없으면 빈 dict)
+        """
+        return self.http_meta.get(url, {})
+    
+    def set_http_meta(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """
+        페이지의 HTTP 캐시 헤더 기록 (메모리만, 파일 저장은 save_http_meta())
+        
+        페이지마다 파일을 다시 쓰지 않도록 연구실 단위로 모아서 저장합니다.
+        """
+        with self._lock:
+            self.http_meta[url] = {'etag': etag, 'last_modified': last_modified}
+    
+    def save_http_meta(self):
+        """HTTP 캐시 헤더 파일 저장"""
+        with self._lock:
+            with open(self.http_meta_file, 'w', encoding='utf-8') as f:
+                json.dump(self.http_meta, f, ensure_ascii=False)
     
     def get_stats(self) -> Dict:
         """통계 정보"""
@@ -237,24 +237,31 @@ class VectorDatabase:
         limit: int = 10,
         min_quality: int = 0,
         section_filter: Optional[str] = None,
-        lang_filter: Optional[str] = None
+        lang_filter: Optional[str] = None,
+        text_limit: Optional[int] = None
     ) -> List[SearchResult]:
-        """순수 벡터 검색"""
-        query = """
+        """
+        순수 벡터 검색
+        
+        text_limit을 주면 DB에서 LEFT(text, n)으로 잘라서 가져옴 (전송량 절감)
+        """
+        text_column = "LEFT(d.text, %s) as text" if text_limit else "d.text"
+        query = f"""
         SELECT 
             d.doc_id,
             d.lab_id,
             l.kor_name as lab_name,
             d.section,
             d.title,
-            d.text,
+            {text_column},
             1 - (d.embedding <=> %s::vector) as similarity
         FROM lab_docs d
         JOIN lab l ON d.lab_id = l.lab_id
         WHERE d.quality_score >= %s
         """
         
-        params = [query_embedding.tolist(), min_quality]
+        params = [text_limit] if text_limit else []
+        params.extend([query_embedding.tolist(), min_quality])
         
         if section_filter:
             query += " AND d.section = %s"
@@ -296,16 +303,27 @@ class VectorDatabase:
         vector_weight: float = 0.7,
         keyword_weight: float = 0.3,
         min_quality: int = 0,
-        section_filter: Optional[str] = None
+        section_filter: Optional[str] = None,
+        text_limit: Optional[int] = None
     ) -> List[SearchResult]:
-        """하이브리드 검색 (벡터 + 키워드)"""
-        query = """
-        SELECT * FROM hybrid_search(
+        """
+        하이브리드 검색 (벡터 + 키워드)
+        
+        text_limit을 주면 hybrid_search 결과의 text를 LEFT(text, n)으로 잘라서 가져옴
+        """
+        text_column = "LEFT(text, %s) as text" if text_limit else "text"
+        query = f"""
+        SELECT 
+            doc_id, lab_id, lab_name, section, title,
+            {text_column},
+            hybrid_score, vector_score, keyword_score
+        FROM hybrid_search(
             %s, %s::vector, %s, %s, %s, %s
         )
         """
         
-        params = [
+        params = [text_limit] if text_limit else []
+        params += [
             query_text,
             query_embedding.tolist(),
             limit,
@@ -53,7 +53,7 @@ def test_full_pipeline():
     candidates = []
     for lab_id, lab_score_info in result.items():
         # Lab 객체 찾기
-        lab = next((l for l in generator.labs if l.id == lab_id), None)
+        lab = generator.get_lab(lab_id)
         if lab:
             candidates.append(lab)
     
@@ -0,0 +1,58 @@
+"""
+크롤링 URL 정규화 테스트
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.main_pipeline import _canonicalize_url, _dedup_path
+
+def test_canonicalize_url():
+    """URL 정규화 테스트 (중복 방문 판별 키)"""
+    # docstring 예시: fragment 제거 + 쿼리 정렬 + 호스트 소문자 + 끝 슬래시 제거
+    assert _canonicalize_url("http://Lab.ac.kr/research/?b=2&a=1#top") == "http://lab.ac.kr/research?a=1&b=2"
+    
+    # fragment만 다른 URL은 같은 페이지
+    assert _canonicalize_url("http://lab.ac.kr/a#x") == _canonicalize_url("http://lab.ac.kr/a") == "http://lab.ac.kr/a"
+    
+    # 쿼리 정렬 (빈 값 유지, 같은 키는 값 순서로)
+    assert _canonicalize_url("http://lab.ac.kr/p?b=&a=1") == "http://lab.ac.kr/p?a=1&b="
+    assert _canonicalize_url("http://lab.ac.kr/p?z=1&z=0") == "http://lab.ac.kr/p?z=0&z=1"
+    
+    # 호스트만 소문자 (경로 대소문자는 유지, 포트 유지)
+    assert _canonicalize_url("http://LAB.ac.kr/Research") == "http://lab.ac.kr/Research"
+    assert _canonicalize_url("https://Lab.ac.kr:8080/x/") == "https://lab.ac.kr:8080/x"
+    
+    # 끝 슬래시 제거, 루트는 '/'
+    assert _canonicalize_url("http://lab.ac.kr/people/") == _canonicalize_url("http://lab.ac.kr/people")
+    assert _canonicalize_url("http://lab.ac.kr") == "http://lab.ac.kr/"
+    assert _canonicalize_url("http://lab.ac.kr/") == "http://lab.ac.kr/"
+    
+    print("✅ URL 정규화 테스트 통과")
+
+def test_dedup_path():
+    """경로 중복 제거 테스트"""
+    # docstring 예시: 'view'는 반복 허용, 나머지 반복 조각은 제거
+    assert _dedup_path("/view/vcl-lab/view/vcl-lab") == "/view/vcl-lab/view"
+    
+    # 'page'도 반복 허용 (페이지 번호는 달라도 같은 조각으로 보지 않음)
+    assert _dedup_path("/page/1/page/2") == "/page/1/page/2"
+    assert _dedup_path("/view/view/page/page") == "/view/view/page/page"
+    
+    # 그 외 조각은 처음 나온 것만
+    assert _dedup_path("/a/b/a") == "/a/b"
+    
+    # 빈 조각(연속/끝 슬래시) 무시, 빈 경로는 '/'
+    assert _dedup_path("//a//b/") == "/a/b"
+    assert _dedup_path("") == "/"
+    assert _dedup_path("/") == "/"
+    
+    print("✅ 경로 중복 제거 테스트 통과")
+
+if __name__ == "__main__":
+    print("="*80)
+    print("크롤링 URL 정규화 테스트")
+    print("="*80)
+    
+    test_canonicalize_url()
+    test_dedup_path()
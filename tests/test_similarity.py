@@ -1,18 +1,68 @@
 """
-유사도 테스트 (향후 구현)
+유사도 테스트
 """
 import sys
 import os
+import io
+import math
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import numpy as np
+
 def test_similarity():
     """유사도 계산 테스트 (향후 구현)"""
     print("⚠️  유사도 모듈은 아직 구현되지 않았습니다.")
     print("향후 similarity 모듈이 추가될 예정입니다.")
 
+def test_eager_bm25():
+    """EagerBM25 점수 테스트 (작은 코퍼스로 손으로 계산한 값과 비교)"""
+    from similarity.candidate_generator import EagerBM25
+    
+    # 랩실 4개, 문서 길이 2 / 2 / 3 / 1 (평균 2)
+    corpus = [["a", "b"], ["a", "c"], ["a", "a", "d"], ["e"]]
+    
+    # b=0이면 길이 보정이 없어 가중치 = idf × tf·(k1+1)/(tf+k1) → tf=1: 1, tf=2: 10/7
+    bm25 = EagerBM25(corpus, k1=1.5, b=0.0)
+    
+    # IDF: b~e는 문서 1개 → ln(3.5/1.5) = ln(7/3)
+    #      a는 문서 3개 → ln(1.5/3.5) < 0 → epsilon × 평균 IDF = 0.25 × (4·L - L)/5 = 0.15·L
+    L = math.log(7 / 3)
+    idf_a = 0.15 * L
+    assert np.allclose(bm25.idf, [idf_a, L, L, L, L])
+    
+    # 음수 IDF 바닥값
+    assert np.allclose(bm25.get_scores(["a"]), [idf_a, idf_a, idf_a * 10 / 7, 0.0])
+    
+    # 반복된 쿼리 단어는 반복된 만큼 더함 (BM25Okapi와 동일)
+    assert np.allclose(bm25.get_scores(["b", "a", "b"]), [2 * L + idf_a, idf_a, idf_a * 10 / 7, 0.0])
+    
+    # 어휘에 없는 단어만 있으면 모두 0
+    scores = bm25.get_scores(["zzz", "yyy"])
+    assert scores.shape == (4,) and not scores.any()
+    assert not bm25.get_scores([]).any()
+    
+    # 기본 파라미터 (k1=1.5, b=0.75): 길이 1인 문서의 e
+    default = EagerBM25(corpus)
+    assert math.isclose(
+        default.get_scores(["e"])[3],
+        L * 2.5 / (1 + 1.5 * (1 - 0.75 + 0.75 * 1 / 2))
+    )
+    
+    # state() → np.savez → from_state() 후에도 같은 점수
+    buffer = io.BytesIO()
+    np.savez(buffer, **default.state('bm25_'))
+    buffer.seek(0)
+    restored = EagerBM25.from_state(np.load(buffer), 'bm25_')
+    for query in (["a"], ["b", "a", "b"], ["d", "e", "zzz"], ["zzz"]):
+        assert np.array_equal(restored.get_scores(query), default.get_scores(query))
+    assert restored.vocab == default.vocab
+    
+    print("✅ EagerBM25 테스트 통과")
+
 if __name__ == "__main__":
     print("="*80)
     print("유사도 테스트")
     print("="*80)
     
     test_similarity()
+    test_eager_bm25()